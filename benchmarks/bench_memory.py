@@ -0,0 +1,136 @@
+"""
+Benchmark the per-error memory footprint of parsed results.
+
+Compares the current slotted, interned ParsedError/StackFrame with the
+previous representation (plain dataclasses with a per-instance __dict__
+and a private copy of every string).
+
+Usage:
+    python -m benchmarks.bench_memory [--errors N] [--frames N]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from src.parsers.base import ParsedError
+from src.parsers.java import JavaLogParser
+
+# Distinct frames a service repeats across its errors
+FRAME_POOL_SIZE = 200
+
+
+@dataclass
+class LegacyStackFrame:
+    """StackFrame as it was before slots and interning."""
+
+    file_path: str
+    line_number: Optional[int] = None
+    method_name: Optional[str] = None
+    class_name: Optional[str] = None
+    code_context: Optional[str] = None
+
+
+@dataclass
+class LegacyParsedError:
+    """ParsedError as it was before slots and interning."""
+
+    error_type: str
+    message: str
+    stack_frames: list[LegacyStackFrame] = field(default_factory=list)
+    severity: str = "error"
+    raw_text: str = ""
+    language: str = "unknown"
+    timestamp: Optional[str] = None
+    thread_name: Optional[str] = None
+    logger_name: Optional[str] = None
+
+
+def build_corpus(errors: int, frames: int, seed: int = 0) -> str:
+    """Build a Java log where every trace draws from a fixed pool of frames."""
+    rng = random.Random(seed)
+    pool = [
+        f"\tat org.springframework.web.servlet.Handler{i % 40}.invoke{i}"
+        f"(Handler{i % 40}.java:{100 + i})"
+        for i in range(FRAME_POOL_SIZE)
+    ]
+
+    lines: list[str] = []
+    for n in range(errors):
+        lines.append(
+            f"2024-01-15 10:{n // 6000 % 60:02d}:{n // 100 % 60:02d},{n % 1000:03d} "
+            f"[http-nio-8080-exec-{n % 50}] ERROR com.example.web.UserController - Request failed"
+        )
+        lines.append(f"java.lang.IllegalStateException: User {n} not loaded")
+        start = rng.randrange(FRAME_POOL_SIZE - frames)
+        lines.extend(pool[start:start + frames])
+    return "\n".join(lines)
+
+
+def _copy(value: Optional[str]) -> Optional[str]:
+    """Return a private copy of a string, as a fresh regex group would be."""
+    return value.encode().decode() if value else value
+
+
+def to_legacy(error: ParsedError) -> LegacyParsedError:
+    """Rebuild an error in the previous representation."""
+    return LegacyParsedError(
+        error_type=_copy(error.error_type),
+        message=_copy(error.message),
+        stack_frames=[
+            LegacyStackFrame(
+                file_path=_copy(f.file_path),
+                line_number=f.line_number,
+                method_name=_copy(f.method_name),
+                class_name=_copy(f.class_name),
+                code_context=_copy(f.code_context),
+            )
+            for f in error.stack_frames
+        ],
+        severity=error.severity.value,
+        raw_text=_copy(error.raw_text),
+        language=error.language,
+        timestamp=_copy(error.timestamp),
+        thread_name=_copy(error.thread_name),
+        logger_name=_copy(error.logger_name),
+    )
+
+
+def retained(build: Callable[[], list]) -> tuple[list, int]:
+    """Return the built objects and the bytes they keep alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--errors", type=int, default=100_000)
+    arg_parser.add_argument("--frames", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    corpus = build_corpus(args.errors, args.frames)
+    errors, current = retained(lambda: JavaLogParser().parse(corpus))
+    legacy_errors, legacy = retained(lambda: [to_legacy(e) for e in errors])
+
+    # raw_text is stored the same way in both; report it separately
+    raw = sum(len(e.raw_text) + 49 for e in errors)
+
+    count = len(errors)
+    print(f"{count:,} errors, {args.frames} frames each, {FRAME_POOL_SIZE} distinct frames")
+    print(f"  before: {legacy / count:>8,.0f} bytes/error  ({legacy / 2**20:,.1f} MiB)")
+    print(f"  after:  {current / count:>8,.0f} bytes/error  ({current / 2**20:,.1f} MiB)")
+    print(f"  (of which raw_text: {raw / count:,.0f} bytes/error)")
+    del legacy_errors
+
+
+if __name__ == "__main__":
+    main()
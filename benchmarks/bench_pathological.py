@@ -0,0 +1,199 @@
+"""
+Benchmark the log line engines on pathological lines.
+
+Each shape is a single long line of the kind that makes the regex engine
+backtrack (padding after the timestamp, huge JSON payloads, base64 blobs,
+long dotted names), embedded in a short log. Every shape is parsed at
+growing line lengths with both engines; the growth exponent shows linear
+(about 1) or quadratic (about 2) behavior. Slow runs are cut off by a
+timeout, so the regex engine cannot stall the benchmark.
+
+Usage:
+    python -m benchmarks.bench_pathological [--sizes 1024,4096,...] [--timeout S]
+        [--engine regex|scanner] [--shape NAME ...]
+"""
+
+import argparse
+import base64
+import json
+import math
+import random
+import sys
+import time
+from multiprocessing import TimeoutError as WorkerTimeout
+from multiprocessing import get_context
+from typing import Callable, Optional
+
+from src.parsers.base import PARSER_ENGINES
+from src.parsers.java import JavaLogParser
+from src.parsers.python import PythonLogParser
+
+JAVA_CONTEXT = [
+    "2024-01-15 10:30:45,123 [main] INFO com.example.App - Started",
+    "{line}",
+    "2024-01-15 10:30:46,123 [main] ERROR com.example.App - Request failed",
+    "java.lang.IllegalStateException: User 1 not loaded",
+    "\tat com.example.Svc.load(Svc.java:10)",
+]
+
+PYTHON_CONTEXT = [
+    "2024-01-15 10:30:45,123 - INFO - app - Started",
+    "{line}",
+    "2024-01-15 10:30:46,123 - ERROR - app.worker - Job failed",
+    "Traceback (most recent call last):",
+    '  File "app/worker.py", line 28, in run',
+    "KeyError: 'user_id'",
+]
+
+# Shape name -> (language, function building a line of about n characters).
+# Every line contains an error marker, so the pre-filter lets it through.
+SHAPES: dict[str, tuple[str, Callable[[int], str]]] = {
+    "java_padded_timestamp": ("java", lambda n: "2024-01-15 10:30:45" + " " * n + "IOException"),
+    "java_padded_thread": (
+        "java",
+        lambda n: "2024-01-15 10:30:45 [main]" + " " * n + "IOException",
+    ),
+    "java_json_payload": (
+        "java",
+        lambda n: "2024-01-15 10:30:45,123 [main] ERROR com.example.Api - Error " + _json(n),
+    ),
+    "java_base64_blob": (
+        "java",
+        lambda n: "2024-01-15 10:30:45,123 [main] ERROR " + _base64(n) + " Exception",
+    ),
+    "java_dotted_name": (
+        "java",
+        lambda n: "2024-01-15 10:30:45 ERROR" + ".a" * (n // 2) + " Exception",
+    ),
+    "python_padded_timestamp": ("python", lambda n: "2024-01-15 10:30:45" + " " * n + "ValueError"),
+    "python_dash_padding": (
+        "python",
+        lambda n: "2024-01-15 10:30:45" + " -" * (n // 2) + " ValueError",
+    ),
+    "python_json_payload": (
+        "python",
+        lambda n: "2024-01-15 10:30:45,123 - ERROR - app - Error " + _json(n),
+    ),
+    "python_base64_blob": (
+        "python",
+        lambda n: "2024-01-15 10:30:45,123 - ERROR - " + _base64(n) + " Error",
+    ),
+    "python_padded_logger": (
+        "python",
+        lambda n: "2024-01-15 10:30:45 ERROR app" + " -" * (n // 2) + "Error",
+    ),
+}
+
+PARSERS = {"java": JavaLogParser, "python": PythonLogParser}
+
+
+def _json(size: int) -> str:
+    """A JSON document of about size characters."""
+    rng = random.Random(size)
+    items = [{"id": i, "value": rng.random(), "tags": ["a", "b"]} for i in range(size // 48 + 1)]
+    return json.dumps({"items": items})[:size]
+
+
+def _base64(size: int) -> str:
+    """A base64 blob of size characters."""
+    return base64.b64encode(random.Random(size).randbytes(size * 3 // 4 + 3)).decode()[:size]
+
+
+def measure(shape: str, engine: str, size: int, repeat: int) -> float:
+    """
+    Time the parse of a short log containing one pathological line (runs in a worker).
+
+    Returns:
+        Best time in seconds
+    """
+    language, build = SHAPES[shape]
+    context = JAVA_CONTEXT if language == "java" else PYTHON_CONTEXT
+    text = "\n".join(context).replace("{line}", build(size))
+    parser = PARSERS[language](engine=engine)
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser.parse(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_growth(
+    shape: str,
+    engine: str,
+    sizes: list[int],
+    timeout: float,
+    repeat: int,
+) -> list[Optional[float]]:
+    """
+    Time a shape at every size, stopping at the first run over the timeout.
+
+    Returns:
+        Seconds per size, None for sizes that timed out or were skipped
+    """
+    times: list[Optional[float]] = []
+    pool = get_context("spawn").Pool(1)
+    try:
+        for size in sizes:
+            try:
+                times.append(pool.apply_async(measure, (shape, engine, size, repeat)).get(timeout))
+            except WorkerTimeout:
+                break
+    finally:
+        # Terminating also kills a worker stuck in a backtracking regex
+        pool.terminate()
+        pool.join()
+    return times + [None] * (len(sizes) - len(times))
+
+
+def growth_exponent(sizes: list[int], times: list[Optional[float]]) -> Optional[float]:
+    """Fit time ~ size**k over the two largest measured sizes."""
+    measured = [(size, seconds) for size, seconds in zip(sizes, times) if seconds]
+    if len(measured) < 2:
+        return None
+    (size_a, time_a), (size_b, time_b) = measured[-2:]
+    return math.log(time_b / time_a) / math.log(size_b / size_a)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument(
+        "--sizes", default="1024,4096,16384,65536", help="Comma-separated line lengths"
+    )
+    arg_parser.add_argument(
+        "--timeout", type=float, default=10.0, help="Seconds before a run is cut off"
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument(
+        "--engine", action="append", choices=PARSER_ENGINES, help="Run only these engines"
+    )
+    arg_parser.add_argument(
+        "--shape", action="append", choices=sorted(SHAPES), help="Run only these shapes"
+    )
+    args = arg_parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    header = "".join(f"{size:>11,}" for size in sizes)
+    print(f"{'shape':<24} {'engine':<8}{header}   growth")
+
+    failed = False
+    for shape in args.shape or SHAPES:
+        for engine in args.engine or PARSER_ENGINES:
+            times = measure_growth(shape, engine, sizes, args.timeout, args.repeat)
+            exponent = growth_exponent(sizes, times)
+            cells = "".join(
+                f"{seconds * 1000:>9.2f}ms" if seconds is not None else f"{'timeout':>11}"
+                for seconds in times
+            )
+            growth = exponent if exponent is not None else float("nan")
+            print(f"{shape:<24} {engine:<8}{cells}   {growth:.2f}")
+            # The scanner must stay linear; the regex is reported for comparison
+            if engine == "scanner" and (None in times or (exponent is not None and exponent > 1.5)):
+                failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark the literal pre-filter on an INFO-heavy corpus.
+
+Usage:
+    python -m benchmarks.bench_prefilter [--lines N] [--error-every N]
+"""
+
+import argparse
+import time
+
+from src.parsers.base import BaseLogParser
+from src.parsers.java import JavaLogParser
+from src.parsers.prefilter import LinePrefilter
+from src.parsers.python import PythonLogParser
+
+JAVA_INFO = (
+    "2024-01-15 10:30:45,123 [http-nio-8080-exec-{n}] INFO "
+    "com.example.web.RequestLogger - GET /api/users/{n} 200 12ms"
+)
+JAVA_ERROR = [
+    "2024-01-15 10:30:45,123 [http-nio-8080-exec-{n}] ERROR com.example.web.UserController - "
+    "Request failed",
+    "java.lang.IllegalStateException: User {n} not loaded",
+    "\tat com.example.service.UserService.getUser(UserService.java:42)",
+    "\tat com.example.web.UserController.show(UserController.java:28)",
+]
+
+PYTHON_INFO = "2024-01-15 10:30:45,123 - INFO - app.requests - GET /api/users/{n} 200 12ms"
+PYTHON_ERROR = [
+    "2024-01-15 10:30:45,123 - ERROR - app.worker - Job {n} failed",
+    "Traceback (most recent call last):",
+    '  File "app/worker.py", line 28, in run',
+    "    return data['user_id']",
+    "KeyError: 'user_id'",
+]
+
+
+def build_corpus(info: str, error: list[str], lines: int, error_every: int) -> list[str]:
+    """Build a corpus with one error block per error_every INFO lines."""
+    corpus: list[str] = []
+    n = 0
+    while len(corpus) < lines:
+        n += 1
+        if n % error_every == 0:
+            corpus.extend(line.format(n=n) for line in error)
+        else:
+            corpus.append(info.format(n=n))
+    return corpus
+
+
+def measure(parser: BaseLogParser, corpus: list[str], repeat: int = 3) -> tuple[float, int]:
+    """Return the best lines/sec over several runs and the error count."""
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in parser.iter_parse(corpus))
+        best = min(best, time.perf_counter() - start)
+    return len(corpus) / best, count
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--lines", type=int, default=200_000)
+    arg_parser.add_argument("--error-every", type=int, default=1000)
+    args = arg_parser.parse_args()
+
+    cases = [
+        ("java", JavaLogParser, JAVA_INFO, JAVA_ERROR),
+        ("python", PythonLogParser, PYTHON_INFO, PYTHON_ERROR),
+    ]
+    for name, parser_class, info, error in cases:
+        corpus = build_corpus(info, error, args.lines, args.error_every)
+        off, off_count = measure(parser_class(prefilter=LinePrefilter(())), corpus)
+        on, on_count = measure(parser_class(), corpus)
+        assert on_count == off_count
+
+        print(
+            f"{name:<7} {len(corpus):>9,} lines  {on_count:>6,} errors  "
+            f"without pre-filter {off:>12,.0f} lines/s  "
+            f"with pre-filter {on:>12,.0f} lines/s  ({on / off:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
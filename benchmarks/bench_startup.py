@@ -0,0 +1,80 @@
+"""
+Benchmark the startup time of the CLI.
+
+Every command runs in a fresh interpreter, as it does when log-detective
+is called from shell hooks and CI jobs. The best of several runs is
+reported next to the cost of starting Python and of importing click, which
+every command pays and which varies several-fold between machines. The
+budget therefore applies to what parse --help takes beyond importing
+click; the command exits with status 1 if it is over budget.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N] [--budget MS]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+# Milliseconds parse --help may take beyond `python -c "import click"`
+DEFAULT_BUDGET_MS = 50.0
+
+BASELINES = {
+    "python": ["-c", "pass"],
+    "import click": ["-c", "import click"],
+}
+
+COMMANDS = [
+    ["--help"],
+    ["parse", "--help"],
+    ["watch", "--help"],
+    ["parse", "--text", "2024-01-15 10:30:45 ERROR x - y\njava.lang.IllegalStateException: z",
+     "-o", "json"],
+]
+
+
+def measure(args: list[str], runs: int) -> float:
+    """
+    Run a Python command line repeatedly.
+
+    Returns:
+        Best wall time in seconds
+    """
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], stdout=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--runs", type=int, default=20)
+    arg_parser.add_argument(
+        "--budget", type=float, default=DEFAULT_BUDGET_MS,
+        help="Milliseconds parse --help may take beyond importing click"
+    )
+    args = arg_parser.parse_args()
+
+    baselines = {name: measure(baseline, args.runs) for name, baseline in BASELINES.items()}
+    for name, seconds in baselines.items():
+        print(f"{name:<40} {seconds * 1000:>8.1f}ms")
+
+    failed = False
+    for command in COMMANDS:
+        seconds = measure(["-m", "src.cli", *command], args.runs)
+        label = "log-detective " + " ".join(arg.splitlines()[0] for arg in command)
+        overhead = seconds - baselines["import click"]
+        print(f"{label[:40]:<40} {seconds * 1000:>8.1f}ms  (+{overhead * 1000:.1f}ms over click)")
+        if command == ["parse", "--help"] and overhead * 1000 > args.budget:
+            failed = True
+
+    if failed:
+        print(f"parse --help is over the budget of {args.budget:.0f}ms beyond importing click")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
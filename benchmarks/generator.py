@@ -0,0 +1,279 @@
+"""
+Deterministic generator of realistic production logs for benchmarks.
+
+Java logs use the log4j/logback layout with deep Spring/Tomcat traces,
+CGLIB proxies, lambdas, ``Caused by:`` chains and ``... N more`` lines.
+Python logs use the logging module layout with tracebacks, code context
+lines and chained exceptions. The same seed always yields the same log.
+
+Usage:
+    python -m benchmarks.generator {java,python} [--size MB] [--error-density F]
+        [--seed N] > app.log
+"""
+
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Iterator
+
+# Start of the generated timeline
+START_TIME = datetime(2024, 1, 15, 8, 0, 0)
+
+# Share of log events that are errors with a stack trace
+DEFAULT_ERROR_DENSITY = 0.02
+
+JAVA_LOGGERS = [
+    "com.example.web.OrderController",
+    "com.example.service.OrderService",
+    "com.example.repository.OrderRepository",
+    "org.springframework.web.servlet.DispatcherServlet",
+    "org.hibernate.SQL",
+    "com.zaxxer.hikari.pool.HikariPool",
+]
+
+JAVA_MESSAGES = [
+    "GET /api/orders/{n} 200 {ms}ms",
+    "POST /api/orders 201 {ms}ms",
+    "Completed initialization in {ms} ms",
+    "select o.id, o.status from orders o where o.customer_id=?",
+    "HikariPool-1 - Pool stats (total=10, active={ms}, idle=4, waiting=0)",
+    "Cache hit ratio 0.{ms}",
+]
+
+JAVA_EXCEPTIONS = [
+    ("java.lang.IllegalStateException", "Order {n} is not in a payable state"),
+    (
+        "java.lang.NullPointerException",
+        'Cannot invoke "com.example.domain.Customer.getId()" because "customer" is null',
+    ),
+    (
+        "org.springframework.dao.DataIntegrityViolationException",
+        "could not execute statement; constraint [uk_order_ref]",
+    ),
+    ("java.util.concurrent.TimeoutException", "Payment gateway did not respond within 3000 ms"),
+    ("com.example.service.PaymentDeclinedException", "Card declined for order {n}"),
+]
+
+JAVA_CAUSES = [
+    ("org.hibernate.exception.ConstraintViolationException", "could not execute statement"),
+    (
+        "java.sql.SQLIntegrityConstraintViolationException",
+        "Duplicate entry '{n}' for key 'uk_order_ref'",
+    ),
+    ("java.net.SocketTimeoutException", "Read timed out"),
+    ("java.io.IOException", "Connection reset by peer"),
+]
+
+# Application frames at the top of a trace
+JAVA_APP_FRAMES = [
+    "com.example.service.OrderService.pay(OrderService.java:{line})",
+    "com.example.service.OrderService$$EnhancerBySpringCGLIB$$8f3a2b1c.pay(<generated>)",
+    "com.example.service.PaymentClient.charge(PaymentClient.java:{line})",
+    "com.example.service.OrderService.lambda$processAll$3(OrderService.java:{line})",
+    "com.example.repository.OrderRepository.save(OrderRepository.java:{line})",
+    "com.example.web.OrderController.pay(OrderController.java:{line})",
+]
+
+# Framework frames below the application code
+JAVA_FRAMEWORK_FRAMES = [
+    "org.springframework.aop.framework.CglibAopProxy$DynamicAdvisedInterceptor.intercept(CglibAopProxy.java:708)",
+    "org.springframework.transaction.interceptor.TransactionInterceptor.invoke(TransactionInterceptor.java:119)",
+    "org.springframework.aop.framework.ReflectiveMethodInvocation.proceed(ReflectiveMethodInvocation.java:186)",
+    "java.base/jdk.internal.reflect.NativeMethodAccessorImpl.invoke0(Native Method)",
+    "java.base/java.lang.reflect.Method.invoke(Method.java:568)",
+    "org.springframework.web.method.support.InvocableHandlerMethod.doInvoke(InvocableHandlerMethod.java:205)",
+    "org.springframework.web.servlet.mvc.method.annotation.ServletInvocableHandlerMethod.invokeAndHandle(ServletInvocableHandlerMethod.java:117)",
+    "org.springframework.web.servlet.DispatcherServlet.doDispatch(DispatcherServlet.java:1067)",
+    "org.springframework.web.servlet.FrameworkServlet.service(FrameworkServlet.java:883)",
+    "jakarta.servlet.http.HttpServlet.service(HttpServlet.java:658)",
+    "org.apache.catalina.core.ApplicationFilterChain.internalDoFilter(ApplicationFilterChain.java:205)",
+    "org.apache.catalina.core.ApplicationFilterChain.doFilter(ApplicationFilterChain.java:149)",
+    "org.springframework.web.filter.OncePerRequestFilter.doFilter(OncePerRequestFilter.java:116)",
+    "org.apache.catalina.core.StandardWrapperValve.invoke(StandardWrapperValve.java:166)",
+    "org.apache.catalina.core.StandardContextValve.invoke(StandardContextValve.java:90)",
+    "org.apache.catalina.connector.CoyoteAdapter.service(CoyoteAdapter.java:341)",
+    "org.apache.coyote.http11.Http11Processor.service(Http11Processor.java:390)",
+    "org.apache.tomcat.util.net.NioEndpoint$SocketProcessor.doRun(NioEndpoint.java:1744)",
+    "java.base/java.util.concurrent.ThreadPoolExecutor.runWorker(ThreadPoolExecutor.java:1136)",
+    "java.base/java.lang.Thread.run(Thread.java:833)",
+]
+
+JAVA_CAUSE_FRAMES = [
+    "org.hibernate.engine.jdbc.spi.SqlExceptionHelper.convert(SqlExceptionHelper.java:112)",
+    "org.hibernate.engine.jdbc.internal.ResultSetReturnImpl.executeUpdate(ResultSetReturnImpl.java:197)",
+    "com.mysql.cj.jdbc.ClientPreparedStatement.executeUpdate(ClientPreparedStatement.java:1061)",
+    "java.base/java.net.SocketInputStream.read(SocketInputStream.java:168)",
+    "com.zaxxer.hikari.pool.ProxyPreparedStatement.executeUpdate(ProxyPreparedStatement.java:61)",
+]
+
+PYTHON_LOGGERS = ["app.api", "app.worker", "app.db", "celery.worker", "uvicorn.access"]
+
+PYTHON_MESSAGES = [
+    "GET /api/orders/{n} HTTP/1.1 200 OK ({ms}ms)",
+    "Task app.tasks.sync_order[{n}] succeeded in 0.{ms}s",
+    "Connection pool size=10 checked_out={ms}",
+    "Processed batch {n} with {ms} items",
+]
+
+PYTHON_EXCEPTIONS = [
+    ("KeyError", "'customer_id'"),
+    ("ValueError", "invalid literal for int() with base 10: 'abc{n}'"),
+    ("TypeError", "unsupported operand type(s) for +: 'int' and 'NoneType'"),
+    (
+        "sqlalchemy.exc.IntegrityError",
+        "(psycopg2.errors.UniqueViolation) duplicate key value violates unique constraint",
+    ),
+    (
+        "requests.exceptions.ConnectionError",
+        "HTTPSConnectionPool(host='payments.example.com', port=443): Max retries exceeded",
+    ),
+]
+
+PYTHON_FRAMES = [
+    ('/app/app/api/orders.py', 'pay', 'result = service.pay(order_id, payload)'),
+    ('/app/app/services/orders.py', 'pay', 'customer = self.customers[payload["customer_id"]]'),
+    (
+        '/app/app/services/payments.py',
+        'charge',
+        'response = self.session.post(url, json=body, timeout=3)',
+    ),
+    ('/app/app/tasks.py', 'sync_order', 'amount = int(row["amount"]) + fee'),
+    (
+        '/usr/lib/python3.11/site-packages/sqlalchemy/engine/base.py',
+        '_execute_context',
+        'self.dialect.do_execute(',
+    ),
+    (
+        '/usr/lib/python3.11/site-packages/celery/app/trace.py',
+        'trace_task',
+        'R = retval = fun(*args, **kwargs)',
+    ),
+    (
+        '/usr/lib/python3.11/site-packages/fastapi/routing.py',
+        'run_endpoint_function',
+        'return await dependant.call(**values)',
+    ),
+]
+
+PYTHON_CHAIN_SEPARATORS = [
+    "The above exception was the direct cause of the following exception:",
+    "During handling of the above exception, another exception occurred:",
+]
+
+
+def generate(
+    language: str,
+    size: int,
+    error_density: float = DEFAULT_ERROR_DENSITY,
+    seed: int = 0,
+) -> Iterator[str]:
+    """
+    Generate log lines until about size bytes have been produced.
+
+    Args:
+        language: "java" or "python"
+        size: Approximate size of the log in bytes
+        error_density: Share of log events that are errors with a trace
+        seed: Random seed; the same arguments always give the same log
+
+    Yields:
+        Log lines ending with a newline
+    """
+    rng = random.Random(seed)
+    event = _java_event if language == "java" else _python_event
+    produced = 0
+    n = 0
+    while produced < size:
+        n += 1
+        timestamp = START_TIME + timedelta(milliseconds=n * 37)
+        for line in event(rng, n, timestamp, rng.random() < error_density):
+            produced += len(line) + 1
+            yield line + "\n"
+
+
+def generate_text(
+    language: str,
+    size: int,
+    error_density: float = DEFAULT_ERROR_DENSITY,
+    seed: int = 0,
+) -> str:
+    """Generate a whole log as one string (see generate())."""
+    return "".join(generate(language, size, error_density, seed))
+
+
+def _java_event(rng: random.Random, n: int, timestamp: datetime, is_error: bool) -> list[str]:
+    """Build one Java log event: a log line, or an ERROR line with a trace."""
+    stamp = timestamp.strftime("%Y-%m-%d %H:%M:%S,") + f"{timestamp.microsecond // 1000:03d}"
+    thread = f"http-nio-8080-exec-{n % 32 + 1}"
+    ms = rng.randint(1, 999)
+
+    if not is_error:
+        level = rng.choices(["INFO", "DEBUG", "WARN"], [80, 15, 5])[0]
+        message = rng.choice(JAVA_MESSAGES).format(n=n, ms=ms)
+        return [f"{stamp} [{thread}] {level} {rng.choice(JAVA_LOGGERS)} - {message}"]
+
+    error_type, message = rng.choice(JAVA_EXCEPTIONS)
+    lines = [
+        f"{stamp} [{thread}] ERROR com.example.web.OrderController - Request failed for order {n}",
+        f"{error_type}: {message.format(n=n)}",
+    ]
+    frames = [
+        frame.format(line=rng.randint(20, 400))
+        for frame in rng.sample(JAVA_APP_FRAMES, rng.randint(2, len(JAVA_APP_FRAMES)))
+    ]
+    # Deep traces repeat the framework section, as nested filters and proxies do
+    depth = rng.randint(1, 3)
+    frames += JAVA_FRAMEWORK_FRAMES * depth
+    lines += [f"\tat {frame}" for frame in frames]
+
+    enclosing = frames
+    for _ in range(rng.choice([0, 1, 1, 2])):
+        cause_type, cause_message = rng.choice(JAVA_CAUSES)
+        own = rng.sample(JAVA_CAUSE_FRAMES, rng.randint(1, 3))
+        shared = rng.randint(5, len(enclosing) - 1)
+        lines.append(f"Caused by: {cause_type}: {cause_message.format(n=n)}")
+        lines += [f"\tat {frame}" for frame in own + enclosing[-shared:][:3]]
+        lines.append(f"\t... {shared - 3} more")
+        enclosing = own + enclosing[-shared:]
+    return lines
+
+
+def _python_event(rng: random.Random, n: int, timestamp: datetime, is_error: bool) -> list[str]:
+    """Build one Python log event: a log line, or an ERROR line with a traceback."""
+    stamp = timestamp.strftime("%Y-%m-%d %H:%M:%S,") + f"{timestamp.microsecond // 1000:03d}"
+    ms = rng.randint(1, 999)
+
+    if not is_error:
+        level = rng.choices(["INFO", "DEBUG", "WARNING"], [80, 15, 5])[0]
+        message = rng.choice(PYTHON_MESSAGES).format(n=n, ms=ms)
+        return [f"{stamp} - {level} - {rng.choice(PYTHON_LOGGERS)} - {message}"]
+
+    lines = [f"{stamp} - ERROR - {rng.choice(PYTHON_LOGGERS)} - Job {n} failed"]
+    for link in range(rng.choice([1, 1, 2, 3])):
+        if link:
+            lines += ["", rng.choice(PYTHON_CHAIN_SEPARATORS), ""]
+        lines.append("Traceback (most recent call last):")
+        for path, function, code in rng.sample(PYTHON_FRAMES, rng.randint(2, len(PYTHON_FRAMES))):
+            lines.append(f'  File "{path}", line {rng.randint(10, 900)}, in {function}')
+            lines.append(f"    {code}")
+        error_type, message = rng.choice(PYTHON_EXCEPTIONS)
+        lines.append(f"{error_type}: {message.format(n=n)}")
+    return lines
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("language", choices=["java", "python"])
+    arg_parser.add_argument("--size", type=float, default=10.0, help="Size in MB")
+    arg_parser.add_argument("--error-density", type=float, default=DEFAULT_ERROR_DENSITY)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    sys.stdout.writelines(
+        generate(args.language, int(args.size * 2**20), args.error_density, args.seed)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Benchmark suite for the parsers and language detection, with regression checks.
+
+Every case runs in a fresh process on a generated log (see
+benchmarks.generator) and reports throughput (lines/s, MB/s), peak RSS
+and allocations. Results are saved as JSON; pass an earlier result file
+with --compare to fail on regressions.
+
+Usage:
+    python -m benchmarks.suite [--size MB] [--error-density F] [--seed N]
+        [--repeat N] [--output results.json] [--compare baseline.json]
+        [--tolerance 0.1] [--case NAME ...]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable, Optional
+
+from benchmarks.generator import DEFAULT_ERROR_DENSITY, generate_text
+from src.parsers.detector import auto_parse, detect_language
+from src.parsers.java import JavaLogParser
+from src.parsers.python import PythonLogParser
+
+# Version of the result file format
+RESULTS_VERSION = 1
+
+# Roadmap targets: 1000 lines parsed in under a second, under 50MB of memory
+TARGET_LINES_PER_SEC = 1000
+TARGET_PEAK_RSS_MB = 50
+
+# Case name -> (language of the generated log, function under test)
+CASES: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "java_parser": ("java", lambda text: JavaLogParser().parse(text)),
+    "python_parser": ("python", lambda text: PythonLogParser().parse(text)),
+    "java_parser_scanner": ("java", lambda text: JavaLogParser(engine="scanner").parse(text)),
+    "python_parser_scanner": ("python", lambda text: PythonLogParser(engine="scanner").parse(text)),
+    "detect_language_java": ("java", detect_language),
+    "detect_language_python": ("python", detect_language),
+    "auto_parse_java": ("java", auto_parse),
+    "auto_parse_python": ("python", auto_parse),
+}
+
+# Metrics where a larger value is a regression; for the others, smaller is
+METRICS_LOWER_IS_BETTER = {"peak_rss_mb", "rss_growth_mb", "alloc_peak_mb", "alloc_blocks"}
+METRICS_HIGHER_IS_BETTER = {"lines_per_sec", "mb_per_sec"}
+
+
+def _max_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name: str, size: int, error_density: float, seed: int, repeat: int) -> dict[str, Any]:
+    """
+    Measure one case (runs in a fresh worker process).
+
+    Args:
+        name: Key of CASES
+        size: Size of the generated log in bytes
+        error_density: Share of log events that are errors
+        seed: Generator seed
+        repeat: Timed runs; the best one is reported
+
+    Returns:
+        Metrics of the case
+    """
+    language, function = CASES[name]
+    text = generate_text(language, size, error_density, seed)
+    lines = text.count("\n")
+    megabytes = len(text.encode("utf-8")) / 2**20
+
+    gc.collect()
+    rss_before = _max_rss_mb()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(text)
+        best = min(best, time.perf_counter() - start)
+        del result
+    peak_rss = _max_rss_mb()
+
+    # A separate run, since tracing slows everything down
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = function(text)
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    alloc_blocks = sys.getallocatedblocks() - blocks_before
+
+    return {
+        "lines": lines,
+        "megabytes": round(megabytes, 3),
+        "seconds": round(best, 6),
+        "lines_per_sec": round(lines / best),
+        "mb_per_sec": round(megabytes / best, 3),
+        "peak_rss_mb": round(peak_rss, 1),
+        "rss_growth_mb": round(max(peak_rss - rss_before, 0.0), 1),
+        "alloc_peak_mb": round(alloc_peak / 2**20, 3),
+        "alloc_blocks": alloc_blocks,
+        "errors": _count_errors(result),
+    }
+
+
+def _count_errors(result: Any) -> Optional[int]:
+    """Count the errors in a case result (None for detection cases)."""
+    if isinstance(result, tuple):
+        # auto_parse() returns (language, errors)
+        result = result[1]
+    return len(result) if isinstance(result, list) else None
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """
+    Compare results with a baseline run.
+
+    Args:
+        results: Current results
+        baseline: Earlier results with the same structure
+        tolerance: Allowed relative change before a metric counts as a regression
+
+    Returns:
+        Descriptions of the regressions found
+    """
+    regressions = []
+    for name, metrics in results["cases"].items():
+        old = baseline.get("cases", {}).get(name)
+        if old is None:
+            continue
+        for metric, value in metrics.items():
+            before = old.get(metric)
+            if not before or value is None:
+                continue
+            change = (value - before) / before
+            if metric in METRICS_HIGHER_IS_BETTER and change < -tolerance:
+                regressions.append(f"{name}.{metric}: {before:,} -> {value:,} ({change:+.1%})")
+            elif metric in METRICS_LOWER_IS_BETTER and change > tolerance:
+                regressions.append(f"{name}.{metric}: {before:,} -> {value:,} ({change:+.1%})")
+    return regressions
+
+
+def check_targets(results: dict[str, Any]) -> list[str]:
+    """Return the roadmap targets each case misses."""
+    missed = []
+    for name, metrics in results["cases"].items():
+        if metrics["lines_per_sec"] < TARGET_LINES_PER_SEC:
+            missed.append(
+                f"{name}: {metrics['lines_per_sec']:,} lines/s < {TARGET_LINES_PER_SEC:,}"
+            )
+        if metrics["rss_growth_mb"] > TARGET_PEAK_RSS_MB:
+            missed.append(f"{name}: {metrics['rss_growth_mb']} MB > {TARGET_PEAK_RSS_MB} MB")
+    return missed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--size", type=float, default=10.0, help="Generated log size in MB")
+    arg_parser.add_argument("--error-density", type=float, default=DEFAULT_ERROR_DENSITY)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--output", help="Write the results to this JSON file")
+    arg_parser.add_argument("--compare", help="Baseline JSON file to check for regressions")
+    arg_parser.add_argument("--tolerance", type=float, default=0.1)
+    arg_parser.add_argument(
+        "--case", action="append", choices=sorted(CASES), help="Run only these cases"
+    )
+    args = arg_parser.parse_args()
+
+    size = int(args.size * 2**20)
+    results: dict[str, Any] = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "size_mb": args.size,
+            "error_density": args.error_density,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "cases": {},
+    }
+
+    print(
+        f"{'case':<24} {'lines/s':>12} {'MB/s':>8} {'peak RSS':>9} {'RSS +':>7} "
+        f"{'alloc peak':>11} {'errors':>7}"
+    )
+    for name in args.case or CASES:
+        # A fresh process per case keeps peak RSS and allocations separate
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            metrics = executor.submit(
+                run_case, name, size, args.error_density, args.seed, args.repeat
+            ).result()
+        results["cases"][name] = metrics
+        errors = metrics['errors'] if metrics['errors'] is not None else '-'
+        print(
+            f"{name:<24} {metrics['lines_per_sec']:>12,} {metrics['mb_per_sec']:>8.2f} "
+            f"{metrics['peak_rss_mb']:>7.1f}MB {metrics['rss_growth_mb']:>5.1f}MB "
+            f"{metrics['alloc_peak_mb']:>9.2f}MB {errors:>7}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, indent=2)
+
+    failed = False
+    for missed in check_targets(results):
+        print(f"target missed: {missed}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+        if baseline.get("meta", {}).get("size_mb") != args.size:
+            print("warning: baseline was run with a different --size")
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"regression: {regression}")
+        failed = bool(regressions)
+        if not failed:
+            print(f"no regressions against {args.compare} (tolerance {args.tolerance:.0%})")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
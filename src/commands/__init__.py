@@ -0,0 +1,10 @@
+"""
+Subcommands of the log-detective CLI, one module per command.
+
+Command modules are imported only when their command is used (see
+src.cli.COMMANDS). At module level they import click and the constants
+their options need; everything else is imported inside the command
+functions, so --help and other commands never load it. Output shared by
+the commands is in output (terminal, with Rich) and records
+(machine-readable, without it).
+"""
@@ -0,0 +1,15 @@
+"""The analyze command: analyze error logs using AI."""
+
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option("--file", "-f", type=click.Path(exists=True), help="Log file to analyze")
+@click.option("--text", "-t", type=str, help="Error text to analyze")
+def analyze(file: Optional[str], text: Optional[str]) -> None:
+    """Analyze error logs using AI."""
+    from src.commands.output import console
+
+    console.print("[yellow]AI analysis not yet implemented (Week 6-7)[/yellow]")
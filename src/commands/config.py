@@ -0,0 +1,27 @@
+"""The config command group: manage configuration."""
+
+import click
+
+
+@click.group()
+def config() -> None:
+    """Manage configuration."""
+    pass
+
+
+@config.command("init")
+def config_init() -> None:
+    """Initialize configuration file."""
+    from src.commands.output import console
+
+    console.print("[yellow]Configuration init not yet implemented[/yellow]")
+
+
+@config.command("set")
+@click.argument("key")
+@click.argument("value")
+def config_set(key: str, value: str) -> None:
+    """Set a configuration value."""
+    from src.commands.output import console
+
+    console.print(f"[yellow]Setting {key}={value} not yet implemented[/yellow]")
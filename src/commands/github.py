@@ -0,0 +1,26 @@
+"""The github command group: GitHub repository operations."""
+
+import click
+
+
+@click.group()
+def github() -> None:
+    """GitHub repository operations."""
+    pass
+
+
+@github.command("sync")
+@click.option("--repo", "-r", type=str, required=True, help="GitHub repository URL")
+def github_sync(repo: str) -> None:
+    """Sync and index a GitHub repository."""
+    from src.commands.output import console
+
+    console.print(f"[yellow]GitHub sync for {repo} not yet implemented (Week 4)[/yellow]")
+
+
+@github.command("status")
+def github_status() -> None:
+    """Show GitHub sync status."""
+    from src.commands.output import console
+
+    console.print("[yellow]GitHub status not yet implemented (Week 4)[/yellow]")
@@ -0,0 +1,28 @@
+"""The history command group: manage the error history database."""
+
+import click
+
+
+@click.group()
+def history() -> None:
+    """Manage error history database."""
+    pass
+
+
+@history.command("search")
+@click.option("--error", "-e", type=str, required=True, help="Error to search for")
+def history_search(error: str) -> None:
+    """Search for similar errors in history."""
+    from src.commands.output import console
+
+    console.print(f"[yellow]History search for '{error}' not yet implemented (Week 6)[/yellow]")
+
+
+@history.command("add")
+@click.option("--error", "-e", type=str, required=True, help="Error description")
+@click.option("--solution", "-s", type=str, required=True, help="Solution description")
+def history_add(error: str, solution: str) -> None:
+    """Add an error-solution pair to history."""
+    from src.commands.output import console
+
+    console.print("[yellow]History add not yet implemented (Week 6)[/yellow]")
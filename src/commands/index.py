@@ -0,0 +1,14 @@
+"""The index command: index source code for analysis."""
+
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option("--repo", "-r", type=str, help="Repository path or URL")
+def index(repo: Optional[str]) -> None:
+    """Index source code for analysis."""
+    from src.commands.output import console
+
+    console.print("[yellow]Indexing not yet implemented (Week 2-3)[/yellow]")
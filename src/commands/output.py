@@ -0,0 +1,369 @@
+"""Terminal output of the CLI commands, rendered with Rich."""
+
+import json
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import click
+from rich.console import Console
+from rich.markup import escape
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from src.commands.records import output_ndjson
+from src.parsers.base import ParsedError
+from src.parsers.detector import LanguageType
+from src.parsers.fingerprint import ErrorGrouper
+from src.parsers.stats import ParseStats
+from src.parsers.summary import ErrorSummary, Page
+
+console = Console()
+# Diagnostics go to stderr so they never mix with JSON output
+err_console = Console(stderr=True)
+
+# Error types listed in the summary above pretty and table output
+SUMMARY_TOP_TYPES = 10
+
+# Lines or table rows rendered per console write. Rich lays out every
+# renderable in full before writing it, so large outputs are written in
+# chunks that appear while the rest is still being rendered.
+RENDER_CHUNK_SIZE = 256
+
+SEVERITY_COLORS = {
+    "critical": "red bold",
+    "error": "red",
+    "warning": "yellow",
+    "info": "blue"
+}
+
+
+def print_stats(stats: ParseStats) -> None:
+    """Print the per-stage breakdown of a parse run to stderr."""
+    elapsed = stats.elapsed
+    lines = stats.counters.get("lines")
+    errors = stats.counters.get("errors", 0)
+
+    table = Table(title="Parse statistics", title_justify="left")
+    table.add_column("Stage / pattern")
+    table.add_column("Seconds", justify="right")
+    table.add_column("%", justify="right")
+    table.add_column("Calls", justify="right")
+    table.add_column("Matches", justify="right")
+
+    # Segmentation is what parsing costs beyond assembling the blocks
+    seconds = dict(stats.seconds)
+    if "parse" in seconds and "assembly" in seconds:
+        seconds["read & segment"] = seconds["parse"] - seconds["assembly"]
+    for name, spent in sorted(seconds.items(), key=lambda item: item[1], reverse=True):
+        calls = stats.calls.get(name)
+        matches = stats.matches.get(name)
+        table.add_row(
+            name,
+            f"{spent:.4f}",
+            f"{100 * spent / elapsed:.1f}",
+            f"{calls:,}" if calls else "-",
+            f"{matches:,}" if matches is not None else "-",
+        )
+
+    err_console.print(table)
+    # Rates are over the parse stage (or the whole run if it never started)
+    parse_seconds = stats.seconds.get("parse") or elapsed
+    summary = f"{elapsed:.3f}s total, {errors:,} errors ({errors / parse_seconds:,.0f}/s)"
+    if lines is not None:
+        summary += f", {lines:,} lines ({lines / parse_seconds:,.0f}/s)"
+    blocks = stats.counters.get("blocks")
+    if blocks is not None:
+        summary += f", {blocks:,} candidate blocks"
+    err_console.print(summary)
+
+
+def print_summary(summary: ErrorSummary, language: LanguageType) -> None:
+    """Print error counts per severity and type, and the range of the page."""
+    console.print(f"\n[bold]Found {summary.total:,} error(s)[/bold] (language: {language.value})")
+    console.print(Text("  ").join(
+        Text(f"{severity}: {count:,}", style=SEVERITY_COLORS.get(severity, "white"))
+        for severity, count in summary.by_severity.most_common()
+    ))
+
+    types = Table(box=None, show_header=False, padding=(0, 1))
+    types.add_column(justify="right", style="bold")
+    types.add_column(style="red", no_wrap=True, overflow="ellipsis")
+    for error_type, count in summary.by_type.most_common(SUMMARY_TOP_TYPES):
+        types.add_row(f"{count:,}", error_type)
+    if len(summary.by_type) > SUMMARY_TOP_TYPES:
+        more = len(summary.by_type) - SUMMARY_TOP_TYPES
+        types.add_row("", f"[dim]... and {more} more type(s)[/dim]")
+    console.print(types)
+
+    if summary.offset >= summary.total:
+        console.print(f"[dim]No errors after offset {summary.offset:,}[/dim]")
+    elif summary.offset or summary.remaining:
+        last = summary.offset + len(summary)
+        console.print(f"[dim]Showing errors {summary.start:,}-{last:,} of {summary.total:,}[/dim]")
+    console.print()
+
+
+def print_remaining(page: Page, noun: str = "error") -> None:
+    """Point at the next page if items were left out."""
+    if page.remaining:
+        console.print(
+            f"[dim]{page.remaining:,} more {noun}(s); "
+            f"use --offset {page.offset + len(page)} to see them[/dim]"
+        )
+
+
+def print_lines(lines: Iterable[Text]) -> None:
+    """Print one-line renderables a chunk at a time, cut to the terminal width."""
+    lines = iter(lines)
+    while chunk := list(islice(lines, RENDER_CHUNK_SIZE)):
+        console.print(Text("\n").join(chunk), no_wrap=True, overflow="ellipsis")
+
+
+def _cell(value: str, width: int, style: str, justify: str = "left") -> Text:
+    """A table cell cut or padded to exactly width terminal cells."""
+    text = Text(value, style=style, end="")
+    text.truncate(width, overflow="ellipsis")
+    if justify == "right":
+        text.pad_left(width - text.cell_len)
+    else:
+        text.pad_right(width - text.cell_len)
+    return text
+
+
+def output_table(summary: ErrorSummary, language: LanguageType) -> None:
+    """
+    Output errors as a table, rendered a chunk of rows at a time.
+
+    Columns have fixed widths, so every row is laid out on its own instead
+    of Rich measuring all rows before printing the first.
+    """
+    print_summary(summary, language)
+    if not summary:
+        return
+
+    number_width = len(str(summary.offset + len(summary)))
+    flexible = max(console.width - number_width - 6 - 4 * 2, 30)
+    type_width = flexible * 4 // 10
+    file_width = flexible * 2 // 10
+    columns = [
+        ("#", number_width, "dim", "right"),
+        ("Type", type_width, "red", "left"),
+        ("Message", flexible - type_width - file_width, "yellow", "left"),
+        ("File", file_width, "cyan", "left"),
+        ("Line", 6, "green", "right"),
+    ]
+
+    console.print(f"[italic]Parsed Errors ({language.value})[/italic]")
+    console.print(Text("  ").join(
+        _cell(header, width, "bold", justify) for header, width, _, justify in columns
+    ))
+    console.print(Text("─" * (sum(width for _, width, _, _ in columns) + 2 * (len(columns) - 1))))
+
+    def rows() -> Iterator[Text]:
+        for i, error in enumerate(summary, summary.start):
+            values = (
+                str(i),
+                error.error_type,
+                error.message,
+                error.file_path or "-",
+                str(error.line_number) if error.line_number else "-"
+            )
+            yield Text("  ").join(
+                _cell(value, width, style, justify)
+                for value, (_, width, style, justify) in zip(values, columns)
+            )
+
+    print_lines(rows())
+    print_remaining(summary)
+
+
+def output_pretty(summary: ErrorSummary, language: LanguageType, detail: int) -> None:
+    """Output the first errors of the page in full and the rest as one line each."""
+    print_summary(summary, language)
+
+    for i, error in enumerate(summary.items[:detail], summary.start):
+        severity_color = SEVERITY_COLORS.get(error.severity.value, "white")
+        console.print(Panel(
+            f"[{severity_color}]{escape(error.error_type)}[/{severity_color}]: "
+            f"{escape(error.message)}",
+            title=f"Error #{i}",
+            subtitle=f"Severity: {error.severity.value.upper()}"
+        ))
+        print_stack_frames(error)
+        print_chain(error)
+        console.print()
+
+    number_width = len(str(summary.offset + len(summary)))
+
+    def collapsed() -> Iterator[Text]:
+        for i, error in enumerate(summary.items[detail:], summary.start + detail):
+            location = error.file_path or ""
+            if location and error.line_number:
+                location += f":{error.line_number}"
+            yield Text.assemble(
+                (f"#{i:<{number_width}} ", "dim"),
+                (
+                    f"{error.severity.value.upper():<8} ",
+                    SEVERITY_COLORS.get(error.severity.value, "white"),
+                ),
+                (error.error_type, "red"),
+                ": ",
+                error.message,
+                (f"  {location}" if location else "", "cyan"),
+            )
+
+    print_lines(collapsed())
+    print_remaining(summary)
+
+
+def print_stack_frames(error: ParsedError) -> None:
+    """Print the top stack frames of an error."""
+    if not error.stack_frames:
+        return
+
+    console.print("  [bold]Stack Trace:[/bold]")
+    for j, frame in enumerate(error.stack_frames[:5]):  # Limit to 5 frames
+        prefix = "  → " if j == 0 else "    "
+        location = frame.file_path
+        if frame.line_number:
+            location += f":{frame.line_number}"
+        method = frame.method_name
+        if frame.class_name:
+            method = f"{frame.class_name}.{method}"
+        console.print(
+            f"{prefix}[cyan]{escape(location)}[/cyan] in [yellow]{escape(str(method))}[/yellow]"
+        )
+
+        if frame.code_context:
+            console.print(f"       [dim]{escape(frame.code_context)}[/dim]")
+
+    if len(error.stack_frames) > 5:
+        console.print(f"    [dim]... and {len(error.stack_frames) - 5} more frames[/dim]")
+
+
+def print_chain(error: ParsedError) -> None:
+    """
+    Print the errors linked to an error as its causes and contexts.
+
+    Parsed errors link at most one earlier error each, so this is usually
+    a single chain; an error with both is followed into its cause first,
+    then into its context.
+    """
+    for label, linked in (("Caused by", error.cause), ("While handling", error.context)):
+        if linked:
+            console.print(
+                f"  [bold]{label}:[/bold] "
+                f"[red]{escape(linked.error_type)}[/red]: {escape(linked.message)}"
+            )
+            print_chain(linked)
+
+
+def output_groups(
+    groups: ErrorGrouper,
+    language: LanguageType,
+    output: str,
+    offset: int = 0,
+    limit: Optional[int] = None
+) -> None:
+    """Output a page of errors grouped by fingerprint."""
+    page: Page = Page(offset, limit)
+    for g in groups:
+        page.add(g)
+
+    if output == "json":
+        data = {
+            "language": language.value,
+            "error_count": groups.total,
+            "group_count": len(groups),
+            "offset": offset,
+            "limit": limit,
+            "groups": [g.to_dict() for g in page]
+        }
+        click.echo(json.dumps(data, indent=2, ensure_ascii=False))
+        return
+
+    if output == "ndjson":
+        output_ndjson(g.to_dict() for g in page)
+        return
+
+    if output == "table":
+        table = Table(
+            title=f"Grouped Errors ({language.value}): {groups.total} in {len(groups)} group(s)"
+        )
+
+        table.add_column("#", style="dim", width=3)
+        table.add_column("Count", style="bold", justify="right")
+        table.add_column("Type", style="red")
+        table.add_column("Message", style="yellow", max_width=50)
+        table.add_column("File", style="cyan")
+        table.add_column("Line", style="green", justify="right")
+        table.add_column("First seen", style="dim")
+        table.add_column("Last seen", style="dim")
+
+        for i, g in enumerate(page, page.start):
+            error = g.exemplar
+            table.add_row(
+                str(i),
+                str(g.count),
+                escape(error.error_type),
+                escape(error.message[:50] + "..." if len(error.message) > 50 else error.message),
+                escape(error.file_path or "-"),
+                str(error.line_number) if error.line_number else "-",
+                g.first_seen or "-",
+                g.last_seen or "-"
+            )
+
+        console.print(table)
+        print_remaining(page, "group")
+        return
+
+    console.print(
+        f"\n[bold]Found {groups.total} error(s) in {len(groups)} group(s)[/bold] "
+        f"(language: {language.value})\n"
+    )
+
+    for i, g in enumerate(page, page.start):
+        error = g.exemplar
+        seen = g.fingerprint
+        if g.first_seen:
+            seen = f"first seen {g.first_seen}, last seen {g.last_seen}"
+        console.print(Panel(
+            f"[red]{escape(error.error_type)}[/red]: {escape(error.message)}",
+            title=f"Group #{i} - {g.count} occurrence(s)",
+            subtitle=seen
+        ))
+        print_stack_frames(error)
+        print_chain(error)
+        console.print()
+    print_remaining(page, "group")
+
+
+def print_watch_event(error: ParsedError, source: Optional[Path] = None) -> None:
+    """Print a one-line summary of an error seen by watch."""
+    location = error.file_path or "-"
+    if error.line_number:
+        location += f":{error.line_number}"
+
+    console.print(
+        (f"[magenta]{escape(str(source))}[/magenta] " if source else "")
+        + f"[dim]{error.timestamp or time.strftime('%Y-%m-%d %H:%M:%S')}[/dim] "
+        f"[red]{escape(error.error_type)}[/red]: {escape(error.message)} "
+        f"[cyan]{escape(location)}[/cyan]"
+    )
+
+
+def print_repeats(
+    count: int,
+    error: ParsedError,
+    source: Optional[Path] = None,
+    reason: str = "suppressed as duplicates"
+) -> None:
+    """Print the number of occurrences of an error that were not printed."""
+    console.print(
+        (f"[magenta]{escape(str(source))}[/magenta] " if source else "")
+        + f"[yellow]{count} more occurrence(s) of {escape(error.error_type)}[/yellow] "
+        f"[dim]({reason})[/dim]"
+    )
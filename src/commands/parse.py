@@ -0,0 +1,427 @@
+"""The parse command: extract errors and stack traces from logs."""
+
+import os
+import sys
+from contextlib import ExitStack, nullcontext
+from itertools import chain, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, NoReturn, Optional
+
+import click
+
+from src.export.columnar import COLUMNAR_FORMATS
+from src.parsers.base import PARSER_ENGINES
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from src.parsers.base import ParsedError
+    from src.parsers.detector import LanguageType
+    from src.parsers.stats import ParseStats
+
+# Environment variable that, set to "auto", sends small inputs to a running
+# daemon without --daemon. The log text leaves this process, so it is opt-in
+DAEMON_ENV = "LOG_DETECTIVE_DAEMON"
+
+# Largest input (bytes of files on disk, or characters of --text) sent to a
+# running daemon in auto mode. The daemon saves the startup work that
+# dominates small inputs; larger ones parse faster in this process than
+# through the socket
+DAEMON_AUTO_MAX_SIZE = 512 * 1024
+
+# Errors of a page shown with stack traces in pretty output by default;
+# the rest are one line each
+DEFAULT_DETAIL = 10
+
+# Page size of table and pretty output without --limit. The page is held in
+# memory until the whole input is counted, so it must not grow with the input
+DEFAULT_TERMINAL_LIMIT = 500
+
+
+@click.command()
+@click.argument(
+    "files",
+    nargs=-1,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--file", "-f",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    multiple=True,
+    help="Path to log file to parse (repeatable; .gz, .bz2 and .xz are decompressed)"
+)
+@click.option(
+    "--text", "-t",
+    type=str,
+    help="Log text to parse directly"
+)
+@click.option(
+    "--language", "-l",
+    type=click.Choice(["java", "python", "mixed", "auto"]),
+    default="auto",
+    help="Force specific language parser (mixed: interleaved Java and Python)"
+)
+@click.option(
+    "--output", "-o",
+    type=click.Choice(["json", "ndjson", "table", "pretty", *COLUMNAR_FORMATS]),
+    default="pretty",
+    help="Output format (ndjson: one compact object per line, written as errors are found; "
+    "parquet/arrow: columnar file given by --out)"
+)
+@click.option(
+    "--out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Output file for parquet and arrow output"
+)
+@click.option(
+    "--mmap", "use_mmap",
+    is_flag=True,
+    help="Memory-map the file and decode only candidate error blocks"
+)
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Parse on N processes (0 = all cores); rotated files are decompressed in parallel"
+)
+@click.option(
+    "--group", "-g",
+    is_flag=True,
+    help="Group repeated errors by fingerprint (type and top stack frames)"
+)
+@click.option(
+    "--stats", "show_stats",
+    is_flag=True,
+    help="Print a per-stage and per-pattern timing breakdown to stderr"
+)
+@click.option(
+    "--engine",
+    type=click.Choice(PARSER_ENGINES),
+    default="regex",
+    show_default=True,
+    help="How log lines are split; scanner is linear-time on pathological lines"
+)
+@click.option(
+    "--limit", "-n",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Output at most N errors (groups with --group) [default: 500 for table and "
+    "pretty output]"
+)
+@click.option(
+    "--offset",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Skip the first N errors (groups with --group)"
+)
+@click.option(
+    "--detail",
+    type=click.IntRange(min=0),
+    default=DEFAULT_DETAIL,
+    show_default=True,
+    help="Errors shown with stack traces in pretty output; the rest get one line each"
+)
+@click.option(
+    "--daemon/--no-daemon",
+    default=None,
+    help="Parse files and --text on the daemon started by 'serve' [default: no; with "
+    "LOG_DETECTIVE_DAEMON=auto, when it is running and the input is at most 512 KiB]; "
+    "stdin is always parsed here"
+)
+def parse(
+    files: tuple[Path, ...],
+    file: tuple[Path, ...],
+    text: Optional[str],
+    language: str,
+    output: str,
+    out: Optional[Path],
+    use_mmap: bool,
+    jobs: int,
+    group: bool,
+    show_stats: bool,
+    engine: str,
+    limit: Optional[int],
+    offset: int,
+    detail: int,
+    daemon: Optional[bool]
+) -> None:
+    """
+    Parse error logs and extract stack traces.
+
+    FILES may be a whole rotation set (e.g. app.log*); it is parsed oldest
+    first as one log, so traces spanning a rotation stay whole.
+    """
+    from src.commands.records import output_columnar, output_json, output_ndjson
+    from src.parsers.archive import is_compressed, rotation_order
+    from src.parsers.stats import ParseStats
+    from src.parsers.summary import ErrorSummary, Page
+
+    paths = rotation_order(file + files)
+    if (use_mmap or jobs != 1) and not paths:
+        _fail("--mmap and --jobs require --file")
+    # A single uncompressed file supports random access
+    seekable = len(paths) == 1 and not is_compressed(paths[0])
+    if use_mmap and not seekable:
+        _fail("--mmap requires a single uncompressed file")
+    if (output in COLUMNAR_FORMATS) != bool(out):
+        _fail("--out is required for, and only used with, parquet and arrow output")
+    if group and output in COLUMNAR_FORMATS:
+        _fail(f"--group is not supported with {output} output")
+
+    if limit is None and output in ("table", "pretty") and not group:
+        limit = DEFAULT_TERMINAL_LIMIT
+
+    stats = ParseStats() if show_stats else None
+    # Streamed formats take their page from the stream, so parsing can stop after it
+    stream_page = output in ("ndjson", *COLUMNAR_FORMATS) and not group
+    with ExitStack() as stack:
+        remote = None
+        records: Optional[Iterator[dict]] = None
+        # A running daemon has its parsers warm. Stdin, and options that need
+        # this process (memory maps, worker pools, timing hooks), parse here
+        size = sum(path.stat().st_size for path in paths) if paths else len(text or "")
+        if daemon is None and (os.environ.get(DAEMON_ENV) != "auto" or size > DAEMON_AUTO_MAX_SIZE):
+            daemon = False
+        if daemon is not False and (paths or text) and not (use_mmap or jobs != 1 or show_stats):
+            remote = _parse_on_daemon(
+                stack, paths, text, language, engine,
+                *((offset, limit) if stream_page else (0, None)),
+                required=bool(daemon),
+            )
+        if remote is not None:
+            from src.parsers.base import ParsedError
+
+            records, detected_lang = remote
+            found = map(ParsedError.from_dict, records)
+            if stream_page:
+                # The daemon took the page already
+                offset, limit = 0, None
+        else:
+            found, detected_lang = _parse_locally(
+                stack, paths, seekable, text, language, engine, use_mmap, jobs, stats,
+                # Terminal output decodes frames only for the errors it shows
+                # in detail, but fingerprints need the top frames of every error
+                lazy=output in ("table", "pretty") and not group,
+            )
+
+        if stats:
+            found = stats.count_errors(found)
+
+        # Grouping keeps one exemplar per fingerprint instead of every error;
+        # streamed formats write each error as soon as its block is parsed;
+        # terminal output counts every error but keeps only the page it shows
+        streamed: Optional[int] = None
+        with stats.timer("parse") if stats else nullcontext():
+            if group:
+                from src.parsers.fingerprint import ErrorGrouper
+
+                groups = ErrorGrouper().add_all(found)
+            elif output == "ndjson":
+                # Records from the daemon are written as they arrive, without rebuilding errors
+                if records is None:
+                    records = (e.to_dict() for e in _page(found, offset, limit))
+                streamed = output_ndjson(records)
+            elif output in COLUMNAR_FORMATS:
+                streamed = output_columnar(_page(found, offset, limit), out, output)
+            elif output == "json":
+                # Every error is counted; only the page is kept
+                errors = Page(offset, limit)
+                for error in found:
+                    errors.add(error)
+            else:
+                summary = ErrorSummary(offset, limit).add_all(found)
+
+    # Output results
+    if streamed is not None:
+        if output in COLUMNAR_FORMATS:
+            _console().print(
+                f"Wrote {streamed:,} error(s) to {out} (detected language: {detected_lang.value})"
+            )
+        elif not streamed:
+            _console(stderr=True).print(
+                f"[yellow]No errors found[/yellow] (detected language: {detected_lang.value})"
+            )
+    elif not (groups.total if group else errors.total if output == "json" else summary.total):
+        _console().print(
+            f"[yellow]No errors found[/yellow] (detected language: {detected_lang.value})"
+        )
+    else:
+        with stats.timer("output") if stats else nullcontext():
+            if output == "json" and not group:
+                output_json(errors, detected_lang)
+            else:
+                # Only terminal output and groups need Rich
+                from src.commands.output import output_groups, output_pretty, output_table
+
+                if group:
+                    output_groups(groups, detected_lang, output, offset, limit)
+                elif output == "table":
+                    output_table(summary, detected_lang)
+                else:
+                    output_pretty(summary, detected_lang, detail)
+    if stats:
+        from src.commands.output import print_stats
+
+        print_stats(stats)
+
+
+def _console(stderr: bool = False) -> "Console":
+    """Get the Rich console for messages, importing Rich on first use."""
+    from src.commands.output import console, err_console
+
+    return err_console if stderr else console
+
+
+def _fail(message: str) -> NoReturn:
+    """Print an error and exit with status 1."""
+    _console().print(f"[red]Error:[/red] {message}")
+    sys.exit(1)
+
+
+def _parse_on_daemon(
+    stack: ExitStack,
+    paths: list[Path],
+    text: Optional[str],
+    language: str,
+    engine: str,
+    offset: int,
+    limit: Optional[int],
+    required: bool
+) -> Optional[tuple[Iterator[dict], "LanguageType"]]:
+    """
+    Parse the input on the daemon, streaming the errors back.
+
+    Returns:
+        Tuple of (error records as they arrive, detected language), or None if the
+        input should be parsed locally: it is empty, or the daemon is not
+        running or failed and is not required
+    """
+    from src.parsers.detector import LanguageType
+    from src.server.client import DaemonError, connect, default_socket_path
+
+    if paths:
+        # The daemon reads the files itself
+        params = {"paths": [str(path.resolve()) for path in paths]}
+    elif text and text.strip():
+        params = {"text": text}
+    else:
+        return None
+
+    try:
+        client = connect()
+    except PermissionError as e:
+        if required:
+            _fail(str(e))
+        return None
+    if client is None:
+        if required:
+            _fail(f"No daemon is listening on {default_socket_path()}; start one with serve")
+        return None
+    stack.enter_context(client)
+    try:
+        result, items = client.stream(
+            "parse", language=language, engine=engine, offset=offset, limit=limit, **params
+        )
+    except (DaemonError, OSError) as e:
+        if required:
+            _fail(f"The daemon failed: {e}")
+        return None
+    return _iter_remote(items), LanguageType(result["language"])
+
+
+def _iter_remote(items: Iterator[dict]) -> Iterator[dict]:
+    """Pass on the error records streamed by the daemon, exiting if it fails midway."""
+    from src.server.client import DaemonError
+
+    try:
+        yield from items
+    except (DaemonError, OSError) as e:
+        _fail(f"The daemon failed: {e}")
+
+
+def _parse_locally(
+    stack: ExitStack,
+    paths: list[Path],
+    seekable: bool,
+    text: Optional[str],
+    language: str,
+    engine: str,
+    use_mmap: bool,
+    jobs: int,
+    stats: Optional["ParseStats"],
+    lazy: bool
+) -> tuple[Iterator["ParsedError"], "LanguageType"]:
+    """
+    Parse the input in this process.
+
+    Returns:
+        Tuple of (lazily parsed errors, detected language)
+    """
+    from src.parsers.archive import iter_parse_rotation, iter_rotation_lines
+    from src.parsers.detector import (
+        STREAM_HEAD_SIZE,
+        LanguageType,
+        detect_file_language,
+        detect_language,
+        get_parser_for_language,
+        read_head,
+    )
+    from src.parsers.mapped import iter_parse_mapped
+    from src.parsers.parallel import iter_parse_parallel
+    from src.parsers.stats import instrument
+
+    # Get log lines from files or direct input
+    if paths:
+        lines: Iterator[str] = iter_rotation_lines(paths)
+        stack.callback(lines.close)
+    elif text:
+        lines = iter(text.strip().split("\n"))
+    else:
+        # Read from stdin if no input provided
+        if not sys.stdin.isatty():
+            lines = iter(sys.stdin)
+        else:
+            _fail("Please provide --file or --text, or pipe input")
+
+    # Keep only a bounded head in memory for language detection
+    detection = stats.timer("detection") if stats else nullcontext()
+    with detection:
+        head = read_head(lines)
+        exhausted = sum(map(len, head)) < STREAM_HEAD_SIZE
+        if exhausted and not any(line.strip() for line in head):
+            _console().print("[yellow]Warning:[/yellow] Empty input")
+            sys.exit(0)
+        lines = chain(head, lines)
+
+        # Parse the log
+        if language == "auto" and seekable:
+            detected_lang, _ = detect_file_language(paths[0])
+        elif language == "auto":
+            detected_lang = detect_language("".join(head))
+        else:
+            detected_lang = LanguageType(language)
+
+    parser = get_parser_for_language(detected_lang, lazy=lazy, engine=engine)
+    if parser and jobs != 1 and seekable:
+        found: Iterator[ParsedError] = iter_parse_parallel(paths[0], parser, jobs or None, use_mmap)
+    elif parser and jobs != 1:
+        # Files are decompressed and parsed in parallel, then stitched
+        found = iter_parse_rotation(paths, parser, jobs or None)
+    elif parser and use_mmap:
+        found = iter_parse_mapped(paths[0], parser)
+    elif parser and stats:
+        # Patterns can only be timed in this process
+        found = instrument(parser, stats).iter_parse(stats.count_lines(lines))
+    elif parser:
+        found = parser.iter_parse(lines)
+    elif language == "auto":
+        found = iter(())
+    else:
+        _fail(f"No parser for language: {language}")
+    return found, detected_lang
+
+
+def _page(items: Iterable, offset: int, limit: Optional[int]) -> Iterator:
+    """Take the --offset/--limit window of a stream without reading past it."""
+    return islice(items, offset, None if limit is None else offset + limit)
@@ -0,0 +1,58 @@
+"""
+Machine-readable output of the CLI commands.
+
+Records are written without Rich, which would wrap long lines and eat
+[markup] in messages, and which takes longer to import than a parse on
+the daemon; Rich is only loaded here to report a failure.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+import click
+
+from src.export.columnar import write_columnar
+from src.export.ndjson import write_ndjson
+
+if TYPE_CHECKING:
+    from src.parsers.base import ParsedError
+    from src.parsers.detector import LanguageType
+    from src.parsers.summary import Page
+
+
+def output_json(page: "Page[ParsedError]", language: "LanguageType") -> None:
+    """Output a page of errors as JSON, with the number of errors found in all."""
+    data = {
+        "language": language.value,
+        "error_count": page.total,
+        "offset": page.offset,
+        "limit": page.limit,
+        "errors": [e.to_dict() for e in page]
+    }
+    click.echo(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def output_ndjson(records: Iterable[dict]) -> int:
+    """Write records to stdout as NDJSON while they are produced."""
+    sys.stdout.flush()
+    try:
+        return write_ndjson(records, sys.stdout.buffer)
+    except BrokenPipeError:
+        # The reader (e.g. head) is gone; keep the interpreter from
+        # failing again when it flushes stdout at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+def output_columnar(errors: Iterable["ParsedError"], path: Path, fmt: str) -> int:
+    """Write errors to a Parquet or Arrow file in batches while they are parsed."""
+    try:
+        return write_columnar(errors, path, fmt)
+    except ImportError as e:
+        from src.commands.output import console
+
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
@@ -0,0 +1,49 @@
+"""The serve command: a resident daemon that keeps parsers warm."""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option(
+    "--socket", "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix socket to listen on (default: $LOG_DETECTIVE_SOCKET, else "
+    "log-detective.sock in $XDG_RUNTIME_DIR or the temp directory)"
+)
+def serve(socket_path: Optional[Path]) -> None:
+    """
+    Run a daemon that answers parse requests over a Unix socket.
+
+    Parsers are built once and stay warm, so each request costs only the
+    parsing itself. parse --daemon sends files and --text to it and reads
+    the errors back as they are parsed; with LOG_DETECTIVE_DAEMON=auto,
+    parse uses it for small inputs whenever it runs. Clients only talk to
+    a daemon run by their own user.
+    """
+    import signal
+
+    from src.commands.output import console
+    from src.server.client import default_socket_path
+    from src.server.daemon import DaemonServer
+
+    path = socket_path or default_socket_path()
+    # Stop cleanly (removing the socket) when a service manager stops us
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server = DaemonServer(path)
+    except OSError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    console.print(f"[bold]Serving on {path}[/bold]. Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("[dim]Stopped[/dim]")
+    finally:
+        server.server_close()
@@ -0,0 +1,223 @@
+"""The watch command: report errors from log files as they are written."""
+
+import glob
+import signal
+import sys
+from pathlib import Path
+from typing import Optional, Union
+
+import click
+
+from src.monitor.debouncer import DEFAULT_WINDOW
+from src.monitor.watcher import DEFAULT_FLUSH_TIMEOUT, DEFAULT_POLL_INTERVAL
+
+
+@click.command()
+@click.option(
+    "--file", "-f",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Log file to watch"
+)
+@click.option(
+    "--path", "-p", "paths",
+    multiple=True,
+    help="File, directory (all *.log below it) or glob such as 'logs/**/*.log'; repeatable"
+)
+@click.option(
+    "--language", "-l",
+    type=click.Choice(["java", "python", "mixed", "auto"]),
+    default="auto",
+    help="Force specific language parser (auto falls back to mixed)"
+)
+@click.option(
+    "--from-start",
+    is_flag=True,
+    help="Parse the existing content before following new lines"
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    help="Poll instead of using inotify (e.g. for network filesystems)"
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.05),
+    default=DEFAULT_POLL_INTERVAL,
+    show_default=True,
+    help="Seconds between polls and rotation checks"
+)
+@click.option(
+    "--flush-after",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_FLUSH_TIMEOUT,
+    show_default=True,
+    help="Report an unfinished trace after this many quiet seconds"
+)
+@click.option(
+    "--dedupe-window",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_WINDOW,
+    show_default=True,
+    help="Report repeats of an error once per this many seconds (0 reports every one)"
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Save positions to this file and resume from it on restart"
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write Prometheus metrics to this file (e.g. for node_exporter's textfile collector)"
+)
+def watch(
+    file: Optional[Path],
+    paths: tuple[str, ...],
+    language: str,
+    from_start: bool,
+    poll: bool,
+    interval: float,
+    flush_after: float,
+    dedupe_window: float,
+    checkpoint: Optional[Path],
+    metrics_file: Optional[Path]
+) -> None:
+    """Watch log files for errors in real-time."""
+    from rich.markup import escape
+
+    from src.commands.output import console
+
+    if bool(file) == bool(paths):
+        console.print("[red]Error:[/red] Please provide either --file or --path")
+        sys.exit(1)
+
+    # Stop cleanly (saving checkpoints) when a service manager stops us
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    # A single file is watched as a pattern matching only itself
+    patterns = (glob.escape(str(file)),) if file else paths
+    console.print(
+        f"[bold]Watching {escape(str(file) if file else ', '.join(paths))}[/bold]. "
+        "Press Ctrl+C to stop."
+    )
+    _watch_paths(
+        patterns, language, from_start, poll, interval, flush_after, dedupe_window,
+        checkpoint, metrics_file,
+    )
+
+
+def _watch_paths(
+    paths: tuple[str, ...],
+    language: str,
+    from_start: bool,
+    poll: bool,
+    interval: float,
+    flush_after: float,
+    dedupe_window: float,
+    checkpoint: Optional[Path],
+    metrics_file: Optional[Path]
+) -> None:
+    """Watch every file matching the given patterns from one event loop."""
+    import asyncio
+
+    from src.commands.output import console, print_repeats, print_watch_event
+    from src.monitor.checkpoint import CheckpointStore
+    from src.monitor.debouncer import Debouncer
+    from src.monitor.metrics import TextfileExporter
+    from src.monitor.multi import MultiFileWatcher
+    from src.monitor.pipeline import OverflowPolicy, Pipeline, Stage, Summary
+    from src.parsers.base import ParsedError
+    from src.parsers.detector import LanguageType
+    from src.parsers.stats import ParseStats
+
+    stats = ParseStats() if metrics_file else None
+    watcher = MultiFileWatcher(
+        paths,
+        language=None if language == "auto" else LanguageType(language),
+        from_start=from_start,
+        poll_interval=interval,
+        flush_timeout=flush_after,
+        use_inotify=not poll,
+        checkpoints=CheckpointStore(checkpoint) if checkpoint else None,
+        stats=stats,
+    )
+    debouncer = Debouncer(dedupe_window) if dedupe_window else None
+
+    def notify(item: Union[tuple[Path, ParsedError], Summary]) -> None:
+        if isinstance(item, Summary):
+            source, error = item.exemplar
+            print_repeats(item.count, error, source, "summarized under load")
+        elif debouncer is None or debouncer.add(item[1]):
+            print_watch_event(item[1], item[0])
+
+    async def expire_repeats() -> None:
+        # Windows close on a timer, so summaries arrive even when logs go quiet
+        while True:
+            due = debouncer.time_until_expiry()
+            await asyncio.sleep(interval if due is None else min(interval, due))
+            for group in debouncer.expire():
+                print_repeats(group.count, group.exemplar)
+
+    # Repeats are summarized while the output falls behind, so an error
+    # storm never stalls the tailers or grows memory. Summarized errors, and
+    # those dropped beyond DEFAULT_MAX_SUMMARIES keys, are not replayed from
+    # a checkpoint
+    pipeline = Pipeline([
+        Stage(
+            "notify", notify,
+            policy=OverflowPolicy.SUMMARIZE,
+            key=lambda item: (item[0], item[1].fingerprint()),
+        ),
+    ])
+
+    exporter = TextfileExporter(metrics_file, stats, pipeline, debouncer) if metrics_file else None
+
+    async def export_metrics() -> None:
+        while True:
+            exporter.export(force=True)
+            await asyncio.sleep(exporter.interval)
+
+    def stop() -> None:
+        # The first signal stops reading and lets the queued errors print;
+        # a second one interrupts at once
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+            signal.signal(signum, signal.default_int_handler)
+        watcher.stop()
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop)
+        timers = []
+        if debouncer is not None:
+            timers.append(asyncio.create_task(expire_repeats()))
+        if exporter is not None:
+            timers.append(asyncio.create_task(export_metrics()))
+        try:
+            await pipeline.run(watcher.events(settled=pipeline.idle))
+        finally:
+            for timer in timers:
+                timer.cancel()
+
+    try:
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            # Interrupted again while the queue drained
+            pass
+        # With checkpoints, unfinished blocks are saved by close() instead
+        for source, error in watcher.flush_all() if checkpoint is None else []:
+            if debouncer is None or debouncer.add(error):
+                print_watch_event(error, source)
+        for group in debouncer.flush() if debouncer is not None else []:
+            print_repeats(group.count, group.exemplar)
+        console.print("[dim]Stopped[/dim]")
+    finally:
+        # Errors still queued were not printed; they are read again on restart
+        watcher.close(save=pipeline.idle())
+        if exporter is not None:
+            exporter.export(force=True)
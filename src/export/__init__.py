@@ -0,0 +1 @@
+"""Machine-readable export of parsed errors."""
@@ -0,0 +1,162 @@
+"""Columnar export of parsed errors as Parquet or Arrow IPC files."""
+
+from pathlib import Path
+from typing import Any, Iterable
+
+from src.parsers.base import ParsedError
+
+# Output formats: Parquet, and the Arrow IPC file format (Feather v2)
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+# Errors per record batch; each batch becomes one Parquet row group, so
+# memory stays bounded by the batch however many errors are written
+DEFAULT_BATCH_SIZE = 16 * 1024
+
+# String columns taken from ParsedError attributes (severity as its value)
+ERROR_FIELDS = (
+    "error_type", "message", "severity", "language",
+    "timestamp", "logger_name", "thread_name",
+)
+
+# Fields of the root cause frame (exported with a root_ prefix) and of
+# every frame in the frames list column
+ROOT_FRAME_FIELDS = ("file_path", "line_number", "method_name", "class_name")
+FRAME_FIELDS = ROOT_FRAME_FIELDS + ("code_context",)
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow, which is only needed for columnar output."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Arrow output require pyarrow (pip install 'log-detective[arrow]')"
+        ) from e
+    return pyarrow
+
+
+def error_schema() -> Any:
+    """
+    Get the Arrow schema of exported errors.
+
+    Returns:
+        pyarrow.Schema with one row per error
+    """
+    pa = _import_pyarrow()
+
+    def field_type(name: str) -> Any:
+        return pa.int32() if name == "line_number" else pa.string()
+
+    frame = pa.struct([(name, field_type(name)) for name in FRAME_FIELDS])
+    return pa.schema(
+        [(name, pa.string()) for name in ERROR_FIELDS]
+        + [(f"root_{name}", field_type(name)) for name in ROOT_FRAME_FIELDS]
+        + [("frames", pa.list_(frame))]
+    )
+
+
+def write_columnar(
+    errors: Iterable[ParsedError],
+    path: Path,
+    fmt: str = "parquet",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Write errors to a Parquet or Arrow IPC file while they are parsed.
+
+    Errors are converted to columns one batch at a time and every batch is
+    written before the next is collected, so the full result set is never
+    held in memory.
+
+    Args:
+        errors: Parsed errors, e.g. a generator from iter_parse()
+        path: Output file
+        fmt: One of COLUMNAR_FORMATS
+        batch_size: Errors per record batch (Parquet row group)
+
+    Returns:
+        Number of errors written
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        ValueError: If the format is unknown
+    """
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format: {fmt}")
+    pa = _import_pyarrow()
+    schema = error_schema()
+
+    if fmt == "parquet":
+        writer = pa.parquet.ParquetWriter(str(path), schema)
+    else:
+        writer = pa.ipc.new_file(str(path), schema)
+
+    count = 0
+    try:
+        batch = _Batch(schema)
+        for error in errors:
+            batch.append(error)
+            count += 1
+            if count % batch_size == 0:
+                writer.write_batch(batch.to_record_batch(pa))
+                batch = _Batch(schema)
+        if count % batch_size:
+            writer.write_batch(batch.to_record_batch(pa))
+    finally:
+        writer.close()
+    return count
+
+
+class _Batch:
+    """
+    Column values of the errors collected for one record batch.
+
+    Frames are kept as flat per-field lists plus list offsets, which is
+    far smaller than a dict per frame and maps directly onto Arrow's list
+    layout.
+    """
+
+    def __init__(self, schema: Any):
+        self.schema = schema
+        self.columns: dict[str, list] = {
+            name: [] for name in schema.names if name != "frames"
+        }
+        self.frame_columns: dict[str, list] = {name: [] for name in FRAME_FIELDS}
+        self.frame_offsets = [0]
+
+    def append(self, error: ParsedError) -> None:
+        """Append the column values of one error."""
+        columns = self.columns
+        for name in ERROR_FIELDS:
+            value = getattr(error, name)
+            columns[name].append(value.value if name == "severity" else value)
+
+        root = error.root_cause_frame
+        for name in ROOT_FRAME_FIELDS:
+            columns[f"root_{name}"].append(getattr(root, name) if root else None)
+
+        frames = error.stack_frames
+        for name, values in self.frame_columns.items():
+            values.extend([getattr(frame, name) for frame in frames])
+        self.frame_offsets.append(self.frame_offsets[-1] + len(frames))
+
+    def to_record_batch(self, pa: Any) -> Any:
+        """Convert the collected values to a pyarrow.RecordBatch."""
+        frame_type = self.schema.field("frames").type.value_type
+        frames = pa.ListArray.from_arrays(
+            pa.array(self.frame_offsets, pa.int32()),
+            pa.StructArray.from_arrays(
+                [
+                    pa.array(self.frame_columns[field.name], field.type)
+                    for field in frame_type
+                ],
+                fields=list(frame_type),
+            ),
+        )
+        arrays = [
+            frames if field.name == "frames" else pa.array(self.columns[field.name], field.type)
+            for field in self.schema
+        ]
+        return pa.record_batch(arrays, schema=self.schema)
@@ -0,0 +1,61 @@
+"""Newline-delimited JSON output, one compact object per line."""
+
+import json
+from typing import Any, BinaryIO, Iterable
+
+try:
+    import orjson
+except ImportError:
+    # Optional: several times faster, with byte-identical output
+    orjson = None
+
+
+def dumps_line(record: Any) -> bytes:
+    """
+    Encode a record as one compact JSON line.
+
+    orjson is used when it is installed. Records it rejects, such as
+    strings with lone surrogates, go through the standard library encoder,
+    which escapes what cannot be encoded as UTF-8.
+
+    Args:
+        record: JSON-compatible dict (or other JSON value)
+
+    Returns:
+        UTF-8 encoded JSON followed by a newline
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+    try:
+        return line.encode("utf-8")
+    except UnicodeEncodeError:
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode("ascii")
+
+
+def write_ndjson(records: Iterable[dict[str, Any]], stream: BinaryIO) -> int:
+    """
+    Write records as NDJSON while they are produced.
+
+    Output is block-buffered for throughput, except on a terminal, where
+    every line is flushed as soon as it is written.
+
+    Args:
+        records: JSON-compatible dicts, e.g. a generator over parsed errors
+        stream: Binary output stream such as ``sys.stdout.buffer``
+
+    Returns:
+        Number of records written
+    """
+    interactive = stream.isatty()
+    count = 0
+    for record in records:
+        stream.write(dumps_line(record))
+        count += 1
+        if interactive:
+            stream.flush()
+    stream.flush()
+    return count
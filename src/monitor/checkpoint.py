@@ -0,0 +1,156 @@
+"""Durable watch positions, so a restarted watch resumes where it stopped."""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.monitor.watcher import FileTailer
+
+# Seconds between checkpoint writes; positions are saved in batches,
+# never per line
+DEFAULT_SAVE_INTERVAL = 5.0
+
+# Version of the checkpoint file format
+CHECKPOINT_VERSION = 1
+
+
+@dataclass(slots=True)
+class FileCheckpoint:
+    """Saved read state of one file."""
+
+    dev: int
+    ino: int
+    position: int
+    signature: str
+    pending: str = ""
+
+    @property
+    def identity(self) -> tuple[int, int]:
+        return self.dev, self.ino
+
+
+class CheckpointStore:
+    """
+    Small JSON store of per-file positions and unfinished parser state.
+
+    Live tailers are registered with track(); save() snapshots all of them
+    at once, at most every interval seconds, and only writes when something
+    changed. The file is replaced atomically (write to a temporary file,
+    fsync, rename), so a crash leaves either the old or the new checkpoint.
+
+    Errors completed after the last save are reported again after a crash;
+    none are skipped. Errors that a full notify queue dropped or folded into
+    a summary (see StageQueue) are not reported again either.
+    """
+
+    def __init__(self, path: Path, interval: float = DEFAULT_SAVE_INTERVAL):
+        """
+        Initialize the store, loading the existing checkpoint file if any.
+
+        Args:
+            path: Checkpoint file
+            interval: Minimum seconds between writes
+        """
+        self.path = Path(path)
+        self.interval = interval
+        self.checkpoints: dict[str, FileCheckpoint] = self._load()
+        self._tracked: dict[str, tuple[FileTailer, Callable[[], str]]] = {}
+        self._last_save = time.monotonic()
+
+    def restore(self, tailer: FileTailer) -> Optional[str]:
+        """
+        Move a new tailer to the saved position of its path.
+
+        Args:
+            tailer: Tailer of a file that may have a checkpoint
+
+        Returns:
+            Unfinished text to feed to the parser before new text, or None
+            if there is no usable checkpoint
+        """
+        checkpoint = self.checkpoints.get(self._key(tailer.path))
+        if checkpoint is None:
+            return None
+        if tailer.restore(checkpoint.identity, checkpoint.position, checkpoint.signature):
+            return checkpoint.pending
+        # Truncated or replaced while we were down; the file is read from the start
+        return ""
+
+    def track(self, tailer: FileTailer, pending: Callable[[], str]) -> None:
+        """
+        Include a tailer in every following save.
+
+        Args:
+            tailer: Tailer to save
+            pending: Returns the text fed to the parser but not parsed yet
+        """
+        self._tracked[self._key(tailer.path)] = (tailer, pending)
+
+    def forget(self, path: Path) -> None:
+        """Stop tracking a file and drop its checkpoint."""
+        key = self._key(path)
+        self._tracked.pop(key, None)
+        self.checkpoints.pop(key, None)
+
+    def save(self, force: bool = False) -> bool:
+        """
+        Write the tracked positions if the interval has passed.
+
+        Args:
+            force: Write now regardless of the interval (e.g. on shutdown)
+
+        Returns:
+            True if the checkpoint file was written
+        """
+        now = time.monotonic()
+        if not force and now - self._last_save < self.interval:
+            return False
+        self._last_save = now
+
+        checkpoints = dict(self.checkpoints)
+        for key, (tailer, pending) in self._tracked.items():
+            if tailer.closed:
+                continue
+            dev, ino = tailer.identity
+            checkpoints[key] = FileCheckpoint(
+                dev, ino, tailer.position, tailer.signature(), pending()
+            )
+
+        if checkpoints == self.checkpoints and self.path.exists():
+            return False
+        self.checkpoints = checkpoints
+        self._write()
+        return True
+
+    def _write(self) -> None:
+        """Atomically replace the checkpoint file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "files": {key: asdict(checkpoint) for key, checkpoint in self.checkpoints.items()},
+        }
+
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as fp:
+            json.dump(data, fp, ensure_ascii=False)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> dict[str, FileCheckpoint]:
+        """Read the checkpoint file; a missing or unreadable one starts fresh."""
+        try:
+            with open(self.path, encoding='utf-8') as fp:
+                data = json.load(fp)
+            if data.get("version") != CHECKPOINT_VERSION:
+                return {}
+            return {key: FileCheckpoint(**value) for key, value in data["files"].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(Path(path).absolute())
@@ -0,0 +1,149 @@
+"""Time-windowed, memory-bounded suppression of repeated errors."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+from src.parsers.base import ParsedError
+from src.parsers.fingerprint import ErrorGroup
+
+# Seconds during which repeats of a reported error are suppressed
+DEFAULT_WINDOW = 60.0
+
+# Maximum number of error signatures tracked at once
+DEFAULT_MAX_KEYS = 10_000
+
+
+@dataclass(slots=True)
+class _Window:
+    """Suppression window of one signature."""
+
+    started: float
+    suppressed: Optional[ErrorGroup] = None
+
+
+class Debouncer:
+    """
+    Report an error once per time window and count its repeats.
+
+    The first occurrence of a signature is reported and opens a window;
+    later occurrences inside the window are only counted. When the window
+    expires, the repeats come back as one ErrorGroup ("N more occurrences")
+    and the next occurrence is reported again.
+
+    Windows all have the same length, so they expire in the order they
+    were opened. Keeping them in an OrderedDict makes every operation O(1)
+    (amortized for expiry). At most max_keys signatures are tracked; when
+    a new one arrives at the cap, the oldest window is closed early and
+    its summary is returned by the next expire() call.
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        key: Optional[Callable[[ParsedError], Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the debouncer.
+
+        Args:
+            window: Seconds during which repeats are suppressed
+            max_keys: Maximum number of tracked signatures
+            key: Signature of an error (default: its fingerprint)
+            clock: Monotonic time source
+        """
+        self.window = window
+        self.max_keys = max_keys
+        self.key = key or (lambda error: error.fingerprint())
+        self.clock = clock
+
+        self.reported = 0
+        self.suppressed = 0
+        self.evicted = 0
+
+        self._windows: OrderedDict[Hashable, _Window] = OrderedDict()
+        self._expired: list[ErrorGroup] = []
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def add(self, error: ParsedError) -> bool:
+        """
+        Record one occurrence of an error.
+
+        Args:
+            error: Parsed error
+
+        Returns:
+            True if the error should be reported, False if it is a repeat
+        """
+        now = self.clock()
+        self._expire(now)
+
+        key = self.key(error)
+        entry = self._windows.get(key)
+        if entry is None:
+            if len(self._windows) >= self.max_keys:
+                _, oldest = self._windows.popitem(last=False)
+                self.evicted += 1
+                if oldest.suppressed:
+                    self._expired.append(oldest.suppressed)
+            self._windows[key] = _Window(now)
+            self.reported += 1
+            return True
+
+        self.suppressed += 1
+        group = entry.suppressed
+        if group is None:
+            entry.suppressed = ErrorGroup(
+                str(key), error, first_seen=error.timestamp, last_seen=error.timestamp
+            )
+        else:
+            group.count += 1
+            if error.timestamp:
+                group.last_seen = error.timestamp
+                group.first_seen = group.first_seen or error.timestamp
+        return False
+
+    def expire(self) -> list[ErrorGroup]:
+        """
+        Close the windows that have run out.
+
+        Returns:
+            Summaries of the repeats suppressed in the closed windows
+        """
+        self._expire(self.clock())
+        expired, self._expired = self._expired, []
+        return expired
+
+    def flush(self) -> list[ErrorGroup]:
+        """Close every window, e.g. on shutdown, and return its summaries."""
+        expired = self._expired + [
+            entry.suppressed for entry in self._windows.values() if entry.suppressed
+        ]
+        self._windows.clear()
+        self._expired = []
+        return expired
+
+    def time_until_expiry(self) -> Optional[float]:
+        """Get the seconds until the oldest window closes (None if none is open)."""
+        if self._expired:
+            return 0.0
+        if not self._windows:
+            return None
+        oldest = next(iter(self._windows.values()))
+        return max(oldest.started + self.window - self.clock(), 0.0)
+
+    def _expire(self, now: float) -> None:
+        """Move the summaries of run-out windows to the expired list."""
+        windows = self._windows
+        while windows:
+            key, entry = next(iter(windows.items()))
+            if now - entry.started < self.window:
+                break
+            del windows[key]
+            if entry.suppressed:
+                self._expired.append(entry.suppressed)
@@ -0,0 +1,171 @@
+"""Prometheus text-format metrics of a watch run, for node_exporter's textfile collector."""
+
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from src.monitor.debouncer import Debouncer
+from src.monitor.pipeline import Pipeline
+from src.parsers.stats import ParseStats
+
+# Prefix of every exported metric name
+METRIC_PREFIX = "log_detective"
+
+# Seconds between metric file writes
+DEFAULT_EXPORT_INTERVAL = 15.0
+
+Sample = tuple[dict[str, str], Union[int, float]]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _family(name: str, kind: str, help_text: str, samples: Iterable[Sample]) -> list[str]:
+    """Render one metric family: HELP and TYPE lines followed by its samples."""
+    full_name = f"{METRIC_PREFIX}_{name}"
+    lines = [f"# HELP {full_name} {help_text}", f"# TYPE {full_name} {kind}"]
+    for labels, value in samples:
+        label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+        sample_name = f"{full_name}{{{label_text}}}" if label_text else full_name
+        lines.append(f"{sample_name} {value}")
+    return lines
+
+
+def render_metrics(
+    stats: ParseStats,
+    pipeline: Optional[Pipeline] = None,
+    debouncer: Optional[Debouncer] = None,
+) -> str:
+    """
+    Render watch metrics in the Prometheus text exposition format.
+
+    Args:
+        stats: Stage and pattern timings and counters
+        pipeline: Pipeline whose queue depth and lag to include
+        debouncer: Debouncer whose suppressed count to include
+
+    Returns:
+        Metrics text ending with a newline
+    """
+    counters = stats.counters
+    patterns = [name for name in stats.seconds if name in stats.matches]
+    stages = [name for name in stats.seconds if name not in stats.matches]
+
+    lines: list[str] = []
+    lines += _family(
+        "uptime_seconds", "gauge", "Seconds since watch started.",
+        [({}, round(stats.elapsed, 3))],
+    )
+    lines += _family("lines_total", "counter", "Log lines read.", [({}, counters["lines"])])
+    lines += _family("errors_total", "counter", "Errors parsed.", [({}, counters["errors"])])
+    lines += _family(
+        "blocks_total", "counter", "Candidate blocks assembled.", [({}, counters["blocks"])]
+    )
+    lines += _family(
+        "stage_seconds_total", "counter", "Seconds spent per processing stage.",
+        [({"stage": name}, round(stats.seconds[name], 6)) for name in stages],
+    )
+    lines += _family(
+        "pattern_seconds_total", "counter", "Seconds spent matching each parser pattern.",
+        [({"pattern": name}, round(stats.seconds[name], 6)) for name in patterns],
+    )
+    lines += _family(
+        "pattern_calls_total", "counter", "Calls of each parser pattern.",
+        [({"pattern": name}, stats.calls[name]) for name in patterns],
+    )
+    lines += _family(
+        "pattern_matches_total", "counter", "Successful matches of each parser pattern.",
+        [({"pattern": name}, stats.matches[name]) for name in patterns],
+    )
+
+    if pipeline is not None:
+        queues = pipeline.stats()
+        for name, kind, key, help_text in [
+            ("queue_depth", "gauge", "depth", "Items waiting in a stage's input queue."),
+            (
+                "queue_lag_seconds", "gauge", "lag",
+                "Age of the oldest item in a stage's input queue.",
+            ),
+            ("queue_dropped_total", "counter", "dropped", "Items dropped by a full queue."),
+            (
+                "queue_summarized_total", "counter", "summarized",
+                "Items folded into summaries by a full queue.",
+            ),
+            (
+                "stage_processed_total", "counter", "processed",
+                "Items processed per pipeline stage.",
+            ),
+            (
+                "stage_failed_total", "counter", "failed",
+                "Items whose handler raised per pipeline stage.",
+            ),
+        ]:
+            lines += _family(
+                name, kind, help_text, [({"stage": q["stage"]}, q[key]) for q in queues]
+            )
+
+    if debouncer is not None:
+        lines += _family(
+            "suppressed_total", "counter", "Repeated errors suppressed by the dedupe window.",
+            [({}, debouncer.suppressed)],
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+class TextfileExporter:
+    """
+    Periodically write metrics to a ``.prom`` file.
+
+    The file is written to a temporary name and renamed, so the textfile
+    collector never reads a half-written file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        stats: ParseStats,
+        pipeline: Optional[Pipeline] = None,
+        debouncer: Optional[Debouncer] = None,
+        interval: float = DEFAULT_EXPORT_INTERVAL,
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: Metrics file (node_exporter reads files ending in .prom)
+            stats: Stats to export
+            pipeline: Pipeline whose queues to export
+            debouncer: Debouncer whose suppressed count to export
+            interval: Minimum seconds between writes
+        """
+        self.path = Path(path)
+        self.stats = stats
+        self.pipeline = pipeline
+        self.debouncer = debouncer
+        self.interval = interval
+        self._last_export: Optional[float] = None
+
+    def export(self, force: bool = False) -> bool:
+        """
+        Write the metrics file if the interval has passed.
+
+        Args:
+            force: Write now regardless of the interval
+
+        Returns:
+            True if the file was written
+        """
+        now = time.monotonic()
+        if not force and self._last_export is not None and now - self._last_export < self.interval:
+            return False
+        self._last_export = now
+
+        text = render_metrics(self.stats, self.pipeline, self.debouncer)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        return True
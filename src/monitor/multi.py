@@ -0,0 +1,413 @@
+"""Watch many log files from a single asyncio event loop."""
+
+import asyncio
+import glob
+import os
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, Optional
+
+from src.monitor.checkpoint import CheckpointStore
+from src.monitor.watcher import (
+    DEFAULT_FLUSH_TIMEOUT,
+    DEFAULT_POLL_INTERVAL,
+    IN_CREATE,
+    IN_MOVED_TO,
+    IN_Q_OVERFLOW,
+    FileTailer,
+    Inotify,
+)
+from src.parsers.base import BaseLogParser, ParsedError
+from src.parsers.detector import (
+    LanguageType,
+    detect_file_language,
+    detect_language,
+    get_parser_for_language,
+)
+from src.parsers.stats import ParseStats, instrument
+
+# Files matched inside a directory given as a watch path
+DEFAULT_DIRECTORY_PATTERN = '**/*.log'
+
+# Seconds between re-expanding the patterns (new subdirectories, missed events)
+DEFAULT_RESCAN_INTERVAL = 10.0
+
+# Characters of new text buffered to detect the language of an empty file;
+# if that is not enough, the mixed parser is used
+DETECTION_BUFFER_SIZE = 64 * 1024
+
+
+def expand_patterns(patterns: Iterable[str]) -> tuple[set[Path], set[Path]]:
+    """
+    Expand watch paths into files and the directories to watch for new files.
+
+    Args:
+        patterns: Files, directories or glob patterns (``**`` is recursive)
+
+    Returns:
+        Tuple of (matching files, directories where new matches can appear),
+        all as absolute paths
+    """
+    files: set[Path] = set()
+    directories: set[Path] = set()
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, DEFAULT_DIRECTORY_PATTERN)
+
+        for match in glob.iglob(pattern, recursive=True):
+            path = Path(match).absolute()
+            if path.is_file():
+                files.add(path)
+                directories.add(path.parent)
+
+        # The longest directory prefix without wildcards
+        base = Path(pattern)
+        while glob.has_magic(str(base)):
+            base = base.parent
+        if not base.is_dir():
+            base = base.parent
+        if not base.is_dir():
+            continue
+
+        directories.add(base.absolute())
+        if '**' in pattern:
+            # Matches can appear in any new subdirectory
+            directories.update(Path(root).absolute() for root, _, _ in os.walk(base))
+
+    return files, directories
+
+
+class WatchedFile:
+    """Tailer, language and parser state for one watched file."""
+
+    def __init__(
+        self,
+        path: Path,
+        tailer: FileTailer,
+        language: Optional[LanguageType],
+        stats: Optional[ParseStats] = None,
+    ):
+        """
+        Initialize the file state.
+
+        Args:
+            path: Watched path
+            tailer: Tailer reading the file
+            language: Language of the file, or None to detect it from new text
+            stats: Stats to record parsing into
+        """
+        self.path = path
+        self.tailer = tailer
+        self.language = language
+        self.stats = stats
+        self.parser: Optional[BaseLogParser] = self._new_parser(language) if language else None
+        self._buffer: list[str] = []
+        self._buffered = 0
+
+    def _new_parser(self, language: LanguageType) -> BaseLogParser:
+        """Create the parser for a language, instrumented if stats are recorded."""
+        parser = get_parser_for_language(language)
+        return instrument(parser, self.stats) if self.stats else parser
+
+    def feed(self, text: str) -> list[ParsedError]:
+        """Feed new text, buffering it until the language is known."""
+        if self.stats:
+            self.stats.add('lines', text.count('\n'))
+        if self.parser is None:
+            self._buffer.append(text)
+            self._buffered += len(text)
+            text = ''.join(self._buffer)
+
+            language = detect_language(text)
+            if language == LanguageType.UNKNOWN:
+                if self._buffered < DETECTION_BUFFER_SIZE:
+                    return []
+                language = LanguageType.MIXED
+
+            self.language = language
+            self.parser = self._new_parser(language)
+            self._buffer = []
+
+        return self._count(self.parser.feed(text))
+
+    def flush(self, timeout: Optional[float] = None) -> list[ParsedError]:
+        """Close a quiet open block (or everything, without a timeout)."""
+        if self.parser is None:
+            if timeout is not None or not self._buffer:
+                return []
+            # The stream ends before the language could be detected
+            self.parser = self._new_parser(LanguageType.MIXED)
+            self.parser.feed(''.join(self._buffer))
+            self._buffer = []
+        return self._count(self.parser.flush(timeout))
+
+    def _count(self, errors: list[ParsedError]) -> list[ParsedError]:
+        """Add parsed errors to the stats."""
+        if self.stats:
+            self.stats.add('errors', len(errors))
+        return errors
+
+    def time_until_flush(self, timeout: float) -> Optional[float]:
+        """Get the seconds until flush(timeout) closes the open block."""
+        return self.parser.time_until_flush(timeout) if self.parser else None
+
+    def pending_text(self) -> str:
+        """Get the text fed but not parsed yet."""
+        return self.parser.pending_text() if self.parser else ''.join(self._buffer)
+
+
+class MultiFileWatcher:
+    """
+    Follow every file matching a set of patterns in one asyncio event loop.
+
+    All files share one inotify descriptor (or one polling loop), so the
+    cost of an idle watcher does not grow with the number of files. Each
+    file keeps its own tailer and parser state, and its detected language
+    is cached by path, surviving rotation and re-creation.
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        language: Optional[LanguageType] = None,
+        from_start: bool = False,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        flush_timeout: float = DEFAULT_FLUSH_TIMEOUT,
+        rescan_interval: float = DEFAULT_RESCAN_INTERVAL,
+        use_inotify: bool = True,
+        checkpoints: Optional[CheckpointStore] = None,
+        stats: Optional[ParseStats] = None,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            patterns: Files, directories or glob patterns to watch
+            language: Language of every file (default: detect per file)
+            from_start: Parse the existing content of files present at start
+            poll_interval: Seconds between reads when polling, and the
+                longest time to sleep when idle
+            flush_timeout: Seconds of silence after which an open block is
+                reported as complete
+            rescan_interval: Seconds between re-expanding the patterns
+            use_inotify: Wake on inotify events instead of polling
+            checkpoints: Store to resume files from and save positions to
+            stats: Stats to record reads and parsing into
+        """
+        self.patterns = list(patterns)
+        self.language = language
+        self.from_start = from_start
+        self.poll_interval = poll_interval
+        self.flush_timeout = flush_timeout
+        self.rescan_interval = rescan_interval
+        self.checkpoints = checkpoints
+        self.stats = stats
+        self.languages: dict[Path, LanguageType] = {}
+        self.files: dict[Path, WatchedFile] = {}
+
+        self._inotify: Optional[Inotify] = None
+        if use_inotify:
+            try:
+                self._inotify = Inotify()
+            except (OSError, AttributeError):
+                # No inotify on this platform; poll instead
+                pass
+
+        self._watched_dirs: dict[int, Path] = {}
+        self._seen: set[tuple[int, int]] = set()
+        self._dirty: set[Path] = set()
+        self._read_all = True
+        self._rescan_due = True
+        self._last_rescan = 0.0
+        self._wake: Optional[asyncio.Event] = None
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Make events() return before its next read."""
+        self._stopped = True
+        if self._wake:
+            self._wake.set()
+
+    def close(self, save: bool = True) -> None:
+        """
+        Save the final positions, then close every file and the inotify descriptor.
+
+        Args:
+            save: Save the positions; pass False if some errors read were
+                never handled, so they are reported again after a restart
+        """
+        if self.checkpoints and save:
+            self.checkpoints.save(force=True)
+        for watched in self.files.values():
+            watched.tailer.close()
+        self.files.clear()
+        if self._inotify:
+            self._inotify.close()
+
+    def flush_all(self) -> list[tuple[Path, ParsedError]]:
+        """Close every open block, e.g. on shutdown."""
+        return [
+            (path, error)
+            for path, watched in self.files.items()
+            for error in watched.flush()
+        ]
+
+    async def events(
+        self, settled: Optional[Callable[[], bool]] = None
+    ) -> AsyncIterator[tuple[Path, ParsedError]]:
+        """
+        Yield errors from all watched files as they are written, until stop().
+
+        Args:
+            settled: Returns True once every error yielded so far has been
+                handled (e.g. Pipeline.idle). Positions are only saved then,
+                so errors still queued downstream are never checkpointed
+                (default: save as soon as they are yielded).
+
+        Yields:
+            Tuples of (file path, ParsedError)
+        """
+        loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        if self._inotify:
+            loop.add_reader(self._inotify.fd, self._on_inotify)
+
+        try:
+            first = True
+            while not self._stopped:
+                # Between reads, the positions match the errors yielded so far
+                if self.checkpoints and (settled is None or settled()):
+                    self.checkpoints.save()
+
+                now = time.monotonic()
+                if self._rescan_due or now - self._last_rescan >= self.rescan_interval:
+                    for event in self._rescan(first):
+                        yield event
+                    first = False
+
+                # Without inotify (or after a missed event) every file is read
+                if self._read_all or self._inotify is None:
+                    paths = list(self.files)
+                    self._read_all = False
+                else:
+                    paths = list(self._dirty)
+                self._dirty.clear()
+
+                for path in paths:
+                    watched = self.files.get(path)
+                    with self.stats.timer('read') if self.stats else nullcontext():
+                        text = watched.tailer.read() if watched else ''
+                    if text:
+                        # Reads are bounded; come back until the file is drained
+                        self._dirty.add(path)
+                        self._seen.add(watched.tailer.identity)
+                        with self.stats.timer('parse') if self.stats else nullcontext():
+                            errors = watched.feed(text)
+                        for error in errors:
+                            yield path, error
+                        if watched.language and path not in self.languages:
+                            self.languages[path] = watched.language
+
+                since_rescan = time.monotonic() - self._last_rescan
+                waits = [self.poll_interval, self.rescan_interval - since_rescan]
+                for path, watched in list(self.files.items()):
+                    for error in watched.flush(self.flush_timeout):
+                        yield path, error
+                    due = watched.time_until_flush(self.flush_timeout)
+                    if due is not None:
+                        waits.append(due)
+
+                self._wake.clear()
+                if self._dirty or self._rescan_due or self._stopped:
+                    continue
+                try:
+                    await asyncio.wait_for(self._wake.wait(), max(min(waits), 0.0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if self._inotify:
+                loop.remove_reader(self._inotify.fd)
+
+    def _on_inotify(self) -> None:
+        """Mark the files named in pending inotify events as dirty."""
+        for wd, mask, name in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                self._read_all = self._rescan_due = True
+                continue
+
+            directory = self._watched_dirs.get(wd)
+            if directory is None or not name:
+                continue
+
+            path = directory / os.fsdecode(name)
+            if path in self.files:
+                self._dirty.add(path)
+            elif mask & (IN_CREATE | IN_MOVED_TO):
+                self._rescan_due = True
+
+        self._wake.set()
+
+    def _rescan(self, initial: bool) -> list[tuple[Path, ParsedError]]:
+        """Start following new matches and stop following removed files."""
+        self._rescan_due = False
+        self._last_rescan = time.monotonic()
+        # Also a safety net for events that were never delivered
+        self._read_all = True
+
+        files, directories = expand_patterns(self.patterns)
+        if self._inotify:
+            watched = set(self._watched_dirs.values())
+            for directory in directories - watched:
+                try:
+                    self._watched_dirs[self._inotify.add_watch(directory)] = directory
+                except OSError:
+                    # Out of watches or gone; the rescan still finds its files
+                    pass
+
+        events: list[tuple[Path, ParsedError]] = []
+        for path in list(self.files):
+            if path not in files and not path.exists():
+                # Deleted or rotated away for good: drain, then stop following
+                watched_file = self.files.pop(path)
+                text = watched_file.tailer.read()
+                errors = watched_file.feed(text) if text else []
+                errors += watched_file.flush()
+                events.extend((path, error) for error in errors)
+                watched_file.tailer.close()
+                if self.checkpoints:
+                    self.checkpoints.forget(path)
+
+        for path in sorted(files - self.files.keys()):
+            errors = self._add(path, self.from_start if initial else True)
+            events.extend((path, error) for error in errors)
+
+        return events
+
+    def _add(self, path: Path, from_start: bool) -> list[ParsedError]:
+        """Start following a file, resuming from its checkpoint if there is one."""
+        try:
+            tailer = FileTailer(path, from_start=from_start, use_inotify=False)
+        except OSError:
+            return []
+
+        pending = self.checkpoints.restore(tailer) if self.checkpoints else None
+        # A file renamed into the pattern was followed already under its old name
+        if pending is None and tailer.identity in self._seen and from_start:
+            tailer.close()
+            tailer = FileTailer(path, from_start=False, use_inotify=False)
+        self._seen.add(tailer.identity)
+
+        language = self.language or self.languages.get(path)
+        if language is None:
+            detected, _ = detect_file_language(path)
+            if detected != LanguageType.UNKNOWN:
+                language = detected
+        if language:
+            self.languages[path] = language
+
+        watched = self.files[path] = WatchedFile(path, tailer, language, self.stats)
+        if self.checkpoints:
+            self.checkpoints.track(tailer, watched.pending_text)
+        return watched.feed(pending) if pending else []
@@ -0,0 +1,309 @@
+"""Bounded, staged asyncio pipeline with explicit overflow policies."""
+
+import asyncio
+import inspect
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterable, Awaitable, Callable, Hashable, Iterable, Optional, Union
+
+# Default capacity of a stage's input queue
+DEFAULT_QUEUE_SIZE = 1000
+
+# Distinct keys a summarizing queue tracks while full; beyond that, items are dropped
+DEFAULT_MAX_SUMMARIES = 1000
+
+
+class OverflowPolicy(str, Enum):
+    """What a full queue does with a new item."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop-oldest"
+    SUMMARIZE = "summarize"
+
+
+class QueueClosedError(Exception):
+    """Raised by StageQueue.get() once the queue is closed and drained."""
+
+
+@dataclass(slots=True)
+class Summary:
+    """Items folded together by a summarizing queue while it was full."""
+
+    key: Hashable
+    exemplar: Any
+    count: int = 1
+    first_seen: float = field(default_factory=time.time)
+    last_seen: float = field(default_factory=time.time)
+
+
+class StageQueue:
+    """
+    Bounded FIFO between two pipeline stages.
+
+    When the queue is full, put() applies the overflow policy:
+
+    - BLOCK waits for space, propagating backpressure upstream.
+    - DROP_OLDEST discards the oldest queued item.
+    - SUMMARIZE folds the new item into a Summary per key instead of
+      queueing it. Summaries re-enter the queue, oldest first, as the
+      consumer frees space, so a storm of repeats costs one slot per key.
+
+    The last two trade completeness for bounded memory: dropped items are
+    gone, and a summary keeps only its first item and a count. Producers
+    are not told, so anything they record as done (such as a watch
+    checkpoint) moves past those items too.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        max_summaries: int = DEFAULT_MAX_SUMMARIES,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued items
+            policy: Overflow policy
+            key: Summary key of an item (required for SUMMARIZE)
+            max_summaries: Maximum number of distinct summary keys
+
+        Raises:
+            ValueError: If SUMMARIZE is used without a key
+        """
+        if policy == OverflowPolicy.SUMMARIZE and key is None:
+            raise ValueError("The summarize policy requires a key function")
+
+        self.maxsize = maxsize
+        self.policy = OverflowPolicy(policy)
+        self.key = key
+        self.max_summaries = max_summaries
+
+        self.put_count = 0
+        self.dropped = 0
+        self.summarized = 0
+
+        self._items: deque[tuple[float, Any]] = deque()
+        self._summaries: OrderedDict[Hashable, Summary] = OrderedDict()
+        self._closed = False
+        self._changed = asyncio.Condition()
+
+    @property
+    def depth(self) -> int:
+        """Number of queued items and pending summaries."""
+        return len(self._items) + len(self._summaries)
+
+    @property
+    def lag(self) -> float:
+        """Seconds the oldest queued item has been waiting."""
+        return time.monotonic() - self._items[0][0] if self._items else 0.0
+
+    async def close(self) -> None:
+        """Mark the end of input; get() raises QueueClosedError once drained."""
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    async def put(self, item: Any) -> None:
+        """
+        Queue an item, applying the overflow policy if the queue is full.
+
+        Args:
+            item: Item to queue
+        """
+        async with self._changed:
+            if len(self._items) >= self.maxsize:
+                if self.policy == OverflowPolicy.BLOCK:
+                    await self._changed.wait_for(lambda: len(self._items) < self.maxsize)
+                elif self.policy == OverflowPolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                else:
+                    self._summarize(item)
+                    return
+
+            self._items.append((time.monotonic(), item))
+            self.put_count += 1
+            self._changed.notify_all()
+
+    async def get(self) -> Any:
+        """
+        Remove and return the next item (a Summary for folded items).
+
+        Raises:
+            QueueClosedError: If the queue is closed and empty
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._items or self._summaries or self._closed)
+
+            if self._items:
+                _, item = self._items.popleft()
+                if self._summaries:
+                    # The freed slot goes to the oldest summary
+                    _, summary = self._summaries.popitem(last=False)
+                    self._items.append((time.monotonic(), summary))
+            elif self._summaries:
+                _, item = self._summaries.popitem(last=False)
+            else:
+                raise QueueClosedError()
+
+            self._changed.notify_all()
+            return item
+
+    def stats(self) -> dict[str, Union[int, float, str]]:
+        """Get queue counters for monitoring."""
+        return {
+            "depth": self.depth,
+            "maxsize": self.maxsize,
+            "lag": round(self.lag, 3),
+            "policy": self.policy.value,
+            "put": self.put_count,
+            "dropped": self.dropped,
+            "summarized": self.summarized,
+        }
+
+    def _summarize(self, item: Any) -> None:
+        """Fold an item that does not fit into its key's summary."""
+        key = self.key(item)
+        summary = self._summaries.get(key)
+        if summary is not None:
+            summary.count += 1
+            summary.last_seen = time.time()
+        elif len(self._summaries) < self.max_summaries:
+            self._summaries[key] = Summary(key, item)
+        else:
+            self.dropped += 1
+            return
+        self.summarized += 1
+
+
+# A stage handler takes one item and returns the items for the next stage
+Handler = Callable[[Any], Union[Optional[Iterable[Any]], Awaitable[Optional[Iterable[Any]]]]]
+
+
+class Stage:
+    """One pipeline step: an input queue drained by one or more workers."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Handler,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        workers: int = 1,
+    ):
+        """
+        Initialize the stage.
+
+        Args:
+            name: Stage name used in stats
+            handler: Sync or async callable processing one item; returns
+                the items to pass to the next stage, or None
+            maxsize: Capacity of the input queue
+            policy: Overflow policy of the input queue
+            key: Summary key for the SUMMARIZE policy
+            workers: Number of concurrent workers
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue = StageQueue(maxsize, policy, key)
+
+        self.processed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        # Items taken from the queue whose outputs are not passed on yet
+        self.active = 0
+        self.last_error: Optional[BaseException] = None
+
+    def stats(self) -> dict[str, Union[int, float, str]]:
+        """Get stage counters, including its input queue's depth and lag."""
+        return {
+            "stage": self.name,
+            **self.queue.stats(),
+            "processed": self.processed,
+            "failed": self.failed,
+            "busy_time": round(self.busy_time, 3),
+        }
+
+    async def _work(self, downstream: Optional['Stage']) -> None:
+        """Process items until the input queue is closed and drained."""
+        while True:
+            try:
+                item = await self.queue.get()
+            except QueueClosedError:
+                return
+
+            self.active += 1
+            start = time.monotonic()
+            try:
+                outputs = self.handler(item)
+                if inspect.isawaitable(outputs):
+                    outputs = await outputs
+            except Exception as e:
+                # A failing notifier or analyzer must not stop ingestion
+                self.failed += 1
+                self.last_error = e
+                outputs = None
+            finally:
+                self.busy_time += time.monotonic() - start
+            self.processed += 1
+
+            if outputs and downstream:
+                for output in outputs:
+                    await downstream.queue.put(output)
+            self.active -= 1
+
+
+class Pipeline:
+    """
+    Stages connected by bounded queues.
+
+    Each stage runs independently, so a slow stage (analysis, webhooks)
+    only fills its own input queue; its overflow policy decides whether
+    that slows the stages before it or sheds load.
+    """
+
+    def __init__(self, stages: list[Stage]):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Stages in processing order
+        """
+        self.stages = stages
+
+    async def run(self, source: AsyncIterable[Any]) -> None:
+        """
+        Feed a source through all stages until it ends and the stages drain.
+
+        Args:
+            source: Items for the first stage
+        """
+        async with asyncio.TaskGroup() as group:
+            workers = [
+                [group.create_task(stage._work(downstream)) for _ in range(stage.workers)]
+                for stage, downstream in zip(self.stages, self.stages[1:] + [None])
+            ]
+
+            async for item in source:
+                await self.stages[0].queue.put(item)
+            await self.stages[0].queue.close()
+
+            # Close each queue once everything upstream of it has finished
+            for stage_workers, downstream in zip(workers, self.stages[1:]):
+                await asyncio.gather(*stage_workers)
+                await downstream.queue.close()
+
+    def idle(self) -> bool:
+        """Check that every item fed so far has been handled by all stages."""
+        return all(not stage.queue.depth and not stage.active for stage in self.stages)
+
+    def stats(self) -> list[dict[str, Union[int, float, str]]]:
+        """Get the counters of every stage."""
+        return [stage.stats() for stage in self.stages]
@@ -0,0 +1,486 @@
+"""Follow a growing log file across appends, truncation and rotation."""
+
+import codecs
+import ctypes
+import hashlib
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+# Bytes read from the file per read() call
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Bytes read per read_lines() call, so a large backlog is consumed in steps
+MAX_READ_SIZE = 16 * READ_CHUNK_SIZE
+
+# Seconds between rotation checks (and between reads when polling)
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Seconds of silence after which an open block is reported as complete
+DEFAULT_FLUSH_TIMEOUT = 1.0
+
+# Leading bytes of a file hashed to recognize it again after a restart
+SIGNATURE_SIZE = 1024
+
+# inotify event masks (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+# Events that concern the directory itself, not a named entry
+WAKE_ALWAYS = IN_Q_OVERFLOW | IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF
+
+# struct inotify_event header: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class PollingWaiter:
+    """Wait a fixed interval between reads; works on every platform and filesystem."""
+
+    def wait(self, timeout: float) -> None:
+        """Sleep for timeout seconds."""
+        time.sleep(timeout)
+
+    def close(self) -> None:
+        pass
+
+
+class Inotify:
+    """
+    Minimal inotify binding via ctypes, without dependencies.
+
+    One instance can watch many directories through a single descriptor,
+    which keeps the per-user inotify instance limit out of reach.
+    """
+
+    def __init__(self):
+        """
+        Create the inotify descriptor.
+
+        Raises:
+            OSError: If inotify is unavailable
+        """
+        # Imported here: ctypes.util loads subprocess and tempfile, which
+        # would slow down the startup of every CLI command
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self.fd = fd
+
+    def add_watch(self, directory: Path, mask: int = WATCH_MASK) -> int:
+        """
+        Watch a directory.
+
+        Args:
+            directory: Directory to watch
+            mask: inotify event mask
+
+        Returns:
+            Watch descriptor reported with the directory's events
+
+        Raises:
+            OSError: If the watch cannot be added
+        """
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed: {os.strerror(errno)}")
+        return wd
+
+    def read_events(self) -> list[tuple[int, int, bytes]]:
+        """
+        Drain pending events without blocking.
+
+        Returns:
+            List of (watch descriptor, mask, entry name) tuples
+        """
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            if not data:
+                return events
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                start = offset + _EVENT_HEADER.size
+                events.append((wd, mask, data[start:start + length].rstrip(b'\0')))
+                offset = start + length
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class InotifyWaiter:
+    """
+    Wait for inotify events on a file.
+
+    The watch is placed on the parent directory so that the file being
+    renamed away, recreated or deleted also wakes the tailer. Events for
+    other entries in the directory are read and ignored.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the watch.
+
+        Args:
+            path: File to watch
+
+        Raises:
+            OSError: If inotify is unavailable
+        """
+        self._inotify = Inotify()
+        try:
+            self._inotify.add_watch(path.parent)
+        except OSError:
+            self._inotify.close()
+            raise
+        self.name = os.fsencode(path.name)
+
+    def wait(self, timeout: float) -> None:
+        """
+        Block until the file changes or timeout seconds pass.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            ready, _, _ = select.select([self._inotify.fd], [], [], remaining)
+            if not ready or self._read_events():
+                return
+
+    def _read_events(self) -> bool:
+        """Drain pending events and report whether any concerns the file."""
+        return any(
+            mask & WAKE_ALWAYS or name == self.name
+            for _, mask, name in self._inotify.read_events()
+        )
+
+    def close(self) -> None:
+        self._inotify.close()
+
+
+def make_waiter(path: Path, use_inotify: bool = True) -> 'InotifyWaiter | PollingWaiter':
+    """
+    Create the cheapest available waiter for a file.
+
+    Args:
+        path: File to watch
+        use_inotify: Try inotify before falling back to polling
+
+    Returns:
+        InotifyWaiter on Linux when available, otherwise PollingWaiter
+    """
+    if use_inotify and sys.platform.startswith('linux'):
+        try:
+            return InotifyWaiter(path)
+        except (OSError, AttributeError):
+            # No inotify (old kernel, seccomp, exhausted watches); fall back
+            pass
+    return PollingWaiter()
+
+
+class FileTailer:
+    """
+    Read lines appended to a log file, like ``tail -F``.
+
+    Only bytes after the last read offset are read. Two kinds of log
+    rotation are handled without losing or repeating lines:
+
+    - copytruncate: the file shrinks below the offset, so reading restarts
+      at the beginning of the same file.
+    - rename: the path points to a new inode. The old file is read to its
+      end through the still-open descriptor, then the new file is opened
+      and read from the beginning.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        from_start: bool = False,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_inotify: bool = True,
+    ):
+        """
+        Initialize the tailer.
+
+        Args:
+            path: Log file to follow
+            from_start: Read existing content instead of starting at the end
+            poll_interval: Seconds between rotation checks when idle
+            use_inotify: Wake on inotify events instead of polling
+        """
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self._waiter = make_waiter(self.path, use_inotify)
+        self._fp = open(self.path, 'rb')
+        self._identity = self._stat_identity(os.fstat(self._fp.fileno()))
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._last_byte = b''
+        self._pending = ''
+
+        if not from_start:
+            self._fp.seek(0, os.SEEK_END)
+        self.offset = self._fp.tell()
+
+    @property
+    def identity(self) -> tuple[int, int]:
+        """(st_dev, st_ino) of the file currently being read."""
+        return self._identity
+
+    @property
+    def closed(self) -> bool:
+        return self._fp.closed
+
+    @property
+    def position(self) -> int:
+        """Byte offset just past the text returned so far in the current file."""
+        # A multi-byte character split by the last read is not returned yet
+        buffered, _ = self._decoder.getstate()
+        return self.offset - len(buffered)
+
+    def signature(self) -> str:
+        """
+        Hash the first bytes of the current file, up to the position.
+
+        Content before the position never changes while the file is only
+        appended to, so a different signature at the same inode means the
+        file was truncated and rewritten, or the inode was reused.
+
+        Returns:
+            Hex digest
+        """
+        return self._head_digest(self.position)
+
+    def restore(self, identity: tuple[int, int], position: int, signature: str) -> bool:
+        """
+        Continue from a position saved by an earlier process.
+
+        If the file at the path is still the saved one, reading resumes at
+        the position. If it was rotated in the meantime, the old file is
+        looked up by identity in the same directory and its remainder is
+        read first; if it is gone, the new file is read from the beginning.
+        A file that was truncated meanwhile is read from the beginning.
+
+        Args:
+            identity: Saved (st_dev, st_ino)
+            position: Saved byte position
+            signature: Saved signature()
+
+        Returns:
+            True if reading resumes in the saved file, False if it restarts
+            at the beginning of the file at the path
+        """
+        self._decoder.reset()
+        self._last_byte = b''
+        self._pending = ''
+
+        if identity == self._identity:
+            resumed = self._matches(position, signature)
+        else:
+            resumed = False
+            old = self._find_rotated(identity)
+            if old is not None:
+                current, self._fp = self._fp, old
+                if self._matches(position, signature):
+                    # Read the rest of the old file; read() then switches to the new one
+                    current.close()
+                    self._identity = identity
+                    resumed = True
+                else:
+                    self._fp = current
+                    old.close()
+
+        self.offset = position if resumed else 0
+        self._fp.seek(self.offset)
+        return resumed
+
+    def __enter__(self) -> 'FileTailer':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the file and the waiter."""
+        self._fp.close()
+        self._waiter.close()
+
+    def follow(self) -> Iterator[str]:
+        """
+        Yield complete lines forever, waiting for new data when idle.
+
+        Yields:
+            Lines without trailing newlines
+        """
+        while True:
+            lines = self.read_lines()
+            if lines:
+                yield from lines
+            else:
+                self.wait()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until the file may have changed.
+
+        Args:
+            timeout: Maximum seconds to wait (default: poll_interval)
+        """
+        self._waiter.wait(self.poll_interval if timeout is None else timeout)
+
+    def read_lines(self) -> list[str]:
+        """
+        Read the complete lines appended since the last call.
+
+        A trailing line without a newline is kept until it is completed
+        (or until its file is rotated away).
+
+        Returns:
+            Lines without trailing newlines
+        """
+        text = self.read()
+        if not text:
+            return []
+
+        lines = (self._pending + text).split('\n')
+        self._pending = lines.pop()
+        return [line.rstrip('\r') for line in lines]
+
+    def read(self) -> str:
+        """
+        Read the text appended since the last call.
+
+        The text may end in the middle of a line. When the file is rotated
+        or truncated in the middle of a line, a newline is added so that
+        the old last line never merges with the new first line.
+
+        Returns:
+            Decoded text, or "" if nothing was appended
+        """
+        data = self._read_available(MAX_READ_SIZE)
+        if len(data) >= MAX_READ_SIZE:
+            # More is waiting; rotation is checked once the backlog is read
+            return self._decode(data)
+
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            # Renamed away and not recreated yet; keep reading the old file
+            return self._decode(data)
+
+        if self._stat_identity(st) != self._identity:
+            # Rename rotation: drain the old file, then switch to the new one
+            data += self._read_available()
+            try:
+                self._reopen()
+            except FileNotFoundError:
+                return self._decode(data)
+
+            text = self._decode(data, final=True) + self._end_line()
+            return text + self._decode(self._read_available(MAX_READ_SIZE))
+
+        if st.st_size < self.offset:
+            # copytruncate: the content before the truncation was read already
+            text = self._decode(data, final=True) + self._end_line()
+            self._fp.seek(0)
+            self.offset = 0
+            return text + self._decode(self._read_available(MAX_READ_SIZE))
+
+        return self._decode(data)
+
+    def _end_line(self) -> str:
+        """Return the newline that terminates an unfinished last line, if any."""
+        unfinished = self._last_byte not in (b'', b'\n')
+        self._last_byte = b''
+        return '\n' if unfinished else ''
+
+    def _read_available(self, limit: Optional[int] = None) -> bytes:
+        """Read from the offset towards the current end of the open file."""
+        chunks = []
+        size = 0
+        while limit is None or size < limit:
+            chunk = self._fp.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+        self.offset += size
+        return b''.join(chunks)
+
+    def _decode(self, data: bytes, final: bool = False) -> str:
+        """Decode bytes, carrying a split multi-byte character to the next read."""
+        if data:
+            self._last_byte = data[-1:]
+        return self._decoder.decode(data, final)
+
+    def _reopen(self) -> None:
+        """Switch to the file now at the path."""
+        fp = open(self.path, 'rb')
+        self._fp.close()
+        self._fp = fp
+        self._identity = self._stat_identity(os.fstat(fp.fileno()))
+        self.offset = 0
+
+    def _matches(self, position: int, signature: str) -> bool:
+        """Check that the current file still holds the saved content."""
+        if os.fstat(self._fp.fileno()).st_size < position:
+            return False
+        return self._head_digest(position) == signature
+
+    def _head_digest(self, position: int) -> str:
+        """Hash the first bytes of the current file, up to a position."""
+        data = os.pread(self._fp.fileno(), min(position, SIGNATURE_SIZE), 0)
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    def _find_rotated(self, identity: tuple[int, int]) -> Optional[BinaryIO]:
+        """Open the file with the given identity next to the path, if any."""
+        try:
+            entries = list(os.scandir(self.path.parent))
+        except OSError:
+            return None
+        for entry in entries:
+            try:
+                if entry.is_file() and self._stat_identity(entry.stat()) == identity:
+                    fp = open(entry.path, 'rb')
+                    if self._stat_identity(os.fstat(fp.fileno())) == identity:
+                        return fp
+                    fp.close()
+            except OSError:
+                continue
+        return None
+
+    @staticmethod
+    def _stat_identity(st: os.stat_result) -> tuple[int, int]:
+        return st.st_dev, st.st_ino
@@ -1,15 +1,40 @@
 """Log parsers for different languages and formats."""
 
-from src.parsers.base import BaseLogParser, ParsedError
-from src.parsers.java import JavaLogParser
-from src.parsers.python import PythonLogParser
-from src.parsers.detector import detect_language, LanguageType
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.parsers.base import BaseLogParser, ParsedError
+    from src.parsers.detector import LanguageType, detect_language
+    from src.parsers.java import JavaLogParser
+    from src.parsers.mixed import MixedLogParser
+    from src.parsers.python import PythonLogParser
+
+# Public names and the modules defining them. They are imported on first
+# access, so importing one parser module does not load every parser.
+_EXPORTS = {
+    "BaseLogParser": "src.parsers.base",
+    "ParsedError": "src.parsers.base",
+    "JavaLogParser": "src.parsers.java",
+    "PythonLogParser": "src.parsers.python",
+    "MixedLogParser": "src.parsers.mixed",
+    "detect_language": "src.parsers.detector",
+    "LanguageType": "src.parsers.detector",
+}
 
 __all__ = [
     "BaseLogParser",
     "ParsedError",
     "JavaLogParser",
     "PythonLogParser",
+    "MixedLogParser",
     "detect_language",
     "LanguageType",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
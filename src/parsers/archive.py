@@ -0,0 +1,187 @@
+"""Streaming parse of compressed and rotated log files."""
+
+import bz2
+import gzip
+import lzma
+import os
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+from src.parsers.base import BaseLogParser, ParsedError
+
+# Magic numbers of the compressed formats the standard library can stream
+COMPRESSION_MAGIC = [
+    (b'\x1f\x8b', gzip.open),
+    (b'BZh', bz2.open),
+    (b'\xfd7zXZ\x00', lzma.open),
+]
+
+# Rotated file names: the live file, numbered and dated (logrotate dateext)
+# rotations, each optionally compressed
+# Examples:
+#   app.log, app.log.1, app.log.2.gz, app.log-20240115.bz2, app.log.3.xz
+ROTATION_PATTERN = re.compile(
+    r'^(?P<base>.+?)(?:[.-](?P<number>\d+))?(?:\.(?:gz|bz2|xz|lzma))?$'
+)
+
+# Rotation numbers with at least this many digits are dates, which grow
+# with time; shorter ones are indexes, which grow with age
+DATE_SUFFIX_DIGITS = 8
+
+# Characters read per call when parsing an archive in a worker
+ARCHIVE_READ_SIZE = 1024 * 1024
+
+
+def is_compressed(path: Path) -> bool:
+    """Check whether a file is gzip, bz2 or xz compressed."""
+    return _opener(path) is not None
+
+
+def open_log(path: Path) -> TextIO:
+    """
+    Open a log file as text, decompressing it on the fly if needed.
+
+    Args:
+        path: Plain, gzip, bz2 or xz log file
+
+    Returns:
+        Text stream that reads decompressed lines incrementally
+    """
+    opener = _opener(path)
+    if opener is None:
+        return open(path, encoding='utf-8', errors='replace')
+    return opener(path, 'rt', encoding='utf-8', errors='replace')
+
+
+def rotation_order(paths: Iterable[Path]) -> list[Path]:
+    """
+    Sort the files of rotation sets from oldest to newest.
+
+    ``app.log.2.gz`` comes before ``app.log.1``, which comes before the
+    live ``app.log``; dated rotations are sorted by date. Files of
+    different sets are grouped by their base name.
+
+    Args:
+        paths: Log files
+
+    Returns:
+        Paths in chronological order
+    """
+    def key(path: Path) -> tuple[str, float]:
+        match = ROTATION_PATTERN.match(path.name)
+        number = match.group('number')
+        if number is None:
+            return str(path.parent / match.group('base')), float('inf')
+        if len(number) >= DATE_SUFFIX_DIGITS:
+            return str(path.parent / match.group('base')), float(number)
+        return str(path.parent / match.group('base')), -float(number)
+
+    return sorted(paths, key=key)
+
+
+def iter_rotation_lines(paths: Iterable[Path]) -> Iterator[str]:
+    """
+    Stream the lines of several (possibly compressed) files as one log.
+
+    Args:
+        paths: Files in chronological order
+
+    Yields:
+        Lines, each ending with a newline
+    """
+    for path in paths:
+        with open_log(path) as fp:
+            for line in fp:
+                # A last line without a newline must not merge with the next file
+                yield line if line.endswith('\n') else line + '\n'
+
+
+def iter_parse_rotation(
+    paths: list[Path],
+    parser: BaseLogParser,
+    jobs: Optional[int] = None,
+) -> Iterator[ParsedError]:
+    """
+    Parse a rotation set as one continuous log, decompressing files in parallel.
+
+    Each file is decompressed and parsed by its own worker. A worker parses
+    from the first block boundary of its file and returns the lines before
+    it together with the block still open at its end; those pieces are
+    stitched in file order through the push parser, so a trace that spans
+    a rotation is parsed whole. The output is identical to iter_parse()
+    over iter_rotation_lines().
+
+    Args:
+        paths: Files in chronological order
+        parser: Parser to run
+        jobs: Number of worker processes (default: CPU count)
+
+    Yields:
+        ParsedError objects in chronological order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(paths) <= 1:
+        yield from parser.iter_parse(iter_rotation_lines(paths))
+        return
+
+    # Only imported for a pool: it loads multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    parser.reset()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as executor:
+        futures = [executor.submit(_parse_archive, path, parser) for path in paths]
+        for future in futures:
+            head, errors, pending, has_boundary = future.result()
+            # The head continues the block left open by the previous file
+            yield from parser.feed(head)
+            if has_boundary:
+                yield from parser.flush()
+                yield from errors
+                parser.feed(pending)
+    yield from parser.flush()
+
+
+def _parse_archive(path: Path, parser: BaseLogParser) -> tuple[str, list[ParsedError], str, bool]:
+    """
+    Parse one file of a rotation set (runs in a worker process).
+
+    Returns:
+        Tuple of (text before the first block boundary, errors completed
+        after it, text of the block still open at the end, whether the
+        file has a block boundary at all)
+    """
+    parser.reset()
+    head: list[str] = []
+    with open_log(path) as fp:
+        for line in fp:
+            if not line.endswith('\n'):
+                line += '\n'
+            if parser._is_block_boundary(line[:-1]):
+                parser.feed(line)
+                break
+            head.append(line)
+        else:
+            return ''.join(head), [], '', False
+
+        errors: list[ParsedError] = []
+        while True:
+            chunk = fp.read(ARCHIVE_READ_SIZE)
+            if not chunk:
+                break
+            errors.extend(parser.feed(chunk))
+
+    if parser._partial_line:
+        # End the unfinished last line, as iter_rotation_lines() does
+        errors.extend(parser.feed('\n'))
+    return ''.join(head), errors, parser.pending_text(), True
+
+
+def _opener(path: Path) -> Optional[Callable[..., TextIO]]:
+    """Get the open function for a compressed file, or None for plain text."""
+    with open(path, 'rb') as fp:
+        magic = fp.read(6)
+    for prefix, opener in COMPRESSION_MAGIC:
+        if magic.startswith(prefix):
+            return opener
+    return None
@@ -1,9 +1,18 @@
 """Base classes for log parsers."""
 
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional
 from enum import Enum
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.parsers.prefilter import LinePrefilter
+
+# Ways of splitting log lines: the LOG_LINE_PATTERN regex, or the
+# linear-time scanner (see src.parsers.scanner)
+PARSER_ENGINES = ('regex', 'scanner')
 
 
 class ErrorSeverity(str, Enum):
@@ -15,7 +24,12 @@ class ErrorSeverity(str, Enum):
     INFO = "info"
 
 
-@dataclass
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Return the shared copy of a repeated string."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class StackFrame:
     """Represents a single frame in a stack trace."""
 
@@ -25,6 +39,12 @@ class StackFrame:
     class_name: Optional[str] = None
     code_context: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # The same frames repeat across thousands of errors; keep one copy
+        self.file_path = _intern(self.file_path)
+        self.method_name = _intern(self.method_name)
+        self.class_name = _intern(self.class_name)
+
     def __str__(self) -> str:
         parts = []
         if self.class_name:
@@ -39,7 +59,7 @@ class StackFrame:
         return "".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedError:
     """Represents a parsed error from log output."""
 
@@ -52,6 +72,15 @@ class ParsedError:
     timestamp: Optional[str] = None
     thread_name: Optional[str] = None
     logger_name: Optional[str] = None
+    # Exception this one was raised from ("Caused by:", "raise ... from ...")
+    cause: Optional['ParsedError'] = None
+    # Exception being handled when this one was raised ("During handling ...")
+    context: Optional['ParsedError'] = None
+
+    def __post_init__(self) -> None:
+        self.error_type = _intern(self.error_type)
+        self.thread_name = _intern(self.thread_name)
+        self.logger_name = _intern(self.logger_name)
 
     @property
     def root_cause_frame(self) -> Optional[StackFrame]:
@@ -70,6 +99,16 @@ class ParsedError:
         frame = self.root_cause_frame
         return frame.line_number if frame else None
 
+    def fingerprint(self, top_frames: int = 5, include_line_numbers: bool = False) -> str:
+        """
+        Get a stable fingerprint of the error type and normalized top frames.
+
+        See src.parsers.fingerprint.compute_fingerprint().
+        """
+        from src.parsers.fingerprint import compute_fingerprint
+
+        return compute_fingerprint(self, top_frames, include_line_numbers)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -93,19 +132,221 @@ class ParsedError:
                 for f in self.stack_frames
             ],
             "raw_text": self.raw_text,
+            "cause": self.cause.to_dict() if self.cause else None,
+            "context": self.context.to_dict() if self.context else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ParsedError':
+        """Rebuild an error from the dictionary made by to_dict()."""
+        return cls(
+            error_type=data["error_type"],
+            message=data["message"],
+            stack_frames=[StackFrame(**frame) for frame in data["stack_frames"]],
+            severity=ErrorSeverity(data["severity"]),
+            raw_text=data["raw_text"],
+            language=data["language"],
+            timestamp=data["timestamp"],
+            thread_name=data["thread_name"],
+            logger_name=data["logger_name"],
+            cause=cls.from_dict(data["cause"]) if data["cause"] else None,
+            context=cls.from_dict(data["context"]) if data["context"] else None,
+        )
+
+
+class LazyParsedError(ParsedError):
+    """
+    ParsedError that decodes its stack frames and raw text on first access.
+
+    Only the header fields are parsed up front. The block is remembered as
+    its source lines plus the (start, end) span, and is handed back to the
+    parser's eager block routine the first time stack_frames, raw_text or
+    the cause chain is read. Counting, grouping and filtering by type or
+    severity never pay for per-frame work.
+    """
+
+    __slots__ = (
+        'source', 'span', '_parser', '_stack_frames', '_raw_text', '_root_frame',
+        '_cause', '_context',
+    )
+
+    def __init__(
+        self,
+        source: list[str],
+        span: tuple[int, int],
+        parser: 'BaseLogParser',
+        **fields: object,
+    ):
+        """
+        Initialize a lazy error.
+
+        Args:
+            source: Lines the block was parsed from
+            span: (start, end) line offsets of the block in source
+            parser: Parser whose _decode_block() rebuilds the block
+            **fields: ParsedError fields other than stack_frames, raw_text,
+                cause and context
+        """
+        ParsedError.__init__(self, **fields)
+        self.source: Optional[list[str]] = source
+        self.span = span
+        self._parser: Optional[BaseLogParser] = parser
+        self._stack_frames: Optional[list[StackFrame]] = None
+        self._raw_text: Optional[str] = None
+        self._root_frame: Optional[StackFrame] = None
+
+    @property
+    def stack_frames(self) -> list[StackFrame]:
+        """Stack frames, decoded from the source on first access."""
+        if self._stack_frames is None:
+            self._decode()
+        return self._stack_frames
+
+    @stack_frames.setter
+    def stack_frames(self, value: list[StackFrame]) -> None:
+        self._stack_frames = value
+
+    @property
+    def raw_text(self) -> str:
+        """Raw block text, joined from the source on first access."""
+        if self._raw_text is None:
+            self._decode()
+        return self._raw_text
+
+    @raw_text.setter
+    def raw_text(self, value: str) -> None:
+        self._raw_text = value
+
+    @property
+    def cause(self) -> Optional[ParsedError]:
+        """Cause of the error, decoded from the source on first access."""
+        if self.source is not None:
+            self._decode()
+        return self._cause
+
+    @cause.setter
+    def cause(self, value: Optional[ParsedError]) -> None:
+        self._cause = value
+
+    @property
+    def context(self) -> Optional[ParsedError]:
+        """Context of the error, decoded from the source on first access."""
+        if self.source is not None:
+            self._decode()
+        return self._context
+
+    @context.setter
+    def context(self, value: Optional[ParsedError]) -> None:
+        self._context = value
+
+    @property
+    def root_cause_frame(self) -> Optional[StackFrame]:
+        """Get the root cause frame, decoding as little of the block as possible."""
+        if self._stack_frames is not None or self.source is None:
+            return self._stack_frames[0] if self._stack_frames else None
+
+        if self._root_frame is None:
+            self._root_frame = self._parser._decode_root_frame(self.source, self.span[0])
+        return self._root_frame
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the header fields and only the block's own lines, undecoded.
+
+        Errors returned from worker processes stay lazy, and the rest of
+        the segment they were parsed from is not copied along with them.
+        """
+        fields = {name: getattr(self, name) for name in _LAZY_HEADER_FIELDS}
+        fields['cause'], fields['context'] = self._cause, self._context
+        decoded = (self._stack_frames, self._raw_text)
+        if self.source is None:
+            return _unpickle_lazy, (None, self.span, None, fields, decoded)
+
+        start, end = self.span
+        block = self.source[start:end]
+        return _unpickle_lazy, (block, (0, end - start), self._parser, fields, decoded)
+
+    def _decode(self) -> None:
+        """Parse the block eagerly and release the source lines."""
+        if self.source is None:
+            return
+
+        error = self._parser._decode_block(self.source, self.span[0])
+        if self._stack_frames is None:
+            self._stack_frames = error.stack_frames if error else []
+        if self._raw_text is None:
+            self._raw_text = error.raw_text if error else ""
+        if error:
+            self._cause = self._cause or error.cause
+            self._context = self._context or error.context
+        self.source = None
+        self._parser = None
+
+
+# ParsedError fields a LazyParsedError sets up front
+_LAZY_HEADER_FIELDS = (
+    'error_type', 'message', 'severity', 'language', 'timestamp', 'thread_name',
+    'logger_name',
+)
+
+
+def _unpickle_lazy(
+    source: Optional[list[str]],
+    span: tuple[int, int],
+    parser: Optional['BaseLogParser'],
+    fields: dict,
+    decoded: tuple[Optional[list[StackFrame]], Optional[str]],
+) -> LazyParsedError:
+    """Rebuild a LazyParsedError pickled by its __reduce__()."""
+    error = LazyParsedError(source, span, parser, **fields)
+    error._stack_frames, error._raw_text = decoded
+    return error
+
 
 class BaseLogParser(ABC):
     """Abstract base class for log parsers."""
 
+    # Literal substrings that every line able to start an error contains.
+    # Lines without any of them can only be parsed as part of a nearby block.
+    # An empty tuple means every line is a candidate.
+    ERROR_MARKERS: tuple[str, ...] = ()
+
+    # Pattern for the log lines of this parser's format, and a scanner
+    # returning the same groups in linear time
+    LOG_LINE_PATTERN: Optional[re.Pattern] = None
+    LOG_LINE_SCANNER: Optional[Callable[[str], Optional[tuple]]] = None
+
+    def __init__(
+        self,
+        prefilter: Optional[LinePrefilter] = None,
+        lazy: bool = False,
+        engine: str = 'regex',
+    ):
+        """
+        Initialize the parser.
+
+        Args:
+            prefilter: Literal pre-filter run before any regex
+                (default: one built from ERROR_MARKERS)
+            lazy: Return LazyParsedError objects whose stack frames and
+                raw text are decoded on first access
+            engine: How log lines are split, one of PARSER_ENGINES. The
+                scanner gives the same results as the regex but never
+                backtracks, so pathological lines cannot stall the parse.
+        """
+        if engine not in PARSER_ENGINES:
+            raise ValueError(f"Unknown parser engine: {engine}")
+        self.prefilter = prefilter or LinePrefilter(self.ERROR_MARKERS)
+        self.lazy = lazy
+        self.engine = engine
+        self.reset()
+
     @property
     @abstractmethod
     def language(self) -> str:
         """Return the language this parser handles."""
         pass
 
-    @abstractmethod
     def parse(self, log_text: str) -> list[ParsedError]:
         """
         Parse log text and extract errors.
@@ -113,11 +354,192 @@ class BaseLogParser(ABC):
         Args:
             log_text: Raw log text to parse
 
+        Returns:
+            List of ParsedError objects
+        """
+        return list(self.iter_parse(log_text.strip().split('\n')))
+
+    def iter_parse(self, lines: Iterable[str]) -> Iterator[ParsedError]:
+        """
+        Parse log lines lazily, yielding errors as each block completes.
+
+        Lines are grouped into segments that start at a line which cannot
+        continue the block before it (see ``_is_block_boundary``). A segment
+        is parsed as soon as the next one starts, so memory stays proportional
+        to the largest single stack trace rather than to the whole input.
+
+        Segments without a pre-filter candidate line are dropped without
+        running any parser regex. A header is never a boundary, so the log
+        line introducing it always shares its segment.
+
+        Args:
+            lines: Iterable of log lines, e.g. an open text file.
+                A trailing newline on each line is ignored.
+
+        Yields:
+            ParsedError objects in input order
+        """
+        is_candidate = self.prefilter.is_candidate
+        segment: list[str] = []
+        has_candidate = False
+
+        for line in lines:
+            if line.endswith('\n'):
+                line = line[:-1]
+            if segment and self._is_block_boundary(line):
+                if has_candidate:
+                    yield from self._parse_lines(segment)
+                segment = []
+                has_candidate = False
+            segment.append(line)
+            if not has_candidate:
+                has_candidate = is_candidate(line)
+
+        if has_candidate:
+            yield from self._parse_lines(segment)
+
+    def reset(self) -> None:
+        """Discard the state kept by feed() for an unfinished block."""
+        self._partial_line: list[str] = []
+        self._segment: list[str] = []
+        self._segment_has_candidate = False
+        self._last_feed = time.monotonic()
+
+    def feed(self, chunk: str) -> list[ParsedError]:
+        """
+        Push a chunk of log text and return the errors it completes.
+
+        The chunk may end anywhere, even in the middle of a line. Complete
+        lines are segmented exactly like iter_parse(); the unfinished line
+        and the block that is still open are kept until a later chunk (or
+        flush()) completes them, so each call costs O(len(chunk)).
+
+        Args:
+            chunk: Next piece of log text
+
+        Returns:
+            ParsedError objects completed by this chunk, in input order
+        """
+        if not chunk:
+            return []
+        self._last_feed = time.monotonic()
+
+        if '\n' not in chunk:
+            self._partial_line.append(chunk)
+            return []
+
+        lines = chunk.split('\n')
+        if self._partial_line:
+            self._partial_line.append(lines[0])
+            lines[0] = ''.join(self._partial_line)
+        last = lines.pop()
+        self._partial_line = [last] if last else []
+
+        errors: list[ParsedError] = []
+        is_candidate = self.prefilter.is_candidate
+        for line in lines:
+            if line.endswith('\r'):
+                line = line[:-1]
+            if self._segment and self._is_block_boundary(line):
+                if self._segment_has_candidate:
+                    errors.extend(self._parse_lines(self._segment))
+                self._segment = []
+                self._segment_has_candidate = False
+            self._segment.append(line)
+            if not self._segment_has_candidate:
+                self._segment_has_candidate = is_candidate(line)
+
+        return errors
+
+    def flush(self, timeout: Optional[float] = None) -> list[ParsedError]:
+        """
+        Force-close the block kept open by feed().
+
+        Without a timeout this ends the stream: the open block and any
+        unfinished last line are parsed. With a timeout, the open block is
+        closed only if nothing was fed for that many seconds, so a trace
+        at the end of a quiet log is reported without waiting for the next
+        line; an unfinished last line is kept.
+
+        Args:
+            timeout: Seconds of inactivity after which to close the block
+
+        Returns:
+            ParsedError objects from the closed block
+        """
+        if timeout is not None and time.monotonic() - self._last_feed < timeout:
+            return []
+
+        if timeout is None and self._partial_line:
+            line = ''.join(self._partial_line)
+            self._partial_line = []
+            errors = self.feed(line + '\n')
+        else:
+            errors = []
+
+        if self._segment_has_candidate:
+            errors.extend(self._parse_lines(self._segment))
+        self._segment = []
+        self._segment_has_candidate = False
+        return errors
+
+    def time_until_flush(self, timeout: float) -> Optional[float]:
+        """
+        Get the seconds until flush(timeout) would close the open block.
+
+        Args:
+            timeout: Inactivity timeout that will be passed to flush()
+
+        Returns:
+            Seconds to wait (0 if due now), or None if no block is open
+        """
+        if not self._segment_has_candidate:
+            return None
+        return max(timeout - (time.monotonic() - self._last_feed), 0.0)
+
+    def pending_text(self) -> str:
+        """
+        Get the text fed but not parsed yet (the open block and unfinished line).
+
+        Feeding it to a freshly reset parser restores the state of feed(),
+        so the state can be saved and resumed by another process.
+
+        Returns:
+            Pending text
+        """
+        return ''.join(line + '\n' for line in self._segment) + ''.join(self._partial_line)
+
+    @abstractmethod
+    def _parse_lines(self, lines: list[str]) -> list[ParsedError]:
+        """
+        Parse a list of log lines and extract errors.
+
+        Args:
+            lines: Log lines without trailing newlines
+
         Returns:
             List of ParsedError objects
         """
         pass
 
+    @abstractmethod
+    def _is_block_boundary(self, line: str) -> bool:
+        """
+        Check if a line can safely start a new segment.
+
+        A boundary line must never be consumed by a block that started on an
+        earlier line, and must never change how the line before it is parsed
+        (e.g. a log line followed by an exception header). Returning False is
+        always safe; it only makes segments larger.
+
+        Args:
+            line: Log line without trailing newline
+
+        Returns:
+            True if parsing may restart at this line
+        """
+        pass
+
     @abstractmethod
     def can_parse(self, log_text: str) -> bool:
         """
@@ -131,6 +553,104 @@ class BaseLogParser(ABC):
         """
         pass
 
+    def _split_log_line(self, line: str) -> Optional[tuple[Optional[str], ...]]:
+        """
+        Split a log line into the groups of LOG_LINE_PATTERN.
+
+        Lines with embedded newlines, which the line splitting never
+        produces, always go to the regex since its ``$`` treats them specially.
+
+        Args:
+            line: Stripped log line
+
+        Returns:
+            The groups, or None if the line is not a log line
+        """
+        if self.engine == 'scanner' and self.LOG_LINE_SCANNER and '\n' not in line:
+            return self.LOG_LINE_SCANNER(line)
+        if self.LOG_LINE_PATTERN is None:
+            return None
+        log_match = self.LOG_LINE_PATTERN.match(line)
+        return log_match.groups() if log_match else None
+
+    def _match_log_line(self, line: str) -> Optional[dict[str, Optional[str]]]:
+        """
+        Match a log line in this parser's format.
+
+        Args:
+            line: Stripped log line
+
+        Returns:
+            Block context (timestamp, thread_name, logger_name) if the line
+            is a log line, otherwise None
+        """
+        return None
+
+    def _match_block_start(self, lines: list[str], idx: int) -> bool:
+        """
+        Check if a block this parser owns starts at idx.
+
+        Used by MixedLogParser to pick a parser per block.
+
+        Args:
+            lines: List of log lines
+            idx: Index of the candidate header line
+
+        Returns:
+            True if _parse_block() should handle the block
+        """
+        return False
+
+    def _parse_block(
+        self,
+        lines: list[str],
+        start_idx: int,
+        timestamp: Optional[str] = None,
+        thread_name: Optional[str] = None,
+        logger_name: Optional[str] = None,
+    ) -> tuple[Optional[ParsedError], int]:
+        """
+        Parse the block starting at start_idx.
+
+        Returns:
+            Tuple of (parsed error or None, next index to process)
+        """
+        return None, start_idx + 1
+
+    def _decode_block(self, lines: list[str], start_idx: int) -> Optional[ParsedError]:
+        """
+        Eagerly parse a block recorded by a LazyParsedError.
+
+        Args:
+            lines: Source lines of the block
+            start_idx: Index of the block's first line
+
+        Returns:
+            Fully parsed error
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support lazy parsing")
+
+    def _decode_root_frame(self, lines: list[str], start_idx: int) -> Optional[StackFrame]:
+        """
+        Decode only the root cause frame of a block recorded by a LazyParsedError.
+
+        Parsers can override this to stop at the first frame.
+        """
+        error = self._decode_block(lines, start_idx)
+        return error.root_cause_frame if error else None
+
+    def _parse_standalone(self, line: str) -> Optional[ParsedError]:
+        """
+        Parse a single line that reports an error without a stack trace.
+
+        Args:
+            line: Log line
+
+        Returns:
+            ParsedError or None
+        """
+        return None
+
     def _extract_multiline_block(
         self,
         lines: list[str],
@@ -2,7 +2,9 @@
 
 import re
 from enum import Enum
-from typing import Optional
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, Optional
 
 from src.parsers.base import BaseLogParser
 
@@ -12,6 +14,7 @@ class LanguageType(str, Enum):
 
     JAVA = "java"
     PYTHON = "python"
+    MIXED = "mixed"
     UNKNOWN = "unknown"
 
 
@@ -45,69 +48,204 @@ PYTHON_PATTERNS = [
     (r'^\s{4,}\w+', 2),
 ]
 
+# Matches beyond this many per pattern do not add to the score
+MAX_MATCHES_PER_PATTERN = 3
 
-def detect_language(log_text: str) -> LanguageType:
+# Minimum score required to report a language
+MIN_SCORE = 5
+
+# Characters taken from each of the head, middle and tail of large inputs
+DEFAULT_SAMPLE_SIZE = 256 * 1024
+
+# Characters read from the start of a stream of lines for detection
+STREAM_HEAD_SIZE = 1024 * 1024
+
+# All patterns compiled once, strongest first, so a decisive lead shows up early
+_COMPILED_PATTERNS = sorted(
+    [
+        (re.compile(pattern, re.MULTILINE | re.IGNORECASE), weight, language)
+        for patterns, language in (
+            (JAVA_PATTERNS, LanguageType.JAVA),
+            (PYTHON_PATTERNS, LanguageType.PYTHON),
+        )
+        for pattern, weight in patterns
+    ],
+    key=lambda item: -item[1],
+)
+
+
+def detect_language(log_text: str, sample_size: int = DEFAULT_SAMPLE_SIZE) -> LanguageType:
     """
     Detect the programming language from log text.
 
     Args:
         log_text: Raw log text to analyze
+        sample_size: Characters to sample from each of the head, middle
+            and tail of large inputs
 
     Returns:
         LanguageType indicating the detected language
     """
+    return detect_language_with_confidence(log_text, sample_size)[0]
+
+
+def detect_language_with_confidence(
+    log_text: str,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> tuple[LanguageType, float]:
+    """
+    Detect the programming language from log text, with a confidence value.
+
+    Inputs longer than three sample windows are reduced to their head,
+    middle and tail. Scoring stops as soon as the remaining patterns can no
+    longer change the result.
+
+    Args:
+        log_text: Raw log text to analyze
+        sample_size: Characters to sample from each of the head, middle
+            and tail of large inputs
+
+    Returns:
+        Tuple of (detected language, confidence between 0.0 and 1.0).
+        The confidence is the winning language's share of the combined
+        score, and 0.0 for UNKNOWN.
+    """
     if not log_text or not log_text.strip():
-        return LanguageType.UNKNOWN
+        return LanguageType.UNKNOWN, 0.0
 
-    java_score = _calculate_score(log_text, JAVA_PATTERNS)
-    python_score = _calculate_score(log_text, PYTHON_PATTERNS)
+    if len(log_text) > 3 * sample_size:
+        head = log_text[:sample_size]
+        middle_start = (len(log_text) - sample_size) // 2
+        middle = log_text[middle_start:middle_start + sample_size]
+        tail = log_text[-sample_size:]
+        log_text = _join_windows(head, middle, tail)
 
-    # Require minimum confidence
-    min_score = 5
+    return _score_text(log_text)
 
-    if java_score >= min_score and java_score > python_score:
-        return LanguageType.JAVA
-    elif python_score >= min_score and python_score > java_score:
-        return LanguageType.PYTHON
-    elif java_score >= min_score:
+
+def detect_file_language(
+    path: Path,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> tuple[LanguageType, float]:
+    """
+    Detect the programming language of a log file without reading all of it.
+
+    Args:
+        path: Path to the log file
+        sample_size: Bytes to read from each of the head, middle and tail
+
+    Returns:
+        Tuple of (detected language, confidence between 0.0 and 1.0)
+    """
+    with open(path, 'rb') as fp:
+        size = fp.seek(0, 2)
+        fp.seek(0)
+        if size <= 3 * sample_size:
+            text = fp.read().decode('utf-8', errors='replace')
+            return detect_language_with_confidence(text, sample_size)
+
+        windows = []
+        for offset in (0, (size - sample_size) // 2, size - sample_size):
+            fp.seek(offset)
+            windows.append(fp.read(sample_size).decode('utf-8', errors='replace'))
+
+    return _score_text(_join_windows(*windows))
+
+
+def read_head(lines: Iterator[str], max_chars: int = STREAM_HEAD_SIZE) -> list[str]:
+    """
+    Read whole lines from an iterator until at least max_chars are buffered.
+
+    Only this bounded head of a stream is kept in memory for detection;
+    parse chain(head, lines) afterwards.
+
+    Args:
+        lines: Log lines, e.g. an open text file
+        max_chars: Characters to read
+
+    Returns:
+        The lines read, each ending with a newline
+    """
+    head: list[str] = []
+    size = 0
+    for line in lines:
+        if not line.endswith("\n"):
+            line += "\n"
+        head.append(line)
+        size += len(line)
+        if size >= max_chars:
+            break
+    return head
+
+
+def _join_windows(head: str, middle: str, tail: str) -> str:
+    """Join sample windows, dropping the partial lines at their cut edges."""
+    head = head.rpartition('\n')[0]
+    middle = middle.partition('\n')[2].rpartition('\n')[0]
+    tail = tail.partition('\n')[2]
+    return '\n'.join((head, middle, tail))
+
+
+def _score_text(text: str) -> tuple[LanguageType, float]:
+    """Score text against all patterns, stopping once the result is decided."""
+    scores = {LanguageType.JAVA: 0, LanguageType.PYTHON: 0}
+    remaining = {
+        LanguageType.JAVA: MAX_MATCHES_PER_PATTERN * sum(w for _, w in JAVA_PATTERNS),
+        LanguageType.PYTHON: MAX_MATCHES_PER_PATTERN * sum(w for _, w in PYTHON_PATTERNS),
+    }
+
+    for pattern, weight, language in _COMPILED_PATTERNS:
+        # Add weight for each match, but cap at 3x the base weight
+        matches = sum(1 for _ in islice(pattern.finditer(text), MAX_MATCHES_PER_PATTERN))
+        scores[language] += matches * weight
+        remaining[language] -= MAX_MATCHES_PER_PATTERN * weight
+
+        java, python = scores[LanguageType.JAVA], scores[LanguageType.PYTHON]
+        if java >= MIN_SCORE and java >= python + remaining[LanguageType.PYTHON]:
+            break
+        if python >= MIN_SCORE and python > java + remaining[LanguageType.JAVA]:
+            break
+
+    java, python = scores[LanguageType.JAVA], scores[LanguageType.PYTHON]
+    language = _decide(java, python)
+    if language == LanguageType.UNKNOWN:
+        return language, 0.0
+    return language, scores[language] / (java + python)
+
+
+def _decide(java_score: int, python_score: int) -> LanguageType:
+    """Pick a language from the final scores, preferring Java on ties."""
+    if java_score >= MIN_SCORE and java_score >= python_score:
         return LanguageType.JAVA
-    elif python_score >= min_score:
+    elif python_score >= MIN_SCORE:
         return LanguageType.PYTHON
 
     return LanguageType.UNKNOWN
 
 
-def _calculate_score(text: str, patterns: list[tuple[str, int]]) -> int:
-    """Calculate confidence score for a language based on pattern matches."""
-    score = 0
-    for pattern, weight in patterns:
-        matches = re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
-        if matches:
-            # Add weight for each match, but cap at 3x the base weight
-            score += min(len(matches) * weight, weight * 3)
-    return score
-
-
-def get_parser_for_language(language: LanguageType) -> Optional[BaseLogParser]:
+def get_parser_for_language(language: LanguageType, **options: Any) -> Optional[BaseLogParser]:
     """
     Get the appropriate parser for a language.
 
     Args:
         language: The detected or specified language
+        **options: Parser options, e.g. lazy=True
 
     Returns:
         Parser instance or None if no parser available
     """
     from src.parsers.java import JavaLogParser
+    from src.parsers.mixed import MixedLogParser
     from src.parsers.python import PythonLogParser
 
     parsers = {
         LanguageType.JAVA: JavaLogParser,
         LanguageType.PYTHON: PythonLogParser,
+        LanguageType.MIXED: MixedLogParser,
     }
 
     parser_class = parsers.get(language)
-    return parser_class() if parser_class else None
+    return parser_class(**options) if parser_class else None
 
 
 def auto_parse(log_text: str) -> tuple[LanguageType, list]:
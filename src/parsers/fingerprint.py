@@ -0,0 +1,173 @@
+"""Stable error fingerprints and streaming aggregation by fingerprint."""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from src.parsers.base import ParsedError, StackFrame
+
+# Number of frames from the top of the stack that identify an error
+DEFAULT_TOP_FRAMES = 5
+
+# Runtime-generated class and method name parts that change between
+# deployments or JVM runs
+# Examples:
+#   com.example.Foo$$Lambda$123/0x0000000800c4b440 -> com.example.Foo$$Lambda
+#   UserService$$EnhancerBySpringCGLIB$$a1b2c3d4   -> UserService
+#   UserService$$SpringCGLIB$$0                    -> UserService
+#   com.sun.proxy.$Proxy123                        -> com.sun.proxy.$Proxy
+#   jdk.internal.reflect.GeneratedMethodAccessor42 -> jdk.internal.reflect.GeneratedMethodAccessor
+#   lambda$handle$3                                -> lambda$handle
+GENERATED_NAME_PATTERNS = [
+    (re.compile(r'\$\$Lambda(?:\$\d+)?(?:/(?:0x)?[0-9a-fA-F]+)?'), '$$Lambda'),
+    (re.compile(r'\$\$(?:EnhancerBy|FastClassBy)\w*?\$\$\w+'), ''),
+    (re.compile(r'\$\$SpringCGLIB\$\$\w+'), ''),
+    (re.compile(r'\$HibernateProxy\$\w+'), ''),
+    (re.compile(r'\$Proxy\d+'), '$Proxy'),
+    (re.compile(r'(Generated(?:Serialization)?(?:Method|Constructor)Accessor)\d+'), r'\1'),
+    (re.compile(r'(lambda\$\w+?)\$\d+'), r'\1'),
+]
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """
+    Strip generated lambda, proxy and bytecode-enhancer parts from a name.
+
+    Args:
+        name: Class or method name
+
+    Returns:
+        Normalized name ("" for None)
+    """
+    if not name or ('$' not in name and 'Generated' not in name):
+        return name or ""
+
+    for pattern, replacement in GENERATED_NAME_PATTERNS:
+        name = pattern.sub(replacement, name)
+    return name
+
+
+def _frame_key(frame: StackFrame, include_line_numbers: bool) -> str:
+    """Build the normalized identity of one frame."""
+    key = (
+        f"{normalize_name(frame.class_name)}.{normalize_name(frame.method_name)}"
+        f"@{frame.file_path}"
+    )
+    if include_line_numbers and frame.line_number is not None:
+        key += f":{frame.line_number}"
+    return key
+
+
+def compute_fingerprint(
+    error: ParsedError,
+    top_frames: int = DEFAULT_TOP_FRAMES,
+    include_line_numbers: bool = False,
+) -> str:
+    """
+    Compute a stable fingerprint for an error.
+
+    The fingerprint hashes the error type and the normalized top frames.
+    Messages, timestamps and threads are ignored, so every occurrence of
+    the same failure gets the same fingerprint. Line numbers are left out
+    by default so a redeploy with unrelated edits keeps the fingerprint.
+
+    Args:
+        error: Parsed error
+        top_frames: Number of frames from the top of the stack to include
+        include_line_numbers: Include frame line numbers
+
+    Returns:
+        16-character hex digest
+    """
+    parts = [normalize_name(error.error_type)]
+    parts.extend(
+        _frame_key(frame, include_line_numbers)
+        for frame in error.stack_frames[:top_frames]
+    )
+    digest = hashlib.blake2b('\n'.join(parts).encode('utf-8'), digest_size=8)
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class ErrorGroup:
+    """All occurrences of one fingerprint, kept as a single exemplar."""
+
+    fingerprint: str
+    exemplar: ParsedError
+    count: int = 1
+    first_seen: Optional[str] = None
+    last_seen: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+            "error": self.exemplar.to_dict(),
+        }
+
+
+class ErrorGrouper:
+    """
+    Streaming aggregation of errors by fingerprint.
+
+    Only the first occurrence of each fingerprint is kept, so memory is
+    proportional to the number of distinct errors, not to occurrences.
+    """
+
+    def __init__(
+        self,
+        top_frames: int = DEFAULT_TOP_FRAMES,
+        include_line_numbers: bool = False,
+    ):
+        """
+        Initialize the grouper.
+
+        Args:
+            top_frames: Number of top frames used for fingerprints
+            include_line_numbers: Include frame line numbers in fingerprints
+        """
+        self.top_frames = top_frames
+        self.include_line_numbers = include_line_numbers
+        self.total = 0
+        self._groups: dict[str, ErrorGroup] = {}
+
+    def add(self, error: ParsedError) -> ErrorGroup:
+        """
+        Record one occurrence of an error.
+
+        Args:
+            error: Parsed error
+
+        Returns:
+            The group the error was added to
+        """
+        self.total += 1
+        key = error.fingerprint(self.top_frames, self.include_line_numbers)
+
+        group = self._groups.get(key)
+        if group is None:
+            group = ErrorGroup(key, error, first_seen=error.timestamp, last_seen=error.timestamp)
+            self._groups[key] = group
+        else:
+            group.count += 1
+            if error.timestamp:
+                group.last_seen = error.timestamp
+                group.first_seen = group.first_seen or error.timestamp
+        return group
+
+    def add_all(self, errors: Iterable[ParsedError]) -> 'ErrorGrouper':
+        """Record every error from an iterable and return self."""
+        for error in errors:
+            self.add(error)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __iter__(self) -> Iterator[ErrorGroup]:
+        """Iterate over groups in order of first occurrence."""
+        return iter(self._groups.values())
@@ -3,12 +3,22 @@
 import re
 from typing import Optional
 
-from src.parsers.base import BaseLogParser, ParsedError, StackFrame, ErrorSeverity
+from src.parsers.base import (
+    BaseLogParser,
+    ErrorSeverity,
+    LazyParsedError,
+    ParsedError,
+    StackFrame,
+)
+from src.parsers.scanner import scan_java_log_line
 
 
 class JavaLogParser(BaseLogParser):
     """Parser for Java stack traces and log output."""
 
+    # Every exception header contains one of these
+    ERROR_MARKERS = ('Exception', 'Error', 'Throwable')
+
     # Pattern for Java exception header
     # Examples:
     #   java.lang.NullPointerException: message
@@ -26,7 +36,7 @@ class JavaLogParser(BaseLogParser):
     #   at com.example.MyClass.myMethod(Unknown Source)
     #   at com.example.MyClass.myMethod(Native Method)
     STACK_FRAME_PATTERN = re.compile(
-        r'^\s+at\s+'
+        r'^\s*at\s+'
         r'([\w.$<>]+)\.'  # class name
         r'([\w$<>]+)'      # method name
         r'\('
@@ -42,6 +52,9 @@ class JavaLogParser(BaseLogParser):
         r'(?::\s*(.*))?$'
     )
 
+    # Pattern for "... N more" lines (the last N frames equal the enclosing trace's)
+    MORE_PATTERN = re.compile(r'^\s*\.\.\.\s*(\d+)\s+more\s*$')
+
     # Pattern for log4j/logback style log lines
     LOG_LINE_PATTERN = re.compile(
         r'^(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}(?:[.,]\d{3})?)\s*'  # timestamp
@@ -50,6 +63,7 @@ class JavaLogParser(BaseLogParser):
         r'(?:([\w.]+)\s*[-:]?\s*)?'  # optional logger name
         r'(.*)$'  # message
     )
+    LOG_LINE_SCANNER = staticmethod(scan_java_log_line)
 
     @property
     def language(self) -> str:
@@ -60,8 +74,8 @@ class JavaLogParser(BaseLogParser):
         # Check for common Java patterns
         patterns = [
             r'at\s+[\w.$]+\.\w+\([^)]+\.java:\d+\)',  # stack frame
-            r'[\w.$]+(?:Exception|Error):',  # exception with message
-            r'^[\w.$]+(?:Exception|Error)$',  # exception without message
+            r'(?:[\w$]+\.)+[\w$]*(?:Exception|Error):',  # exception with message
+            r'^(?:[\w$]+\.)+[\w$]*(?:Exception|Error)$',  # exception without message
             r'Caused by:',  # caused by clause
         ]
 
@@ -70,10 +84,9 @@ class JavaLogParser(BaseLogParser):
                 return True
         return False
 
-    def parse(self, log_text: str) -> list[ParsedError]:
-        """Parse Java log text and extract errors."""
+    def _parse_lines(self, lines: list[str]) -> list[ParsedError]:
+        """Parse Java log lines and extract errors."""
         errors: list[ParsedError] = []
-        lines = log_text.strip().split('\n')
 
         i = 0
         while i < len(lines):
@@ -85,14 +98,14 @@ class JavaLogParser(BaseLogParser):
                 continue
 
             # Try to match log line format first (log4j/logback style)
-            log_match = self.LOG_LINE_PATTERN.match(line)
-            if log_match:
-                timestamp, thread, level, logger, message = log_match.groups()
+            log_fields = self._split_log_line(line)
+            if log_fields:
+                timestamp, thread, level, logger, message = log_fields
 
                 # Check if this log line contains an exception
                 exc_match = self.EXCEPTION_HEADER_PATTERN.match(message)
                 if exc_match:
-                    error, next_idx = self._parse_exception_block(
+                    error, next_idx = self._parse_block(
                         lines, i,
                         timestamp=timestamp,
                         thread_name=thread,
@@ -107,7 +120,7 @@ class JavaLogParser(BaseLogParser):
                 if i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
                     if self.EXCEPTION_HEADER_PATTERN.match(next_line):
-                        error, next_idx = self._parse_exception_block(
+                        error, next_idx = self._parse_block(
                             lines, i + 1,
                             timestamp=timestamp,
                             thread_name=thread,
@@ -124,7 +137,7 @@ class JavaLogParser(BaseLogParser):
             # Try to match exception header directly
             exc_match = self.EXCEPTION_HEADER_PATTERN.match(line)
             if exc_match:
-                error, next_idx = self._parse_exception_block(lines, i)
+                error, next_idx = self._parse_block(lines, i)
                 if error:
                     errors.append(error)
                 i = next_idx
@@ -134,6 +147,90 @@ class JavaLogParser(BaseLogParser):
 
         return errors
 
+    def _match_log_line(self, line: str) -> Optional[dict[str, Optional[str]]]:
+        """Match a log4j/logback style log line."""
+        log_fields = self._split_log_line(line)
+        if not log_fields:
+            return None
+
+        timestamp, thread, _, logger, _ = log_fields
+        return {"timestamp": timestamp, "thread_name": thread, "logger_name": logger}
+
+    def _match_block_start(self, lines: list[str], idx: int) -> bool:
+        """Check for an exception header that is clearly Java."""
+        exc_match = self.EXCEPTION_HEADER_PATTERN.match(lines[idx].strip())
+        if not exc_match:
+            return False
+
+        # Qualified class names and thread prefixes are Java-only; a bare
+        # "ValueError: ..." counts only when followed by an "at" frame
+        thread, error_type, _ = exc_match.groups()
+        if thread or '.' in error_type:
+            return True
+        return idx + 1 < len(lines) and bool(
+            self.STACK_FRAME_PATTERN.match(lines[idx + 1].strip())
+        )
+
+    def _parse_block(
+        self,
+        lines: list[str],
+        start_idx: int,
+        timestamp: Optional[str] = None,
+        thread_name: Optional[str] = None,
+        logger_name: Optional[str] = None,
+    ) -> tuple[Optional[ParsedError], int]:
+        """Parse an exception block, lazily if the parser is in lazy mode."""
+        parse = self._parse_exception_header if self.lazy else self._parse_exception_block
+        return parse(
+            lines, start_idx,
+            timestamp=timestamp,
+            thread_name=thread_name,
+            logger_name=logger_name,
+        )
+
+    def _decode_block(self, lines: list[str], start_idx: int) -> Optional[ParsedError]:
+        """Eagerly parse a block recorded by a LazyParsedError."""
+        error, _ = self._parse_exception_block(lines, start_idx)
+        return error
+
+    def _decode_root_frame(self, lines: list[str], start_idx: int) -> Optional[StackFrame]:
+        """Decode frames only until the first one that names a source file."""
+        for current_line in lines[start_idx + 1:]:
+            stripped = current_line.strip()
+
+            frame_match = self.STACK_FRAME_PATTERN.match(stripped)
+            if frame_match:
+                frame = self._make_frame(frame_match)
+                if frame:
+                    return frame
+                continue
+
+            if self.CAUSED_BY_PATTERN.match(stripped):
+                break
+
+            if self.MORE_PATTERN.match(current_line):
+                continue
+
+            if stripped and not stripped.startswith('at '):
+                break
+
+        return None
+
+    def _is_block_boundary(self, line: str) -> bool:
+        """Check if a line can neither continue a trace nor start one after a log line."""
+        if not line or line[0].isspace():
+            return False
+
+        stripped = line.rstrip()
+        if not stripped or stripped.startswith(('at', '...', 'Caused by')):
+            return False
+
+        # Exception headers always contain a marker
+        if not self.prefilter.is_candidate(stripped):
+            return True
+
+        return not self.EXCEPTION_HEADER_PATTERN.match(stripped)
+
     def _parse_exception_block(
         self,
         lines: list[str],
@@ -152,65 +249,150 @@ class JavaLogParser(BaseLogParser):
 
         thread_from_header, error_type, message = exc_match.groups()
         thread_name = thread_name or thread_from_header
-        message = message or ""
 
-        # Collect raw text and stack frames
-        raw_lines = [lines[start_idx]]
-        stack_frames: list[StackFrame] = []
+        # One (error type, message, frames, raw lines) entry per trace in the
+        # cause chain. Frames without a source file are kept as None so that
+        # "... N more" counts line up with the enclosing trace.
+        chain: list[tuple[str, str, list[Optional[StackFrame]], list[str]]] = [
+            (error_type, message or "", [], [lines[start_idx]])
+        ]
 
         i = start_idx + 1
         while i < len(lines):
             current_line = lines[i]
             stripped = current_line.strip()
+            _, _, frames, raw_lines = chain[-1]
 
             # Check for stack frame
             frame_match = self.STACK_FRAME_PATTERN.match(stripped)
             if frame_match:
-                class_name, method_name, file_name, line_num = frame_match.groups()
-
-                # Skip "Unknown Source" and "Native Method"
-                if file_name not in ("Unknown Source", "Native Method"):
-                    stack_frames.append(StackFrame(
-                        file_path=file_name,
-                        line_number=int(line_num) if line_num else None,
-                        method_name=method_name,
-                        class_name=class_name,
-                    ))
-
+                frames.append(self._make_frame(frame_match))
                 raw_lines.append(current_line)
                 i += 1
                 continue
 
-            # Check for "Caused by" - stop here, it's a separate error
-            if self.CAUSED_BY_PATTERN.match(stripped):
-                break
+            # Check for "Caused by" - it starts the next trace in the chain
+            cause_match = self.CAUSED_BY_PATTERN.match(stripped)
+            if cause_match:
+                cause_type, cause_message = cause_match.groups()
+                chain.append((cause_type, cause_message or "", [], [current_line]))
+                i += 1
+                continue
 
-            # Check for "... N more" lines
-            if re.match(r'^\s*\.\.\.\s*\d+\s+more\s*$', current_line):
+            # Check for "... N more" lines; share the enclosing trace's frames
+            more_match = self.MORE_PATTERN.match(current_line)
+            if more_match:
+                count = int(more_match.group(1))
+                if count and len(chain) > 1:
+                    frames.extend(chain[-2][2][-count:])
                 raw_lines.append(current_line)
                 i += 1
                 continue
 
             # If we encounter something else, stop parsing this block
-            if stripped and not stripped.startswith('\t') and not stripped.startswith('at '):
+            if stripped and not stripped.startswith('at '):
                 break
 
             i += 1
 
+        # Link the chain from the innermost cause outwards; the log line
+        # context belongs to the outermost error only
+        error: Optional[ParsedError] = None
+        for error_type, message, frames, raw_lines in chain[:0:-1]:
+            error = ParsedError(
+                error_type=error_type,
+                message=message,
+                stack_frames=[frame for frame in frames if frame],
+                severity=self._determine_severity(error_type),
+                raw_text='\n'.join(raw_lines),
+                language=self.language,
+                cause=error,
+            )
+
+        error_type, message, frames, raw_lines = chain[0]
         error = ParsedError(
             error_type=error_type,
             message=message,
-            stack_frames=stack_frames,
+            stack_frames=[frame for frame in frames if frame],
             severity=self._determine_severity(error_type),
             raw_text='\n'.join(raw_lines),
             language=self.language,
             timestamp=timestamp,
             thread_name=thread_name,
             logger_name=logger_name,
+            cause=error,
         )
 
         return error, i
 
+    def _parse_exception_header(
+        self,
+        lines: list[str],
+        start_idx: int,
+        timestamp: Optional[str] = None,
+        thread_name: Optional[str] = None,
+        logger_name: Optional[str] = None,
+    ) -> tuple[Optional[ParsedError], int]:
+        """Parse only the header of an exception block and defer the frames."""
+        exc_match = self.EXCEPTION_HEADER_PATTERN.match(lines[start_idx].strip())
+        if not exc_match:
+            return None, start_idx + 1
+
+        thread_from_header, error_type, message = exc_match.groups()
+        end = self._find_block_end(lines, start_idx)
+
+        error = LazyParsedError(
+            lines, (start_idx, end), self,
+            error_type=error_type,
+            message=message or "",
+            severity=self._determine_severity(error_type),
+            language=self.language,
+            timestamp=timestamp,
+            thread_name=thread_name or thread_from_header,
+            logger_name=logger_name,
+        )
+
+        return error, end
+
+    def _find_block_end(self, lines: list[str], start_idx: int) -> int:
+        """Find where _parse_exception_block() would stop, without building frames."""
+        i = start_idx + 1
+        while i < len(lines):
+            current_line = lines[i]
+            stripped = current_line.strip()
+
+            # Blank lines and "at " lines never end a block; frames rarely need the regex
+            if not stripped or stripped.startswith('at '):
+                i += 1
+                continue
+
+            if (
+                self.STACK_FRAME_PATTERN.match(stripped)
+                or self.CAUSED_BY_PATTERN.match(stripped)
+                or self.MORE_PATTERN.match(current_line)
+            ):
+                i += 1
+                continue
+
+            break
+
+        return i
+
+    def _make_frame(self, frame_match: re.Match) -> Optional[StackFrame]:
+        """Build a frame from a STACK_FRAME_PATTERN match."""
+        class_name, method_name, file_name, line_num = frame_match.groups()
+
+        # Skip "Unknown Source" and "Native Method"
+        if file_name in ("Unknown Source", "Native Method"):
+            return None
+
+        return StackFrame(
+            file_path=file_name,
+            line_number=int(line_num) if line_num else None,
+            method_name=method_name,
+            class_name=class_name,
+        )
+
     def _determine_severity(self, error_type: str) -> ErrorSeverity:
         """Determine error severity based on exception type."""
         critical_types = [
@@ -0,0 +1,122 @@
+"""Memory-mapped parsing for multi-GB log files."""
+
+import mmap
+import re
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from src.parsers.base import BaseLogParser, ParsedError
+
+
+def iter_parse_mapped(
+    path: Path,
+    parser: BaseLogParser,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[ParsedError]:
+    """
+    Parse a log file through a read-only memory map.
+
+    The mapped buffer is scanned with a bytes pattern built from the markers
+    of the parser's pre-filter. Only the segment around each hit is decoded and handed to
+    the parser, so INFO noise is never decoded or copied. Segments are the
+    same ones iter_parse() would build, so the results are identical.
+
+    Args:
+        path: Path to the log file
+        parser: Parser to run on candidate segments
+        start: Byte offset to start at; must be the start of a line
+        end: Byte offset to stop at (default: end of file); must be the
+            start of a segment, e.g. from split_file()
+
+    Yields:
+        ParsedError objects in file order
+    """
+    with open(path, 'rb') as fp:
+        size = fp.seek(0, 2)
+        end = size if end is None else min(end, size)
+
+        # Empty files cannot be mapped
+        if start >= end:
+            return
+
+        if not parser.prefilter.markers:
+            yield from parser.iter_parse(iter_decoded_lines(fp, start, end))
+            return
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            markers = _compile_markers(parser.prefilter.markers)
+            yield from _scan(buffer, parser, markers, start, end)
+
+
+def iter_decoded_lines(fp: BinaryIO, start: int, end: int) -> Iterator[str]:
+    """
+    Read and decode the lines of a binary file between two byte offsets.
+
+    Args:
+        fp: File opened in binary mode
+        start: Offset of the first line
+        end: Offset to stop at; lines starting before it are read in full
+
+    Yields:
+        Decoded lines without line terminators
+    """
+    fp.seek(start)
+    pos = start
+    while pos < end:
+        line = fp.readline()
+        if not line:
+            return
+        pos += len(line)
+        yield line.decode('utf-8', errors='replace').rstrip('\r\n')
+
+
+def _compile_markers(markers: tuple[str, ...]) -> re.Pattern[bytes]:
+    """Compile literal markers into a single bytes pattern."""
+    return re.compile(b'|'.join(re.escape(m.encode('utf-8')) for m in markers))
+
+
+def _scan(
+    buffer: mmap.mmap,
+    parser: BaseLogParser,
+    marker_pattern: re.Pattern[bytes],
+    pos: int,
+    size: int,
+) -> Iterator[ParsedError]:
+    """Decode and parse only the segments between pos and size that contain a marker."""
+    while pos < size:
+        match = marker_pattern.search(buffer, pos, size)
+        if not match:
+            return
+
+        # Walk back to the start of the segment holding the marker. The
+        # previous segment ended at pos, which is itself a segment start.
+        start = buffer.rfind(b'\n', pos, match.start()) + 1 or pos
+        while start > pos and not _is_boundary(buffer, start, parser):
+            start = buffer.rfind(b'\n', pos, start - 1) + 1 or pos
+
+        # Walk forward to the next line that starts a new segment
+        end = min(_next_line(buffer, match.start()), size)
+        while end < size and not _is_boundary(buffer, end, parser):
+            end = min(_next_line(buffer, end), size)
+
+        text = buffer[start:end].decode('utf-8', errors='replace')
+        lines = text.split('\n')
+        if text.endswith('\n'):
+            lines.pop()
+        yield from parser._parse_lines([line.rstrip('\r') for line in lines])
+
+        pos = end
+
+
+def _next_line(buffer: mmap.mmap, pos: int) -> int:
+    """Return the offset of the line after the one containing pos."""
+    newline = buffer.find(b'\n', pos)
+    return len(buffer) if newline < 0 else newline + 1
+
+
+def _is_boundary(buffer: mmap.mmap, start: int, parser: BaseLogParser) -> bool:
+    """Check if the line starting at the given offset starts a new segment."""
+    end = buffer.find(b'\n', start)
+    raw = buffer[start:end if end >= 0 else len(buffer)]
+    return parser._is_block_boundary(raw.decode('utf-8', errors='replace').rstrip('\r'))
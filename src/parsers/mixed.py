@@ -0,0 +1,123 @@
+"""Single-pass parser for logs that interleave several languages."""
+
+from typing import Optional
+
+from src.parsers.base import BaseLogParser, ParsedError
+from src.parsers.java import JavaLogParser
+from src.parsers.prefilter import LinePrefilter
+from src.parsers.python import PythonLogParser
+
+
+class MixedLogParser(BaseLogParser):
+    """
+    Parser that dispatches each block to the parser of its language.
+
+    Lines are walked once. Each block header (a Java exception header or a
+    Python ``Traceback`` line) is claimed by the first registered parser whose
+    _match_block_start() accepts it, and that parser's block routine parses
+    the block. Errors keep the language of the parser that produced them.
+    """
+
+    def __init__(
+        self,
+        parsers: Optional[list[BaseLogParser]] = None,
+        prefilter: Optional[LinePrefilter] = None,
+        lazy: bool = False,
+        engine: str = 'regex',
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            parsers: Parsers to dispatch to, in priority order
+                (default: Java and Python)
+            prefilter: Literal pre-filter (default: union of the parsers' markers)
+            lazy: Create the default parsers in lazy mode
+            engine: Log line engine of the default parsers
+        """
+        self.parsers = parsers or [
+            JavaLogParser(lazy=lazy, engine=engine),
+            PythonLogParser(lazy=lazy, engine=engine),
+        ]
+
+        # Union of the sub-parsers' markers, keeping their order
+        markers: dict[str, None] = {}
+        for parser in self.parsers:
+            if not parser.prefilter.markers:
+                markers.clear()
+                break
+            markers.update(dict.fromkeys(parser.prefilter.markers))
+        self.ERROR_MARKERS = tuple(markers)
+        super().__init__(prefilter, lazy, engine)
+
+    @property
+    def language(self) -> str:
+        return "mixed"
+
+    def can_parse(self, log_text: str) -> bool:
+        """Check if any registered parser can handle the log text."""
+        return any(parser.can_parse(log_text) for parser in self.parsers)
+
+    def _parse_lines(self, lines: list[str]) -> list[ParsedError]:
+        """Parse interleaved log lines in a single pass."""
+        errors: list[ParsedError] = []
+
+        i = 0
+        while i < len(lines):
+            stripped = lines[i].strip()
+
+            # Skip empty lines
+            if not stripped:
+                i += 1
+                continue
+
+            # A log line may introduce a block on the next line
+            context = self._match_log_line(stripped)
+            block_idx = i if context is None else i + 1
+
+            parser = self._find_block_parser(lines, block_idx)
+            if parser:
+                error, next_idx = parser._parse_block(lines, block_idx, **(context or {}))
+                if error:
+                    errors.append(error)
+                i = next_idx
+                continue
+
+            if context is None:
+                error = self._parse_standalone(lines[i])
+                if error:
+                    errors.append(error)
+
+            i += 1
+
+        return errors
+
+    def _find_block_parser(self, lines: list[str], idx: int) -> Optional[BaseLogParser]:
+        """Find the parser that owns a block starting at idx."""
+        if idx >= len(lines):
+            return None
+
+        for parser in self.parsers:
+            if parser._match_block_start(lines, idx):
+                return parser
+        return None
+
+    def _match_log_line(self, line: str) -> Optional[dict[str, Optional[str]]]:
+        """Match a log line in any registered format."""
+        for parser in self.parsers:
+            context = parser._match_log_line(line)
+            if context is not None:
+                return context
+        return None
+
+    def _parse_standalone(self, line: str) -> Optional[ParsedError]:
+        """Parse a single-line error with the first parser that accepts it."""
+        for parser in self.parsers:
+            error = parser._parse_standalone(line)
+            if error:
+                return error
+        return None
+
+    def _is_block_boundary(self, line: str) -> bool:
+        """Check if no registered parser could continue a block at this line."""
+        return all(parser._is_block_boundary(line) for parser in self.parsers)
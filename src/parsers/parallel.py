@@ -0,0 +1,118 @@
+"""Multi-core parsing of large log files split into byte ranges."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
+from src.parsers.base import BaseLogParser, ParsedError
+from src.parsers.mapped import iter_decoded_lines, iter_parse_mapped
+
+# Ranges per worker, so a few slow ranges do not leave cores idle
+CHUNKS_PER_JOB = 4
+
+# Files smaller than this are parsed serially
+MIN_CHUNK_SIZE = 1024 * 1024
+
+
+def split_file(path: Path, parser: BaseLogParser, chunks: int) -> list[tuple[int, int]]:
+    """
+    Split a log file into byte ranges that can be parsed independently.
+
+    Each nominal split point is moved forward to the start of the next line
+    that is a block boundary for the parser (not an ``at ...`` frame,
+    ``File "..."`` line, ``Caused by:``, ``... N more`` or exception line).
+    iter_parse() starts a new segment at every such line, so parsing the
+    ranges separately gives exactly the same errors as parsing the file.
+
+    Args:
+        path: Path to the log file
+        parser: Parser whose block boundaries are used
+        chunks: Desired number of ranges
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file in order
+    """
+    size = path.stat().st_size
+    offsets = [0]
+
+    with open(path, 'rb') as fp:
+        for k in range(1, max(chunks, 1)):
+            nominal = size * k // chunks
+            if nominal <= offsets[-1]:
+                continue
+
+            # Skip the (possibly partial) line at the nominal offset
+            fp.seek(nominal)
+            fp.readline()
+
+            while True:
+                pos = fp.tell()
+                line = fp.readline()
+                if not line:
+                    pos = size
+                    break
+                decoded = line.decode('utf-8', errors='replace').rstrip('\r\n')
+                if parser._is_block_boundary(decoded):
+                    break
+
+            if offsets[-1] < pos < size:
+                offsets.append(pos)
+
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+def iter_parse_parallel(
+    path: Path,
+    parser: BaseLogParser,
+    jobs: Optional[int] = None,
+    use_mmap: bool = False,
+) -> Iterator[ParsedError]:
+    """
+    Parse a log file on multiple cores.
+
+    The file is split with split_file(), each range is parsed in a process
+    pool with the given parser, and the results are yielded in file order.
+    The output is identical to iter_parse() over the same file.
+
+    Args:
+        path: Path to the log file
+        parser: Parser to run in each worker
+        jobs: Number of worker processes (default: CPU count)
+        use_mmap: Parse each range with iter_parse_mapped()
+
+    Yields:
+        ParsedError objects in file order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    size = path.stat().st_size
+    chunks = min(jobs * CHUNKS_PER_JOB, size // MIN_CHUNK_SIZE)
+
+    if jobs <= 1 or chunks <= 1:
+        yield from _parse_range(path, parser, 0, size, use_mmap)
+        return
+
+    ranges = split_file(path, parser, chunks)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(_parse_range, path, parser, start, end, use_mmap)
+            for start, end in ranges
+        ]
+        for future in futures:
+            yield from future.result()
+
+
+def _parse_range(
+    path: Path,
+    parser: BaseLogParser,
+    start: int,
+    end: int,
+    use_mmap: bool,
+) -> list[ParsedError]:
+    """Parse one byte range of a file (runs in a worker process)."""
+    if use_mmap:
+        return list(iter_parse_mapped(path, parser, start, end))
+
+    with open(path, 'rb') as fp:
+        return list(parser.iter_parse(iter_decoded_lines(fp, start, end)))
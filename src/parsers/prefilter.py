@@ -0,0 +1,34 @@
+"""Literal pre-filter that finds lines which may start an error."""
+
+import re
+from typing import Callable, Iterable, Optional
+
+
+class LinePrefilter:
+    """
+    Cheap literal scan run on every line before any parser regex.
+
+    A line is a candidate if it contains one of the markers. The markers
+    must appear in every line that can start an error (an exception header,
+    ``Traceback`` line or standalone exception line), so non-candidate lines
+    only matter as neighbours of a candidate. An empty marker set makes
+    every line a candidate, which disables the pre-filter.
+    """
+
+    def __init__(self, markers: Iterable[str]):
+        """
+        Initialize the pre-filter.
+
+        Args:
+            markers: Literal substrings that mark candidate lines
+        """
+        self.markers = tuple(dict.fromkeys(markers))
+        # A literal alternation; with no markers the empty pattern matches
+        # every line. A compiled pattern pickles, so worker processes get
+        # the same scan.
+        self.is_candidate: Callable[[str], Optional[re.Match[str]]] = re.compile(
+            "|".join(re.escape(marker) for marker in self.markers)
+        ).search
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.markers!r})"
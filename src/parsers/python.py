@@ -3,12 +3,25 @@
 import re
 from typing import Optional
 
-from src.parsers.base import BaseLogParser, ParsedError, StackFrame, ErrorSeverity
+from src.parsers.base import (
+    BaseLogParser,
+    ErrorSeverity,
+    LazyParsedError,
+    ParsedError,
+    StackFrame,
+)
+from src.parsers.scanner import scan_python_log_line
 
 
 class PythonLogParser(BaseLogParser):
     """Parser for Python stack traces and log output."""
 
+    # Traceback headers and valid exception types contain one of these
+    ERROR_MARKERS = (
+        'Traceback', 'Error', 'Exception', 'Warning',
+        'KeyboardInterrupt', 'SystemExit', 'GeneratorExit', 'StopIteration',
+    )
+
     # Pattern for Python traceback header
     TRACEBACK_HEADER_PATTERN = re.compile(
         r'^Traceback \(most recent call last\):$'
@@ -36,6 +49,16 @@ class PythonLogParser(BaseLogParser):
         r'^([\w.]+(?:Error|Exception|Warning)?):?\s*(.*)$'
     )
 
+    # Separators printed between chained tracebacks, mapped to the
+    # ParsedError attribute that links the earlier exception
+    # Examples:
+    #   The above exception was the direct cause of the following exception:
+    #   During handling of the above exception, another exception occurred:
+    CHAIN_SEPARATORS = {
+        'The above exception': 'cause',
+        'During handling of': 'context',
+    }
+
     # Pattern for Python logging module format
     # Examples:
     #   2024-01-15 10:30:45,123 - ERROR - module_name - message
@@ -48,6 +71,7 @@ class PythonLogParser(BaseLogParser):
         r'(?:([\w.]+)\s*[-\s]*)?'  # optional logger name
         r'(.*)$'  # message
     )
+    LOG_LINE_SCANNER = staticmethod(scan_python_log_line)
 
     @property
     def language(self) -> str:
@@ -67,10 +91,9 @@ class PythonLogParser(BaseLogParser):
                 return True
         return False
 
-    def parse(self, log_text: str) -> list[ParsedError]:
-        """Parse Python log text and extract errors."""
+    def _parse_lines(self, lines: list[str]) -> list[ParsedError]:
+        """Parse Python log lines and extract errors."""
         errors: list[ParsedError] = []
-        lines = log_text.strip().split('\n')
 
         i = 0
         while i < len(lines):
@@ -83,15 +106,15 @@ class PythonLogParser(BaseLogParser):
                 continue
 
             # Check for logging format
-            log_match = self.LOG_LINE_PATTERN.match(stripped)
-            if log_match:
-                timestamp, level, logger, message = log_match.groups()
+            log_fields = self._split_log_line(stripped)
+            if log_fields:
+                timestamp, level, logger, message = log_fields
 
                 # Check if next line is a traceback
                 if i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
                     if self.TRACEBACK_HEADER_PATTERN.match(next_line):
-                        error, next_idx = self._parse_traceback_block(
+                        error, next_idx = self._parse_block(
                             lines, i + 1,
                             timestamp=timestamp,
                             logger_name=logger
@@ -106,23 +129,15 @@ class PythonLogParser(BaseLogParser):
 
             # Check for traceback header
             if self.TRACEBACK_HEADER_PATTERN.match(stripped):
-                error, next_idx = self._parse_traceback_block(lines, i)
+                error, next_idx = self._parse_block(lines, i)
                 if error:
                     errors.append(error)
                 i = next_idx
                 continue
 
             # Check for standalone exception line (without traceback)
-            exc_match = self.EXCEPTION_LINE_PATTERN.match(stripped)
-            if exc_match and self._is_valid_exception_type(exc_match.group(1)):
-                error = ParsedError(
-                    error_type=exc_match.group(1),
-                    message=exc_match.group(2) or "",
-                    stack_frames=[],
-                    severity=self._determine_severity(exc_match.group(1)),
-                    raw_text=line,
-                    language=self.language,
-                )
+            error = self._parse_standalone(line)
+            if error:
                 errors.append(error)
                 i += 1
                 continue
@@ -131,6 +146,76 @@ class PythonLogParser(BaseLogParser):
 
         return errors
 
+    def _match_log_line(self, line: str) -> Optional[dict[str, Optional[str]]]:
+        """Match a logging module style log line."""
+        log_fields = self._split_log_line(line)
+        if not log_fields:
+            return None
+
+        timestamp, _, logger, _ = log_fields
+        return {"timestamp": timestamp, "thread_name": None, "logger_name": logger}
+
+    def _match_block_start(self, lines: list[str], idx: int) -> bool:
+        """Check for a traceback header."""
+        return bool(self.TRACEBACK_HEADER_PATTERN.match(lines[idx].strip()))
+
+    def _parse_block(
+        self,
+        lines: list[str],
+        start_idx: int,
+        timestamp: Optional[str] = None,
+        thread_name: Optional[str] = None,
+        logger_name: Optional[str] = None,
+    ) -> tuple[Optional[ParsedError], int]:
+        """Parse a traceback block; Python tracebacks carry no thread name."""
+        parse = self._parse_traceback_header if self.lazy else self._parse_traceback_block
+        return parse(
+            lines, start_idx,
+            timestamp=timestamp,
+            logger_name=logger_name,
+        )
+
+    def _decode_block(self, lines: list[str], start_idx: int) -> Optional[ParsedError]:
+        """Eagerly parse a block recorded by a LazyParsedError."""
+        error, _ = self._parse_traceback_block(lines, start_idx)
+        return error
+
+    def _parse_standalone(self, line: str) -> Optional[ParsedError]:
+        """Parse an exception line that appears without a traceback."""
+        exc_match = self.EXCEPTION_LINE_PATTERN.match(line.strip())
+        if not exc_match or not self._is_valid_exception_type(exc_match.group(1)):
+            return None
+
+        return ParsedError(
+            error_type=exc_match.group(1),
+            message=exc_match.group(2) or "",
+            stack_frames=[],
+            severity=self._determine_severity(exc_match.group(1)),
+            raw_text=line,
+            language=self.language,
+        )
+
+    def _is_block_boundary(self, line: str) -> bool:
+        """Check if a line can neither continue a traceback nor start one after a log line."""
+        if not line or line[0].isspace():
+            return False
+
+        stripped = line.rstrip()
+        if not stripped or stripped.startswith(
+            ('File "', 'During handling', 'The above exception')
+        ):
+            return False
+
+        # Traceback headers and exception lines always contain a marker
+        if not self.prefilter.is_candidate(stripped):
+            return True
+
+        if self.TRACEBACK_HEADER_PATTERN.match(stripped):
+            return False
+
+        exc_match = self.EXCEPTION_LINE_PATTERN.match(stripped)
+        return not (exc_match and self._is_valid_exception_type(exc_match.group(1)))
+
     def _parse_traceback_block(
         self,
         lines: list[str],
@@ -138,7 +223,65 @@ class PythonLogParser(BaseLogParser):
         timestamp: Optional[str] = None,
         logger_name: Optional[str] = None,
     ) -> tuple[Optional[ParsedError], int]:
-        """Parse a traceback block starting at start_idx."""
+        """
+        Parse a traceback block and any tracebacks chained after it.
+
+        Python prints the earliest exception of a chain first, so the error
+        returned is the last one, linked to the earlier ones through cause
+        and context.
+        """
+        error, i = self._parse_single_traceback(lines, start_idx, timestamp, logger_name)
+
+        while error:
+            link, next_idx = self._match_chain_link(lines, i)
+            if not link:
+                break
+
+            chained, end = self._parse_single_traceback(lines, next_idx, timestamp, logger_name)
+            if not chained:
+                break
+
+            # The log line context belongs to the outermost error only
+            error.timestamp = error.logger_name = None
+            setattr(chained, link, error)
+            error, i = chained, end
+
+        return error, i
+
+    def _match_chain_link(self, lines: list[str], idx: int) -> tuple[Optional[str], int]:
+        """
+        Match a chain separator followed by another traceback header.
+
+        Returns:
+            Tuple of ("cause" or "context", index of the next traceback
+            header), or (None, idx) if no chained traceback follows
+        """
+        i = idx
+        while i < len(lines) and not lines[i].strip():
+            i += 1
+        stripped = lines[i].strip() if i < len(lines) else ""
+        link = next(
+            (attr for prefix, attr in self.CHAIN_SEPARATORS.items() if stripped.startswith(prefix)),
+            None,
+        )
+        if not link:
+            return None, idx
+
+        i += 1
+        while i < len(lines) and not lines[i].strip():
+            i += 1
+        if i < len(lines) and self.TRACEBACK_HEADER_PATTERN.match(lines[i].strip()):
+            return link, i
+        return None, idx
+
+    def _parse_single_traceback(
+        self,
+        lines: list[str],
+        start_idx: int,
+        timestamp: Optional[str] = None,
+        logger_name: Optional[str] = None,
+    ) -> tuple[Optional[ParsedError], int]:
+        """Parse one traceback starting at start_idx."""
         raw_lines = [lines[start_idx]]
         stack_frames: list[StackFrame] = []
 
@@ -233,6 +376,101 @@ class PythonLogParser(BaseLogParser):
 
         return None, i
 
+    def _parse_traceback_header(
+        self,
+        lines: list[str],
+        start_idx: int,
+        timestamp: Optional[str] = None,
+        logger_name: Optional[str] = None,
+    ) -> tuple[Optional[ParsedError], int]:
+        """Parse only the exception line of a traceback and defer the frames."""
+        end, exc_match, has_frames = self._find_traceback_end(lines, start_idx)
+
+        if exc_match:
+            error_type = exc_match.group(1)
+            message = exc_match.group(2) or ""
+            severity = self._determine_severity(error_type)
+        elif has_frames:
+            error_type, message, severity = "Unknown", "Incomplete traceback", ErrorSeverity.ERROR
+        else:
+            return None, end
+
+        error = LazyParsedError(
+            lines, (start_idx, end), self,
+            error_type=error_type,
+            message=message,
+            severity=severity,
+            language=self.language,
+            timestamp=timestamp,
+            logger_name=logger_name,
+        )
+
+        return error, end
+
+    def _find_traceback_end(
+        self,
+        lines: list[str],
+        start_idx: int,
+    ) -> tuple[int, Optional[re.Match], bool]:
+        """
+        Find where _parse_traceback_block() would stop, without building frames.
+
+        Returns:
+            Tuple of (next index, exception line match or None, whether any
+            frame was seen) for the last traceback of the chain
+        """
+        end, exc_match, has_frames = self._find_single_traceback_end(lines, start_idx)
+
+        while exc_match or has_frames:
+            link, next_idx = self._match_chain_link(lines, end)
+            if not link:
+                break
+
+            chained = self._find_single_traceback_end(lines, next_idx)
+            if not (chained[1] or chained[2]):
+                break
+
+            end, exc_match, has_frames = chained
+
+        return end, exc_match, has_frames
+
+    def _find_single_traceback_end(
+        self,
+        lines: list[str],
+        start_idx: int,
+    ) -> tuple[int, Optional[re.Match], bool]:
+        """Find where _parse_single_traceback() would stop."""
+        has_frames = False
+
+        i = start_idx + 1
+        while i < len(lines):
+            line = lines[i]
+            stripped = line.strip()
+
+            if self.STACK_FRAME_PATTERN.match(stripped):
+                has_frames = True
+                i += 1
+                continue
+
+            if has_frames and self.CODE_CONTEXT_PATTERN.match(line):
+                i += 1
+                continue
+
+            exc_match = self.EXCEPTION_LINE_PATTERN.match(stripped)
+            if exc_match and self._is_valid_exception_type(exc_match.group(1)):
+                return i + 1, exc_match, has_frames
+
+            if stripped.startswith(('During handling of', 'The above exception')):
+                break
+
+            if not stripped:
+                i += 1
+                continue
+
+            break
+
+        return i, None, has_frames
+
     def _is_valid_exception_type(self, type_name: str) -> bool:
         """Check if the type name looks like a valid Python exception."""
         # Must end with Error, Exception, or Warning (or be a known type)
@@ -0,0 +1,147 @@
+"""
+Linear-time scanners for log line headers.
+
+The LOG_LINE_PATTERN regexes of the parsers chain several optional groups
+and whitespace runs (``\\s*[-\\s]*``, ``\\s*(?:\\[...\\])?\\s*``). When a long
+line almost matches, the regex engine tries every way of splitting those
+runs before giving up, which is quadratic in the line length: a timestamp
+followed by 64 KB of padding takes over a minute. The scanners below walk
+the header tokens once and return exactly the groups the regex would.
+
+Runs of one character class are measured with tiny regexes such as
+``\\s*``; a single repeated class always matches and so never backtracks.
+"""
+
+import re
+from typing import Optional
+
+# Levels in the order the LOG_LINE_PATTERN alternations try them
+JAVA_LEVELS = ('ERROR', 'WARN', 'INFO', 'DEBUG', 'TRACE')
+PYTHON_LEVELS = ('ERROR', 'WARNING', 'WARN', 'INFO', 'DEBUG', 'CRITICAL')
+
+# Character runs, with the same character classes as the regexes
+_SPACE_RUN = re.compile(r'\s*')
+_DASH_SPACE_RUN = re.compile(r'[-\s]*')
+_NAME_RUN = re.compile(r'[\w.]*')
+
+JavaLogLine = tuple[str, Optional[str], str, Optional[str], str]
+PythonLogLine = tuple[str, str, Optional[str], str]
+
+
+def scan_java_log_line(line: str) -> Optional[JavaLogLine]:
+    """
+    Split a log4j/logback style log line.
+
+    Args:
+        line: Stripped log line without newlines
+
+    Returns:
+        Tuple of (timestamp, thread, level, logger, message) as
+        JavaLogParser.LOG_LINE_PATTERN would match it, or None
+    """
+    if len(line) < 11 or not _scan_date(line) or not (line[10] == 'T' or line[10].isspace()):
+        return None
+    end = _scan_time(line, 11)
+    if end < 0:
+        return None
+    timestamp = line[:end]
+    pos = _SPACE_RUN.match(line, end).end()
+
+    thread = None
+    if line.startswith('[', pos):
+        close = line.find(']', pos + 1)
+        if close <= pos + 1:
+            return None
+        thread = line[pos + 1:close]
+        pos = _SPACE_RUN.match(line, close + 1).end()
+
+    level = _scan_level(line, pos, JAVA_LEVELS)
+    if level is None:
+        return None
+    end = _SPACE_RUN.match(line, pos + len(level)).end()
+    if end == pos + len(level):
+        return None
+    pos = end
+
+    logger = None
+    end = _NAME_RUN.match(line, pos).end()
+    if end > pos:
+        logger = line[pos:end]
+        pos = _SPACE_RUN.match(line, end).end()
+        if line.startswith(('-', ':'), pos):
+            pos = _SPACE_RUN.match(line, pos + 1).end()
+
+    return timestamp, thread, level, logger, line[pos:]
+
+
+def scan_python_log_line(line: str) -> Optional[PythonLogLine]:
+    """
+    Split a logging module style log line.
+
+    Args:
+        line: Stripped log line without newlines
+
+    Returns:
+        Tuple of (timestamp, level, logger, message) as
+        PythonLogParser.LOG_LINE_PATTERN would match it, or None
+    """
+    if len(line) < 11 or not _scan_date(line):
+        return None
+    pos = _SPACE_RUN.match(line, 10).end()
+    if pos == 10:
+        return None
+    end = _scan_time(line, pos)
+    if end < 0:
+        return None
+    timestamp = line[:end]
+    pos = _DASH_SPACE_RUN.match(line, end).end()
+
+    level = _scan_level(line, pos, PYTHON_LEVELS)
+    if level is None:
+        return None
+    pos = _DASH_SPACE_RUN.match(line, pos + len(level)).end()
+
+    logger = None
+    end = _NAME_RUN.match(line, pos).end()
+    if end > pos:
+        logger = line[pos:end]
+        pos = _DASH_SPACE_RUN.match(line, end).end()
+
+    return timestamp, level, logger, line[pos:]
+
+
+def _digits(line: str, pos: int, count: int) -> bool:
+    """Check for exactly count decimal digits (as ``\\d`` matches them) at pos."""
+    part = line[pos:pos + count]
+    return len(part) == count and part.isdecimal()
+
+
+def _scan_date(line: str) -> bool:
+    """Check for a YYYY-MM-DD date at the start of the line."""
+    return (
+        _digits(line, 0, 4) and line[4] == '-'
+        and _digits(line, 5, 2) and line[7] == '-'
+        and _digits(line, 8, 2)
+    )
+
+
+def _scan_time(line: str, pos: int) -> int:
+    """Get the end of an HH:MM:SS time with optional milliseconds at pos, or -1."""
+    if not (
+        _digits(line, pos, 2) and line[pos + 2:pos + 3] == ':'
+        and _digits(line, pos + 3, 2) and line[pos + 5:pos + 6] == ':'
+        and _digits(line, pos + 6, 2)
+    ):
+        return -1
+    pos += 8
+    if line[pos:pos + 1] in ('.', ',') and _digits(line, pos + 1, 3):
+        pos += 4
+    return pos
+
+
+def _scan_level(line: str, pos: int, levels: tuple[str, ...]) -> Optional[str]:
+    """Get the first level that starts at pos."""
+    for level in levels:
+        if line.startswith(level, pos):
+            return level
+    return None
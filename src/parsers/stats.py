@@ -0,0 +1,137 @@
+"""Opt-in counters and timers for the parsing hot path."""
+
+import re
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional
+
+from src.parsers.base import BaseLogParser, ParsedError
+
+
+class ParseStats:
+    """
+    Per-stage timings and counters of a parse or watch run.
+
+    Nothing is measured unless a parser is passed to instrument(), so a
+    run without stats executes exactly the uninstrumented code.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        # Counters such as lines, errors and blocks
+        self.counters: dict[str, int] = defaultdict(int)
+        # Stage or pattern name -> seconds, calls and matches
+        self.seconds: dict[str, float] = defaultdict(float)
+        self.calls: dict[str, int] = defaultdict(int)
+        self.matches: dict[str, int] = defaultdict(int)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the stats were created."""
+        return time.perf_counter() - self.started
+
+    def add(self, counter: str, value: int = 1) -> None:
+        """Increase a counter."""
+        self.counters[counter] += value
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """Add the time spent in the block to a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[stage] += time.perf_counter() - start
+            self.calls[stage] += 1
+
+    def count_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Pass lines through, counting them."""
+        counters = self.counters
+        for line in lines:
+            counters["lines"] += 1
+            yield line
+
+    def count_errors(self, errors: Iterable[ParsedError]) -> Iterator[ParsedError]:
+        """Pass errors through, counting them."""
+        counters = self.counters
+        for error in errors:
+            counters["errors"] += 1
+            yield error
+
+
+class TimedPattern:
+    """Compiled regex wrapper that records the time and hits of every call."""
+
+    __slots__ = ('pattern', 'name', '_seconds', '_calls', '_matches')
+
+    def __init__(self, pattern: re.Pattern, name: str, stats: ParseStats):
+        self.pattern = pattern
+        self.name = name
+        self._seconds = stats.seconds
+        self._calls = stats.calls
+        self._matches = stats.matches
+        self._matches[name] += 0
+
+    def _record(self, start: float, result: Optional[re.Match]) -> Optional[re.Match]:
+        name = self.name
+        self._seconds[name] += time.perf_counter() - start
+        self._calls[name] += 1
+        if result is not None:
+            self._matches[name] += 1
+        return result
+
+    def match(self, *args: Any) -> Optional[re.Match]:
+        start = time.perf_counter()
+        return self._record(start, self.pattern.match(*args))
+
+    def search(self, *args: Any) -> Optional[re.Match]:
+        start = time.perf_counter()
+        return self._record(start, self.pattern.search(*args))
+
+    def fullmatch(self, *args: Any) -> Optional[re.Match]:
+        start = time.perf_counter()
+        return self._record(start, self.pattern.fullmatch(*args))
+
+    def __getattr__(self, name: str) -> Any:
+        # finditer(), sub(), groupindex, ... are used off the hot path
+        return getattr(self.pattern, name)
+
+
+def instrument(parser: BaseLogParser, stats: ParseStats, prefix: str = "") -> BaseLogParser:
+    """
+    Record pattern and block-assembly timings of a parser instance.
+
+    Every ``*_PATTERN`` class attribute is shadowed by a TimedPattern on the
+    instance, and _parse_lines() is timed as the "assembly" stage (which
+    includes the patterns it runs). Sub-parsers of a dispatching parser are
+    instrumented too, with their language as a prefix. Other instances and
+    the classes are not touched. An instrumented parser cannot be pickled,
+    so use it only in the current process.
+
+    Args:
+        parser: Parser to instrument in place
+        stats: Stats to record into
+        prefix: Prefix of the pattern names
+
+    Returns:
+        The parser
+    """
+    for attr in dir(type(parser)):
+        value = getattr(parser, attr)
+        if attr.endswith('_PATTERN') and isinstance(value, re.Pattern):
+            setattr(parser, attr, TimedPattern(value, f"{prefix}{attr}", stats))
+
+    for sub_parser in getattr(parser, 'parsers', ()):
+        instrument(sub_parser, stats, f"{sub_parser.language}.")
+
+    if not prefix:
+        parse_lines = parser._parse_lines
+
+        def timed_parse_lines(lines: list[str]) -> list[ParsedError]:
+            stats.counters["blocks"] += 1
+            with stats.timer("assembly"):
+                return parse_lines(lines)
+
+        parser._parse_lines = timed_parse_lines
+    return parser
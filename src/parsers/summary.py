@@ -0,0 +1,85 @@
+"""Streaming error counts with a bounded page of errors kept for display."""
+
+from collections import Counter
+from typing import Generic, Iterable, Iterator, Optional, TypeVar
+
+from src.parsers.base import ParsedError
+
+T = TypeVar('T')
+
+
+class Page(Generic[T]):
+    """
+    A window of (offset, limit) items taken from a stream.
+
+    Only the items inside the window are kept; the rest are counted and
+    dropped, so memory is bounded by the limit, not by the stream.
+    """
+
+    def __init__(self, offset: int = 0, limit: Optional[int] = None):
+        """
+        Initialize the page.
+
+        Args:
+            offset: Number of items to skip
+            limit: Maximum number of items to keep, or None for all
+        """
+        self.offset = offset
+        self.limit = limit
+        self.total = 0
+        self.items: list[T] = []
+
+    def add(self, item: T) -> None:
+        """Count an item and keep it if it falls inside the window."""
+        if self.total >= self.offset and (self.limit is None or len(self.items) < self.limit):
+            self.items.append(item)
+        self.total += 1
+
+    @property
+    def start(self) -> int:
+        """One-based position of the first kept item."""
+        return self.offset + 1
+
+    @property
+    def remaining(self) -> int:
+        """Number of items after the window."""
+        return max(self.total - self.offset - len(self.items), 0)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+
+class ErrorSummary(Page[ParsedError]):
+    """Counts of errors per type and severity, plus one page of the errors."""
+
+    def __init__(self, offset: int = 0, limit: Optional[int] = None):
+        """
+        Initialize the summary.
+
+        Args:
+            offset: Number of errors to skip before the page
+            limit: Maximum number of errors on the page, or None for all
+        """
+        super().__init__(offset, limit)
+        self.by_type: Counter[str] = Counter()
+        self.by_severity: Counter[str] = Counter()
+
+    def add(self, error: ParsedError) -> None:
+        """
+        Record one error.
+
+        Args:
+            error: Parsed error
+        """
+        self.by_type[error.error_type] += 1
+        self.by_severity[error.severity.value] += 1
+        super().add(error)
+
+    def add_all(self, errors: Iterable[ParsedError]) -> 'ErrorSummary':
+        """Record every error from an iterable and return self."""
+        for error in errors:
+            self.add(error)
+        return self
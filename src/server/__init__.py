@@ -0,0 +1 @@
+"""Resident daemon keeping parsers warm, and its client."""
@@ -0,0 +1,229 @@
+"""Client of the log-detective daemon, for commands that use it when it runs."""
+
+import json
+import os
+import socket
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+# Environment variable overriding the daemon's socket path
+SOCKET_ENV = "LOG_DETECTIVE_SOCKET"
+
+# Seconds to wait for a response before giving up on the daemon
+DEFAULT_TIMEOUT = 60.0
+
+
+class DaemonError(Exception):
+    """Error response from the daemon."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def default_socket_path() -> Path:
+    """
+    Get the socket path of the daemon.
+
+    Returns:
+        $LOG_DETECTIVE_SOCKET if set, else log-detective.sock in the user's
+        runtime directory, or a per-user socket in the temp directory
+    """
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "log-detective.sock"
+    return Path(tempfile.gettempdir()) / f"log-detective-{os.getuid()}.sock"
+
+
+class DaemonClient:
+    """
+    Connection to the daemon.
+
+    Requests are JSON-RPC 2.0 objects, one per line; a JSON array of
+    requests is a batch and is answered with an array of responses. A
+    streamed result is followed by notifications carrying its items (see
+    src.server.daemon).
+    """
+
+    def __init__(self, path: Optional[Path] = None, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Connect to the daemon.
+
+        Args:
+            path: Socket path (default: default_socket_path())
+            timeout: Seconds to wait for each response
+
+        Raises:
+            PermissionError: If the socket or the daemon listening on it
+                belongs to another user
+            OSError: If no daemon listens on the socket
+        """
+        self.path = path or default_socket_path()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            # The default path may be in the shared temp directory, where
+            # another user could listen in the daemon's place
+            _check_owner(self.path)
+            self._socket.connect(str(self.path))
+            _check_peer(self._socket, self.path)
+        except OSError:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile("rwb")
+        self._next_id = 0
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Call one method.
+
+        Args:
+            method: Method name, e.g. "parse"
+            **params: Method parameters
+
+        Returns:
+            The method's result
+
+        Raises:
+            DaemonError: If the daemon answers with an error
+            OSError: If the connection fails
+        """
+        response = self._send(self._request(method, params))
+        return _result(response)
+
+    def stream(self, method: str, **params: Any) -> tuple[Any, Iterator[Any]]:
+        """
+        Call a method that streams its result.
+
+        The items must be read, or the client closed, before the next call.
+
+        Args:
+            method: Method name, e.g. "parse"
+            **params: Method parameters, without "stream"
+
+        Returns:
+            Tuple of (the head of the result, iterator over its items as the
+            daemon sends them)
+
+        Raises:
+            DaemonError: If the daemon answers with an error; the iterator
+                raises it if the method fails after answering
+            OSError: If the connection fails
+        """
+        request = self._request(method, {**params, "stream": True})
+        result = _result(self._send(request))
+        return result, self._items(request["id"])
+
+    def batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """
+        Call several methods in one round trip.
+
+        Args:
+            calls: (method, params) pairs
+
+        Returns:
+            Results in call order; calls that failed give a DaemonError
+            instead of raising it
+
+        Raises:
+            OSError: If the connection fails
+        """
+        if not calls:
+            return []
+        requests = [self._request(method, params) for method, params in calls]
+        responses = {response["id"]: response for response in self._send(requests)}
+        results: list[Any] = []
+        for request in requests:
+            try:
+                results.append(_result(responses[request["id"]]))
+            except DaemonError as e:
+                results.append(e)
+        return results
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'DaemonClient':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        self._next_id += 1
+        return {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+
+    def _send(self, message: Any) -> Any:
+        self._file.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        self._file.flush()
+        return self._receive()
+
+    def _receive(self) -> Any:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("The daemon closed the connection")
+        return json.loads(line)
+
+    def _items(self, request_id: int) -> Iterator[Any]:
+        """Yield the items of a streamed result until its "end" notification."""
+        while True:
+            message = self._receive()
+            params = message["params"]
+            if params["id"] != request_id:
+                raise ConnectionError(f"Unexpected message for request {params['id']}")
+            if message["method"] == "end":
+                if "error" in params:
+                    raise DaemonError(params["error"]["code"], params["error"]["message"])
+                return
+            yield params["item"]
+
+
+def connect(path: Optional[Path] = None) -> Optional[DaemonClient]:
+    """
+    Connect to the daemon if it is running.
+
+    Args:
+        path: Socket path (default: default_socket_path())
+
+    Returns:
+        Connected client, or None if no daemon listens on the socket
+
+    Raises:
+        PermissionError: If the socket or the daemon listening on it belongs
+            to another user
+    """
+    try:
+        return DaemonClient(path)
+    except PermissionError:
+        raise
+    except OSError:
+        return None
+
+
+def _check_owner(path: Path) -> None:
+    """Refuse a socket file that belongs to another user."""
+    if os.stat(path).st_uid != os.getuid():
+        raise PermissionError(f"{path} belongs to another user")
+
+
+def _check_peer(sock: socket.socket, path: Path) -> None:
+    """Refuse a daemon running as another user, where the platform reports it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", credentials)
+    if uid != os.getuid():
+        raise PermissionError(f"The daemon on {path} runs as another user")
+
+
+def _result(response: dict[str, Any]) -> Any:
+    """Get the result of a response, raising its error instead if it has one."""
+    if "error" in response:
+        raise DaemonError(response["error"]["code"], response["error"]["message"])
+    return response["result"]
@@ -0,0 +1,335 @@
+"""
+Resident daemon answering parse requests over a Unix domain socket.
+
+The protocol is JSON-RPC 2.0 with one message per line: a request object
+is answered with a response object, and a JSON array of requests (a
+batch) with an array of responses in the same order.
+
+A method called with "stream": true answers with a response carrying the
+head of its result, then sends the items of the result as they are
+produced, as "item" notifications, and ends with an "end" notification.
+Both carry the request id in their params. An "end" carrying an error
+means the method failed after its response was sent. Streaming is not
+available in a batch.
+"""
+
+import inspect
+import io
+import json
+import os
+import socketserver
+import threading
+import time
+from contextlib import closing, nullcontext
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple, Optional
+
+from src.export.ndjson import dumps_line
+from src.parsers.archive import is_compressed, iter_rotation_lines, rotation_order
+from src.parsers.base import PARSER_ENGINES, BaseLogParser, ParsedError
+from src.parsers.detector import (
+    LanguageType,
+    detect_file_language,
+    detect_language,
+    get_parser_for_language,
+    read_head,
+)
+from src.server.client import connect
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Languages a parse request may ask for
+REQUEST_LANGUAGES = ("auto", "java", "python", "mixed")
+
+
+class InvalidParamsError(ValueError):
+    """Raised by a method for parameters it cannot accept."""
+
+
+class Streamed(NamedTuple):
+    """Result of a streaming method: the response's result, then the items."""
+
+    result: Any
+    items: Iterator[Any]
+
+
+class ParseService:
+    """
+    Methods served by the daemon, with parsers kept warm between requests.
+
+    One parser per language and engine is built at startup and shared by
+    all requests; parsers keep no state between iter_parse() calls, so
+    requests on different connections can use them at the same time.
+    """
+
+    def __init__(self):
+        """Build the parsers and the method table."""
+        self.started = time.monotonic()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.parsers: dict[tuple[LanguageType, str], BaseLogParser] = {
+            (language, engine): get_parser_for_language(language, engine=engine)
+            for language in (LanguageType.JAVA, LanguageType.PYTHON, LanguageType.MIXED)
+            for engine in PARSER_ENGINES
+        }
+        self.methods = {
+            "parse": self.parse,
+            "status": self.status,
+        }
+
+    def handle(self, message: Any) -> tuple[Any, Optional[Iterator[dict[str, Any]]]]:
+        """
+        Answer a request or a batch of requests.
+
+        Args:
+            message: Decoded JSON-RPC request object or array of them
+
+        Returns:
+            Tuple of (response object, or array of responses for a batch;
+            notifications to send after it for a streamed result, or None)
+        """
+        if not isinstance(message, list):
+            return self._handle_request(message, streaming=True)
+        if not message:
+            return _error(None, INVALID_REQUEST, "Empty batch"), None
+        return [self._handle_request(request)[0] for request in message], None
+
+    def parse(
+        self,
+        text: Optional[str] = None,
+        paths: Optional[list[str]] = None,
+        language: str = "auto",
+        engine: str = "regex",
+        offset: int = 0,
+        limit: Optional[int] = None,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Parse log text or files.
+
+        Args:
+            text: Log text
+            paths: Log files (a rotation set is parsed oldest first)
+            language: One of REQUEST_LANGUAGES
+            engine: One of PARSER_ENGINES
+            offset: Number of errors to skip
+            limit: Maximum number of errors to return, or None for all
+            stream: Stream the errors instead of returning them in the result
+
+        Returns:
+            {"language": detected language, "errors": [ParsedError.to_dict(), ...]},
+            or with stream, Streamed({"language": ...}, error dicts); parsing
+            stops after the last error of the page
+
+        Raises:
+            InvalidParamsError: If the parameters are invalid or a file is missing
+        """
+        if (text is None) == (paths is None):
+            raise InvalidParamsError("Provide either text or paths")
+        if language not in REQUEST_LANGUAGES:
+            raise InvalidParamsError(f"Unknown language: {language}")
+        if engine not in PARSER_ENGINES:
+            raise InvalidParamsError(f"Unknown engine: {engine}")
+        if not _is_count(offset) or not (limit is None or _is_count(limit)):
+            raise InvalidParamsError("offset and limit must be non-negative integers")
+
+        if text is not None:
+            lines: Iterator[str] = iter(text.strip().split("\n"))
+            seekable = None
+        else:
+            files = rotation_order([Path(path) for path in paths])
+            for path in files:
+                if not path.is_file():
+                    raise InvalidParamsError(f"No such file: {path}")
+            lines = iter_rotation_lines(files)
+            # A single uncompressed file supports detection from sampled windows
+            seekable = files[0] if len(files) == 1 and not is_compressed(files[0]) else None
+
+        # Files stay open until the page has been read or abandoned
+        source = lines if text is None else None
+        try:
+            detected, errors = self._parse_lines(lines, language, engine, seekable)
+        except BaseException:
+            if source is not None:
+                source.close()
+            raise
+        page = self._page(errors, offset, limit, source)
+        if stream:
+            return Streamed({"language": detected.value}, page)
+        return {"language": detected.value, "errors": list(page)}
+
+    def status(self) -> dict[str, Any]:
+        """Get the daemon's process ID, uptime, request count and warm parsers."""
+        return {
+            "pid": os.getpid(),
+            "uptime": round(time.monotonic() - self.started, 3),
+            "requests": self.requests,
+            "parsers": [f"{language.value}/{engine}" for language, engine in self.parsers],
+        }
+
+    def _handle_request(
+        self, request: Any, streaming: bool = False
+    ) -> tuple[dict[str, Any], Optional[Iterator[dict[str, Any]]]]:
+        """Answer one request, with the notifications of a streamed result."""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            request_id = request.get("id") if isinstance(request, dict) else None
+            return _error(request_id, INVALID_REQUEST, "Invalid request"), None
+
+        request_id = request.get("id")
+        name = request["method"]
+        method = self.methods.get(name)
+        if method is None:
+            return _error(request_id, METHOD_NOT_FOUND, f"Unknown method: {name}"), None
+        params = request.get("params", {})
+        if not isinstance(params, dict):
+            return _error(request_id, INVALID_PARAMS, "params must be an object"), None
+        if params.get("stream") and not streaming:
+            return _error(request_id, INVALID_PARAMS, "Streaming is not available in a batch"), None
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as e:
+            return _error(request_id, INVALID_PARAMS, str(e)), None
+
+        with self._lock:
+            self.requests += 1
+        try:
+            result = method(**params)
+        except InvalidParamsError as e:
+            return _error(request_id, INVALID_PARAMS, str(e)), None
+        except Exception as e:
+            return _error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}"), None
+        if isinstance(result, Streamed):
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result.result}
+            return response, _notifications(request_id, result.items)
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}, None
+
+    def _parse_lines(
+        self,
+        lines: Iterator[str],
+        language: str,
+        engine: str,
+        seekable: Optional[Path] = None,
+    ) -> tuple[LanguageType, Iterator[ParsedError]]:
+        """Detect the language from the head of the lines and start parsing them."""
+        head = read_head(lines)
+        if language != "auto":
+            detected = LanguageType(language)
+        elif seekable is not None:
+            detected, _ = detect_file_language(seekable)
+        else:
+            detected = detect_language("".join(head))
+
+        parser = self.parsers.get((detected, engine))
+        return detected, parser.iter_parse(chain(head, lines)) if parser else iter(())
+
+    @staticmethod
+    def _page(
+        errors: Iterator[ParsedError],
+        offset: int,
+        limit: Optional[int],
+        source: Optional[Iterator[str]] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Take a page of errors as dicts, closing the source lines when done or abandoned."""
+        with closing(source) if source is not None else nullcontext():
+            for error in islice(errors, offset, None if limit is None else offset + limit):
+                yield error.to_dict()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers the messages of one connection until the client disconnects."""
+
+    server: 'DaemonServer'
+    # Buffered, so a streamed result is not written one syscall per item
+    wbufsize = io.DEFAULT_BUFFER_SIZE
+
+    def handle(self) -> None:
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    response, notifications = _error(None, PARSE_ERROR, "Invalid JSON"), None
+                else:
+                    response, notifications = self.server.service.handle(message)
+                self.wfile.write(dumps_line(response))
+                if notifications is not None:
+                    # Closed if the client goes away, which stops the parse
+                    with closing(notifications):
+                        for notification in notifications:
+                            self.wfile.write(dumps_line(notification))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading, e.g. after the first lines of a stream
+            pass
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix socket server answering each connection on its own thread.
+
+    The socket is only accessible to the user running the daemon. It is
+    removed when the server is closed.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, service: Optional[ParseService] = None):
+        """
+        Bind the socket.
+
+        Args:
+            path: Socket path
+            service: Methods to serve (default: a new ParseService)
+
+        Raises:
+            OSError: If another daemon is listening on the socket
+        """
+        self.path = path
+        client = connect(path)
+        if client is not None:
+            client.close()
+            raise OSError(f"A daemon is already listening on {path}")
+        # Left behind by a daemon that did not shut down cleanly
+        path.unlink(missing_ok=True)
+
+        self.service = service or ParseService()
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def _error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    """Build an error response."""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _notifications(request_id: Any, items: Iterator[Any]) -> Iterator[dict[str, Any]]:
+    """Wrap the items of a streamed result in notifications, ending with "end"."""
+    end: dict[str, Any] = {"id": request_id}
+    with closing(items):
+        try:
+            for item in items:
+                params = {"id": request_id, "item": item}
+                yield {"jsonrpc": "2.0", "method": "item", "params": params}
+        except Exception as e:
+            end["error"] = {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}
+    yield {"jsonrpc": "2.0", "method": "end", "params": end}
+
+
+def _is_count(value: Any) -> bool:
+    """Check that a parameter is a non-negative integer (JSON true is not one)."""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
@@ -0,0 +1,144 @@
+"""Tests for the command-line interface."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from src.cli import COMMANDS, main
+from src.commands.parse import DAEMON_ENV
+from src.server.client import SOCKET_ENV
+
+# Modules that no command may need just to show its help: the terminal
+# renderer, the event loop, worker pools, optional encoders and the parsers
+STARTUP_EXCLUDED = (
+    "rich", "asyncio", "multiprocessing", "concurrent", "pyarrow", "orjson",
+    "src.commands.output", "src.parsers.java", "src.parsers.python", "src.parsers.mixed",
+    "src.parsers.detector", "src.monitor.multi", "src.monitor.pipeline",
+)
+
+# A cause chain whose messages look like Rich markup
+MARKUP_LOG = """2024-01-15 10:30:45,123 [main] ERROR com.example.App - Request failed
+java.lang.IllegalStateException: bad [bold]state[/x]
+\tat com.example.Service.run(Service.java:12)
+Caused by: java.lang.IllegalArgumentException: [/red] closes nothing
+\tat com.example.Repo.find(Repo.java:10)
+\t... 1 more"""
+
+
+@pytest.fixture(autouse=True)
+def no_daemon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep parse away from any daemon the developer happens to be running."""
+    monkeypatch.setenv(SOCKET_ENV, str(tmp_path / "daemon.sock"))
+    monkeypatch.delenv(DAEMON_ENV, raising=False)
+
+
+def _imported_modules(args: list[str]) -> set[str]:
+    """Run the CLI in a fresh interpreter and collect the modules it imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "import sys; from src.cli import main; main(sys.argv[1:])", *args],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    # Lines look like "import time: self [us] | cumulative | module"
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+class TestLazyCommands:
+    """Tests for loading subcommands on first use."""
+
+    def test_commands_resolve(self) -> None:
+        """Test that every registered command imports and has its name."""
+        ctx = click.Context(main)
+        assert main.list_commands(ctx) == sorted(COMMANDS)
+        for name in COMMANDS:
+            assert main.get_command(ctx, name).name == name
+        assert main.get_command(ctx, "missing") is None
+
+    @pytest.mark.parametrize("args", [["--help"], ["parse", "--help"], ["watch", "--help"]])
+    def test_help_startup_imports(self, args: list[str]) -> None:
+        """Test that showing help does not import what only running a command needs."""
+        imported = _imported_modules(args)
+
+        assert "src.cli" in imported
+        assert not {
+            module for module in imported
+            if any(module == name or module.startswith(name + ".") for name in STARTUP_EXCLUDED)
+        }
+
+
+class TestParseOutput:
+    """Tests for the terminal output of parse."""
+
+    def test_pretty_escapes_markup(self) -> None:
+        """Test that messages in an error and its causes are printed as text."""
+        result = CliRunner().invoke(main, ["parse", "--text", MARKUP_LOG, "-o", "pretty"])
+
+        assert result.exit_code == 0, result.output
+        assert "bad [bold]state[/x]" in result.output
+        assert (
+            "Caused by: java.lang.IllegalArgumentException: [/red] closes nothing"
+            in result.output
+        )
+
+    def test_pretty_escapes_frames(self) -> None:
+        """Test that stack frame locations and code are printed as text."""
+        log = (
+            "Traceback (most recent call last):\n"
+            '  File "jobs/[bold]/run.py", line 3, in handle\n'
+            '    style["[/red]"] = rows[0]\n'
+            "KeyError: 'x'"
+        )
+        result = CliRunner().invoke(main, ["parse", "--text", log, "-o", "pretty"])
+
+        assert result.exit_code == 0, result.output
+        assert "jobs/[bold]/run.py:3" in result.output
+        assert 'style["[/red]"] = rows[0]' in result.output
+
+    def test_groups_escape_markup(self) -> None:
+        """Test that group exemplars are printed as text."""
+        result = CliRunner().invoke(main, ["parse", "--text", MARKUP_LOG, "--group"])
+
+        assert result.exit_code == 0, result.output
+        assert "bad [bold]state[/x]" in result.output
+        assert "[/red] closes nothing" in result.output
+
+    def test_group_table_escapes_markup(self) -> None:
+        """Test that the group table prints exemplar messages as text."""
+        result = CliRunner().invoke(
+            main, ["parse", "--text", MARKUP_LOG, "--group", "-o", "table"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "[bold]" in result.output
+
+    def test_terminal_default_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that table output keeps a bounded page and points at the rest."""
+        monkeypatch.setattr("src.commands.parse.DEFAULT_TERMINAL_LIMIT", 1)
+        log = MARKUP_LOG + "\n" + MARKUP_LOG
+        result = CliRunner().invoke(main, ["parse", "--text", log, "-o", "table"])
+
+        assert result.exit_code == 0, result.output
+        assert "Found 2 error(s)" in result.output
+        assert "1 more error(s); use --offset 1 to see them" in result.output
+
+    def test_json_page_reports_total(self) -> None:
+        """Test that a page of JSON output reports every error found, not just the page."""
+        log = MARKUP_LOG + "\n" + MARKUP_LOG
+        result = CliRunner().invoke(main, ["parse", "--text", log, "-o", "json", "--limit", "1"])
+
+        data = json.loads(result.output)
+        assert data["error_count"] == 2
+        assert (data["offset"], data["limit"]) == (0, 1)
+        assert len(data["errors"]) == 1
@@ -0,0 +1,84 @@
+"""Tests for exporting parsed errors."""
+
+import io
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.export import ndjson
+from src.export.columnar import write_columnar
+from src.export.ndjson import dumps_line, write_ndjson
+from src.parsers.mixed import MixedLogParser
+
+LOG = """2024-01-15 10:30:45,123 [main] ERROR com.example.App - Request [failed]
+java.lang.IllegalStateException: Bad state for "ünïcode"   user
+\tat com.example.Service.run(Service.java:12)
+2024-01-15 10:30:46,123 - ERROR - worker - Job failed
+Traceback (most recent call last):
+  File "worker.py", line 3, in run
+    data["id"]
+KeyError: 'id'
+"""
+
+
+class TestNdjson:
+    """Tests for NDJSON output."""
+
+    def test_encoders_agree(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the optional fast encoder and the fallback give the same bytes."""
+        records = [error.to_dict() for error in MixedLogParser().parse(LOG)]
+        lines = [dumps_line(record) for record in records]
+        monkeypatch.setattr(ndjson, "orjson", None)
+        assert [dumps_line(record) for record in records] == lines
+        assert [json.loads(line) for line in lines] == records
+        assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in lines)
+
+    def test_lone_surrogate_is_escaped(self) -> None:
+        """Test that text that is not valid Unicode still gives valid UTF-8 JSON."""
+        line = dumps_line({"message": "bad \ud800 byte"})
+        assert json.loads(line.decode("utf-8")) == {"message": "bad \ud800 byte"}
+
+    def test_streams_while_parsing(self) -> None:
+        """Test that each record is written before the next one is produced."""
+        stream = io.BytesIO()
+        errors = MixedLogParser().iter_parse(io.StringIO(LOG))
+
+        def records() -> Iterator[dict]:
+            for written, error in enumerate(errors):
+                assert stream.getvalue().count(b"\n") == written
+                yield error.to_dict()
+
+        assert write_ndjson(records(), stream) == 2
+        assert [json.loads(line)["error_type"] for line in stream.getvalue().splitlines()] == [
+            "java.lang.IllegalStateException", "KeyError",
+        ]
+
+
+class TestColumnar:
+    """Tests for Parquet and Arrow output."""
+
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+    def test_round_trip(self, tmp_path: Path, fmt: str) -> None:
+        """Test that errors are written in batches and read back with their frames."""
+        pa = pytest.importorskip("pyarrow")
+        errors = MixedLogParser().parse(LOG * 3) + MixedLogParser().parse("ValueError: no frames")
+        path = tmp_path / f"errors.{fmt}"
+
+        assert write_columnar(iter(errors), path, fmt, batch_size=2) == 7
+
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            assert pq.ParquetFile(path).metadata.num_row_groups == 4
+            table = pq.read_table(path)
+        else:
+            table = pa.ipc.open_file(path).read_all()
+        rows = table.to_pylist()
+        for error, row in zip(errors, rows):
+            expected = error.to_dict()
+            assert row["error_type"] == expected["error_type"]
+            assert row["severity"] == expected["severity"]
+            assert row["root_file_path"] == expected["file_path"]
+            assert row["root_line_number"] == expected["line_number"]
+            assert row["frames"] == expected["stack_frames"]
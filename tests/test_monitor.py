@@ -0,0 +1,431 @@
+"""Tests for real-time log monitoring."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.monitor.checkpoint import CheckpointStore
+from src.monitor.debouncer import Debouncer
+from src.monitor.metrics import TextfileExporter
+from src.monitor.multi import MultiFileWatcher, expand_patterns
+from src.monitor.pipeline import OverflowPolicy, Pipeline, Stage, StageQueue, Summary
+from src.monitor.watcher import FileTailer, PollingWaiter, make_waiter
+from src.parsers.base import ParsedError
+from src.parsers.detector import LanguageType
+from src.parsers.java import JavaLogParser
+from src.parsers.python import PythonLogParser
+from src.parsers.stats import ParseStats, instrument
+
+
+def append(path: Path, text: str) -> None:
+    with path.open("a", encoding="utf-8") as fp:
+        fp.write(text)
+
+
+class TestFileTailer:
+    """Tests for following a log file."""
+
+    def test_reads_only_appended_lines(self, tmp_path: Path) -> None:
+        """Test that existing content is skipped and appends are read once."""
+        path = tmp_path / "app.log"
+        path.write_text("old line\n", encoding="utf-8")
+
+        with FileTailer(path, use_inotify=False) as tailer:
+            assert tailer.read_lines() == []
+            append(path, "first\nsecond\n")
+            assert tailer.read_lines() == ["first", "second"]
+            assert tailer.read_lines() == []
+
+    def test_keeps_partial_line(self, tmp_path: Path) -> None:
+        """Test that a line is returned only once its newline is written."""
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+
+        with FileTailer(path, use_inotify=False) as tailer:
+            append(path, "java.lang.Illegal")
+            assert tailer.read_lines() == []
+            append(path, "StateException: boom\r\n")
+            assert tailer.read_lines() == ["java.lang.IllegalStateException: boom"]
+
+    def test_copytruncate(self, tmp_path: Path) -> None:
+        """Test that reading restarts at the beginning after truncation."""
+        path = tmp_path / "app.log"
+        path.write_text("before rotation\n", encoding="utf-8")
+
+        with FileTailer(path, from_start=True, use_inotify=False) as tailer:
+            assert tailer.read_lines() == ["before rotation"]
+            path.write_text("after\n", encoding="utf-8")
+            assert tailer.read_lines() == ["after"]
+
+    def test_truncation_ends_unfinished_line(self, tmp_path: Path) -> None:
+        """Test that a line cut off by truncation does not merge with new content."""
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+
+        with FileTailer(path, use_inotify=False) as tailer:
+            append(path, "cut off")
+            assert tailer.read() == "cut off"
+            path.write_text("new\n", encoding="utf-8")
+            assert tailer.read() == "\nnew\n"
+
+    def test_rename_rotation(self, tmp_path: Path) -> None:
+        """Test that the old file is drained before the new one is read."""
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+
+        with FileTailer(path, use_inotify=False) as tailer:
+            append(path, "one\ntwo")
+            assert tailer.read_lines() == ["one"]
+
+            path.rename(tmp_path / "app.log.1")
+            append(tmp_path / "app.log.1", " late\n")
+            assert tailer.read_lines() == ["two late"]
+
+            path.write_text("three\n", encoding="utf-8")
+            assert tailer.read_lines() == ["three"]
+            assert tailer.read_lines() == []
+
+    def test_feeds_parser(self, tmp_path: Path) -> None:
+        """Test parsing lines from the tailer."""
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+
+        with FileTailer(path, use_inotify=False) as tailer:
+            append(path, (
+                "2024-01-15 10:30:45,123 [main] ERROR com.example.App - Failed\n"
+                "java.lang.IllegalStateException: boom\n"
+                "\tat com.example.App.run(App.java:10)\n"
+                "2024-01-15 10:30:46,000 [main] INFO com.example.App - Retrying\n"
+            ))
+            errors = list(JavaLogParser().iter_parse(tailer.read_lines()))
+
+        assert len(errors) == 1
+        assert errors[0].file_path == "App.java"
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_waiter(self, tmp_path: Path) -> None:
+        """Test that inotify wakes only for the watched file."""
+        path = tmp_path / "app.log"
+        path.write_text("", encoding="utf-8")
+        waiter = make_waiter(path)
+        if isinstance(waiter, PollingWaiter):
+            pytest.skip("inotify unavailable")
+
+        try:
+            (tmp_path / "other.log").write_text("x\n", encoding="utf-8")
+            assert not waiter._read_events()
+            append(path, "line\n")
+            assert waiter._read_events()
+        finally:
+            waiter.close()
+
+    def test_polling_fallback(self, tmp_path: Path) -> None:
+        """Test that polling is used when inotify is disabled."""
+        assert isinstance(make_waiter(tmp_path / "app.log", use_inotify=False), PollingWaiter)
+
+
+class TestMultiFileWatcher:
+    """Tests for watching many files from one event loop."""
+
+    JAVA_LOG = (
+        "2024-01-15 10:30:45,123 [main] ERROR com.example.App - Failed\n"
+        "java.lang.IllegalStateException: boom\n"
+        "\tat com.example.App.run(App.java:10)\n"
+    )
+
+    PYTHON_LOG = (
+        "Traceback (most recent call last):\n"
+        '  File "worker.py", line 7, in run\n'
+        "KeyError: 'job'\n"
+    )
+
+    def test_expand_patterns(self, tmp_path: Path) -> None:
+        """Test expanding directories and recursive globs."""
+        (tmp_path / "svc").mkdir()
+        (tmp_path / "svc" / "app.log").write_text("", encoding="utf-8")
+        (tmp_path / "svc" / "app.log.1").write_text("", encoding="utf-8")
+        (tmp_path / "top.log").write_text("", encoding="utf-8")
+
+        files, directories = expand_patterns([str(tmp_path)])
+        assert files == {tmp_path / "top.log", tmp_path / "svc" / "app.log"}
+        assert directories == {tmp_path, tmp_path / "svc"}
+
+        files, directories = expand_patterns([str(tmp_path / "*.log")])
+        assert files == {tmp_path / "top.log"}
+        assert directories == {tmp_path}
+
+    @pytest.mark.parametrize("use_inotify, rescan_interval", [(False, 0.05), (True, 60.0)])
+    def test_events_from_many_files(
+        self, tmp_path: Path, use_inotify: bool, rescan_interval: float
+    ) -> None:
+        """Test per-file languages, parser state and new-file discovery."""
+        (tmp_path / "java.log").write_text(self.JAVA_LOG, encoding="utf-8")
+        watcher = MultiFileWatcher(
+            [str(tmp_path / "*.log")],
+            from_start=True,
+            poll_interval=0.05,
+            flush_timeout=0.05,
+            rescan_interval=rescan_interval,
+            use_inotify=use_inotify,
+        )
+        if use_inotify and watcher._inotify is None:
+            pytest.skip("inotify unavailable")
+
+        async def run() -> list[tuple[Path, str]]:
+            events = watcher.events()
+            received = [await asyncio.wait_for(anext(events), 5)]
+            (tmp_path / "python.log").write_text(self.PYTHON_LOG, encoding="utf-8")
+            received.append(await asyncio.wait_for(anext(events), 5))
+            await events.aclose()
+            return [(path.name, error.error_type) for path, error in received]
+
+        try:
+            assert asyncio.run(run()) == [
+                ("java.log", "java.lang.IllegalStateException"),
+                ("python.log", "KeyError"),
+            ]
+        finally:
+            watcher.close()
+
+        assert watcher.languages == {
+            tmp_path / "java.log": LanguageType.JAVA,
+            tmp_path / "python.log": LanguageType.PYTHON,
+        }
+
+    def test_checkpoint_waits_for_delivery(self, tmp_path: Path) -> None:
+        """Test that positions are saved only after the errors read were handled."""
+        path = tmp_path / "java.log"
+        path.write_text(self.JAVA_LOG, encoding="utf-8")
+        store = CheckpointStore(tmp_path / "checkpoint.json", interval=0)
+        watcher = MultiFileWatcher(
+            [str(path)],
+            from_start=True,
+            poll_interval=0.05,
+            flush_timeout=0.05,
+            use_inotify=False,
+            checkpoints=store,
+        )
+
+        async def run() -> None:
+            release = asyncio.Event()
+
+            async def notify(item: tuple[Path, ParsedError]) -> None:
+                await release.wait()
+
+            pipeline = Pipeline([Stage("notify", notify)])
+            task = asyncio.create_task(pipeline.run(watcher.events(settled=pipeline.idle)))
+            await asyncio.sleep(0.3)
+            # Saved before the quiet block was flushed, but not since
+            assert store.checkpoints[str(path)].pending == self.JAVA_LOG
+
+            release.set()
+            await asyncio.sleep(0.3)
+            watcher.stop()
+            await asyncio.wait_for(task, 5)
+            assert pipeline.idle()
+
+        try:
+            asyncio.run(run())
+        finally:
+            watcher.close()
+
+        assert store.checkpoints[str(path)].position == len(self.JAVA_LOG)
+        assert store.checkpoints[str(path)].pending == ""
+
+
+class TestPipeline:
+    """Tests for the bounded staged pipeline."""
+
+    def test_drop_oldest(self) -> None:
+        """Test that a full queue discards its oldest item."""
+        async def run() -> list[int]:
+            queue = StageQueue(2, OverflowPolicy.DROP_OLDEST)
+            for item in (1, 2, 3):
+                await queue.put(item)
+            assert queue.dropped == 1
+            return [await queue.get(), await queue.get()]
+
+        assert asyncio.run(run()) == [2, 3]
+
+    def test_summarize(self) -> None:
+        """Test that overflowing repeats are folded into one summary per key."""
+        async def run() -> list:
+            queue = StageQueue(1, OverflowPolicy.SUMMARIZE, key=lambda item: item[0])
+            for item in ("a1", "a2", "a3", "b1"):
+                await queue.put(item)
+            await queue.close()
+            assert queue.summarized == 3
+            return [await queue.get() for _ in range(queue.depth)]
+
+        first, a, b = asyncio.run(run())
+        assert first == "a1"
+        assert isinstance(a, Summary) and (a.exemplar, a.count) == ("a2", 2)
+        assert isinstance(b, Summary) and (b.exemplar, b.count) == ("b1", 1)
+
+    def test_block(self) -> None:
+        """Test that put() waits for space under the block policy."""
+        async def run() -> None:
+            queue = StageQueue(1)
+            await queue.put(1)
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(queue.put(2), 0.05)
+
+            pending = asyncio.create_task(queue.put(3))
+            await asyncio.sleep(0)
+            assert await queue.get() == 1
+            await asyncio.wait_for(pending, 1)
+            assert await queue.get() == 3
+
+        asyncio.run(run())
+
+    def test_run_stages(self) -> None:
+        """Test forwarding between stages and counting handler failures."""
+        received = []
+
+        def parse(item: int) -> list[int]:
+            if item == 3:
+                raise ValueError("bad item")
+            return [item * 10]
+
+        async def notify(item: int) -> None:
+            received.append(item)
+
+        async def source():
+            for item in range(5):
+                yield item
+
+        pipeline = Pipeline([Stage("parse", parse, maxsize=2), Stage("notify", notify, maxsize=1)])
+        asyncio.run(pipeline.run(source()))
+
+        assert received == [0, 10, 20, 40]
+        parse_stats, notify_stats = pipeline.stats()
+        assert (parse_stats["processed"], parse_stats["failed"]) == (5, 1)
+        assert notify_stats["processed"] == 4
+        assert (notify_stats["depth"], notify_stats["lag"]) == (0, 0.0)
+
+
+class TestDebouncer:
+    """Tests for time-windowed duplicate suppression."""
+
+    @staticmethod
+    def error(error_type: str, timestamp: str = None) -> ParsedError:
+        return ParsedError(error_type=error_type, message="boom", timestamp=timestamp)
+
+    def test_window(self) -> None:
+        """Test that repeats are counted and summarized when the window closes."""
+        now = [0.0]
+        debouncer = Debouncer(window=10, clock=lambda: now[0])
+
+        assert debouncer.add(self.error("KeyError", "10:00:00"))
+        assert not debouncer.add(self.error("KeyError", "10:00:01"))
+        assert not debouncer.add(self.error("KeyError", "10:00:02"))
+        assert debouncer.add(self.error("ValueError"))
+        assert debouncer.expire() == []
+        assert debouncer.time_until_expiry() == 10
+
+        now[0] = 10.0
+        [group] = debouncer.expire()
+        assert (group.count, group.first_seen, group.last_seen) == (2, "10:00:01", "10:00:02")
+        assert len(debouncer) == 0
+        assert debouncer.add(self.error("KeyError"))
+
+    def test_max_keys(self) -> None:
+        """Test that the oldest window is closed early at the key cap."""
+        debouncer = Debouncer(window=60, max_keys=2)
+
+        for error_type in ("A", "A", "B", "C"):
+            debouncer.add(self.error(error_type))
+
+        assert len(debouncer) == 2
+        assert debouncer.evicted == 1
+        [group] = debouncer.expire()
+        assert (group.exemplar.error_type, group.count) == ("A", 1)
+        assert debouncer.add(self.error("A"))
+        assert debouncer.flush() == []
+
+
+class TestCheckpointStore:
+    """Tests for resuming watch from saved positions."""
+
+    TRACEBACK = (
+        "Traceback (most recent call last):\n"
+        '  File "worker.py", line 7, in run\n'
+        "KeyError: 'job'\n"
+    )
+
+    def checkpoint(self, path: Path, store_path: Path) -> None:
+        """Follow a file from the start and save its position and parser state."""
+        parser = PythonLogParser()
+        store = CheckpointStore(store_path)
+        with FileTailer(path, from_start=True, use_inotify=False) as tailer:
+            parser.feed(tailer.read())
+            store.track(tailer, parser.pending_text)
+            assert store.save(force=True)
+            assert not store.save(force=True)
+
+    def resume(self, path: Path, store_path: Path) -> list[str]:
+        """Resume from the checkpoint and return the error types seen until EOF."""
+        parser = PythonLogParser()
+        store = CheckpointStore(store_path)
+        with FileTailer(path, use_inotify=False) as tailer:
+            parser.feed(store.restore(tailer) or "")
+            errors = parser.feed(tailer.read()) + parser.flush()
+        return [error.error_type for error in errors]
+
+    def test_resume_unfinished_block(self, tmp_path: Path) -> None:
+        """Test that a block cut off by the restart is completed, without repeats."""
+        path = tmp_path / "app.log"
+        path.write_text(self.TRACEBACK + self.TRACEBACK[:60], encoding="utf-8")
+        self.checkpoint(path, tmp_path / "checkpoint.json")
+
+        append(path, self.TRACEBACK[60:])
+        assert self.resume(path, tmp_path / "checkpoint.json") == ["KeyError", "KeyError"]
+        assert not (tmp_path / "checkpoint.json.tmp").exists()
+
+    def test_rotation_while_down(self, tmp_path: Path) -> None:
+        """Test that the rotated file is drained before the new one is read."""
+        path = tmp_path / "app.log"
+        path.write_text(self.TRACEBACK, encoding="utf-8")
+        self.checkpoint(path, tmp_path / "checkpoint.json")
+
+        append(path, self.TRACEBACK.replace("KeyError", "ValueError"))
+        path.rename(tmp_path / "app.log.1")
+        path.write_text(self.TRACEBACK.replace("KeyError", "OSError"), encoding="utf-8")
+
+        resumed = self.resume(path, tmp_path / "checkpoint.json")
+        assert resumed == ["KeyError", "ValueError", "OSError"]
+
+    def test_truncated_while_down(self, tmp_path: Path) -> None:
+        """Test that a file rewritten in place is read from the beginning."""
+        path = tmp_path / "app.log"
+        path.write_text(self.TRACEBACK, encoding="utf-8")
+        self.checkpoint(path, tmp_path / "checkpoint.json")
+
+        path.write_text(self.TRACEBACK.replace("KeyError", "OSError") * 2, encoding="utf-8")
+        assert self.resume(path, tmp_path / "checkpoint.json") == ["OSError", "OSError"]
+
+
+class TestTextfileExporter:
+    """Tests for the Prometheus textfile exporter."""
+
+    def test_export(self, tmp_path: Path) -> None:
+        """Test that counters, pattern timings and queue depths are written atomically."""
+        stats = ParseStats()
+        parser = instrument(PythonLogParser(), stats)
+        errors = parser.feed(TestCheckpointStore.TRACEBACK) + parser.flush()
+        stats.add("errors", len(errors))
+        pipeline = Pipeline([Stage("notify", lambda item: None)])
+
+        path = tmp_path / "log_detective.prom"
+        exporter = TextfileExporter(path, stats, pipeline, Debouncer(), interval=60)
+        assert exporter.export()
+        assert not exporter.export()
+
+        text = path.read_text(encoding="utf-8")
+        assert "# TYPE log_detective_errors_total counter\nlog_detective_errors_total 1\n" in text
+        assert 'log_detective_pattern_calls_total{pattern="TRACEBACK_HEADER_PATTERN"}' in text
+        assert 'log_detective_queue_lag_seconds{stage="notify"} 0' in text
+        assert "log_detective_suppressed_total 0" in text
+        assert [p.name for p in tmp_path.iterdir()] == [path.name]
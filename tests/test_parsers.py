@@ -1,11 +1,35 @@
 """Tests for log parsers."""
 
+import bz2
+import gzip
+import io
+import lzma
+import pickle
+from pathlib import Path
+from typing import Iterator
+
 import pytest
 
-from src.parsers.base import ParsedError, StackFrame, ErrorSeverity
+from src.parsers import parallel
+from src.parsers.archive import iter_parse_rotation, iter_rotation_lines, rotation_order
+from src.parsers.base import ErrorSeverity, LazyParsedError, ParsedError, StackFrame
+from src.parsers.detector import (
+    LanguageType,
+    auto_parse,
+    detect_file_language,
+    detect_language,
+    detect_language_with_confidence,
+)
+from src.parsers.fingerprint import ErrorGrouper, normalize_name
 from src.parsers.java import JavaLogParser
+from src.parsers.mapped import iter_parse_mapped
+from src.parsers.mixed import MixedLogParser
+from src.parsers.parallel import iter_parse_parallel, split_file
+from src.parsers.prefilter import LinePrefilter
 from src.parsers.python import PythonLogParser
-from src.parsers.detector import detect_language, LanguageType, auto_parse
+from src.parsers.scanner import scan_java_log_line, scan_python_log_line
+from src.parsers.stats import ParseStats, instrument
+from src.parsers.summary import ErrorSummary, Page
 
 
 class TestJavaLogParser:
@@ -89,6 +113,39 @@ java.lang.IllegalArgumentException: Invalid input
         assert errors[0].error_type == "java.lang.IllegalArgumentException"
         assert errors[0].timestamp == "2024-01-15 10:30:45,123"
 
+    def test_parse_cause_chain(self, parser: JavaLogParser) -> None:
+        """Test linking "Caused by" traces and sharing "... N more" frames."""
+        log = """2024-01-15 10:30:45,123 [main] ERROR com.example.App - Request failed
+org.springframework.dao.DataAccessException: query failed
+\tat com.example.Repo.find(Repo.java:10)
+\tat com.example.Service.load(Service.java:20)
+\tat com.example.App.main(App.java:5)
+Caused by: org.hibernate.exception.SQLGrammarException: bad SQL
+\tat org.hibernate.Query.list(Query.java:99)
+\tat com.example.Repo.find(Repo.java:10)
+\t... 2 more
+Caused by: java.sql.SQLException: syntax error
+\tat org.postgresql.Driver.execute(Driver.java:7)
+\t... 4 more"""
+
+        errors = parser.parse(log)
+
+        assert len(errors) == 1
+        error = errors[0]
+        cause = error.cause
+        root = cause.cause
+        assert error.error_type == "org.springframework.dao.DataAccessException"
+        assert cause.error_type == "org.hibernate.exception.SQLGrammarException"
+        assert root.error_type == "java.sql.SQLException"
+        assert root.cause is None
+        assert len(cause.stack_frames) == 4
+        assert cause.stack_frames[2] is error.stack_frames[1]
+        assert root.stack_frames[1:] == cause.stack_frames
+        assert root.stack_frames[1] is cause.stack_frames[0]
+        assert error.timestamp == "2024-01-15 10:30:45,123"
+        assert error.to_dict()["cause"]["cause"]["message"] == "syntax error"
+        assert [e.to_dict() for e in JavaLogParser(lazy=True).parse(log)] == [error.to_dict()]
+
     def test_can_parse_java_log(self, parser: JavaLogParser) -> None:
         """Test can_parse method for Java logs."""
         java_log = """java.lang.NullPointerException
@@ -194,6 +251,38 @@ ZeroDivisionError: division by zero"""
         # First frame should have code context
         assert errors[0].stack_frames[0].code_context is not None
 
+    def test_parse_chained_tracebacks(self, parser: PythonLogParser) -> None:
+        """Test linking chained tracebacks to the last exception."""
+        log = """Traceback (most recent call last):
+  File "app.py", line 10, in load
+    return cache[key]
+KeyError: 'user'
+
+During handling of the above exception, another exception occurred:
+
+Traceback (most recent call last):
+  File "app.py", line 12, in load
+    return db.fetch(key)
+ConnectionError: db down
+
+The above exception was the direct cause of the following exception:
+
+Traceback (most recent call last):
+  File "app.py", line 30, in main
+    load("user")
+RuntimeError: cannot load user"""
+
+        errors = parser.parse(log)
+
+        assert len(errors) == 1
+        error = errors[0]
+        assert error.error_type == "RuntimeError"
+        assert error.context is None
+        assert error.cause.error_type == "ConnectionError"
+        assert error.cause.context.error_type == "KeyError"
+        assert error.cause.context.line_number == 10
+        assert [e.to_dict() for e in PythonLogParser(lazy=True).parse(log)] == [error.to_dict()]
+
     def test_can_parse_python_log(self, parser: PythonLogParser) -> None:
         """Test can_parse method for Python logs."""
         python_log = """Traceback (most recent call last):
@@ -208,6 +297,501 @@ ValueError: test"""
         assert parser.can_parse(java_log) is False
 
 
+class TestMixedLogParser:
+    """Tests for the mixed-language dispatcher."""
+
+    LOG = """2024-01-15 10:30:45,123 [main] ERROR com.example.App - Request failed
+java.lang.IllegalStateException: Bad state
+\tat com.example.Service.run(Service.java:12)
+2024-01-15 10:30:46,123 - ERROR - worker - Job failed
+Traceback (most recent call last):
+  File "worker.py", line 8, in run
+    job()
+KeyError: 'job'
+Exception in thread "pool-1" java.lang.OutOfMemoryError: Java heap space
+\tat com.example.Cache.fill(Cache.java:40)
+ValueError: bad value
+"""
+
+    def test_parse_interleaved_languages(self) -> None:
+        """Test that each block is parsed by the parser of its language."""
+        errors = MixedLogParser().parse(self.LOG)
+
+        assert [(e.language, e.error_type) for e in errors] == [
+            ("java", "java.lang.IllegalStateException"),
+            ("python", "KeyError"),
+            ("java", "java.lang.OutOfMemoryError"),
+            ("python", "ValueError"),
+        ]
+        assert errors[0].logger_name == "com.example.App"
+        assert errors[0].file_path == "Service.java"
+        assert errors[1].timestamp == "2024-01-15 10:30:46,123"
+        assert errors[1].file_path == "worker.py"
+        assert errors[2].thread_name == "pool-1"
+
+    def test_bare_exception_with_java_frames(self) -> None:
+        """Test that a bare exception name followed by Java frames is Java."""
+        log = """IllegalStateError: broken
+\tat com.example.Service.run(Service.java:12)"""
+
+        errors = MixedLogParser().parse(log)
+
+        assert len(errors) == 1
+        assert errors[0].language == "java"
+        assert errors[0].line_number == 12
+
+    def test_streaming_matches_parse(self) -> None:
+        """Test that segmenting uses every registered parser's boundaries."""
+        parser = MixedLogParser()
+
+        streamed = [e.to_dict() for e in parser.iter_parse(io.StringIO(self.LOG))]
+
+        assert streamed == [e.to_dict() for e in parser.parse(self.LOG)]
+
+
+class TestIterParse:
+    """Tests for the streaming iter_parse API."""
+
+    MIXED_JAVA_LOG = """2024-01-15 10:30:45,123 [main] INFO com.example.App - Starting
+2024-01-15 10:30:46,123 [main] ERROR com.example.App - Request failed
+java.lang.IllegalStateException: Bad state
+\tat com.example.Service.run(Service.java:12)
+\tat com.example.App.main(App.java:5)
+2024-01-15 10:30:47,123 [main] INFO com.example.App - Recovered
+java.lang.NullPointerException
+\tat com.example.Other.call(Other.java:7)
+"""
+
+    MIXED_PYTHON_LOG = """2024-01-15 10:30:45,123 - INFO - app - Starting
+2024-01-15 10:30:46,123 - ERROR - app - Request failed
+Traceback (most recent call last):
+  File "app.py", line 10, in handle
+
+    return data['key']
+KeyError: 'key'
+2024-01-15 10:30:47,123 - INFO - app - Recovered
+ValueError: invalid literal
+"""
+
+    @pytest.mark.parametrize("parser_class, log", [
+        (JavaLogParser, MIXED_JAVA_LOG),
+        (PythonLogParser, MIXED_PYTHON_LOG),
+    ])
+    def test_matches_parse(self, parser_class: type, log: str) -> None:
+        """Test that streaming yields the same errors as parse()."""
+        parser = parser_class()
+
+        expected = [e.to_dict() for e in parser.parse(log)]
+        streamed = [e.to_dict() for e in parser.iter_parse(io.StringIO(log))]
+
+        assert len(expected) == 2
+        assert streamed == expected
+
+    def test_yields_before_input_is_exhausted(self) -> None:
+        """Test that completed blocks are yielded without reading ahead."""
+        consumed: list[str] = []
+
+        def lines() -> Iterator[str]:
+            for line in self.MIXED_JAVA_LOG.splitlines():
+                consumed.append(line)
+                yield line
+
+        first = next(JavaLogParser().iter_parse(lines()))
+
+        assert first.error_type == "java.lang.IllegalStateException"
+        assert len(first.stack_frames) == 2
+        assert len(consumed) == 6
+
+
+class TestFeedParse:
+    """Tests for the push-style feed/flush API."""
+
+    @pytest.mark.parametrize("parser_class, log", [
+        (JavaLogParser, TestIterParse.MIXED_JAVA_LOG),
+        (PythonLogParser, TestIterParse.MIXED_PYTHON_LOG),
+        (MixedLogParser, TestIterParse.MIXED_JAVA_LOG + TestIterParse.MIXED_PYTHON_LOG),
+    ])
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_matches_parse(self, parser_class: type, log: str, chunk_size: int) -> None:
+        """Test that arbitrary chunking yields the same errors as parse()."""
+        expected = [e.to_dict() for e in parser_class().parse(log)]
+
+        parser = parser_class()
+        errors = []
+        for start in range(0, len(log), chunk_size):
+            errors.extend(parser.feed(log[start:start + chunk_size]))
+        errors.extend(parser.flush())
+
+        assert [e.to_dict() for e in errors] == expected
+
+    def test_keeps_unfinished_block(self) -> None:
+        """Test that a traceback is returned only once it is complete."""
+        parser = PythonLogParser()
+
+        assert parser.feed("Traceback (most recent call last):\n") == []
+        assert parser.feed('  File "app.py", line 3, in run\nKeyEr') == []
+        assert parser.feed("ror: 'id'\n") == []
+        errors = parser.feed("2024-01-15 10:30:47,123 - INFO - app - Recovered\n")
+
+        assert len(errors) == 1
+        assert errors[0].error_type == "KeyError"
+        assert errors[0].file_path == "app.py"
+
+    def test_flush_timeout(self) -> None:
+        """Test that a quiet open block is closed only after the timeout."""
+        parser = JavaLogParser()
+        parser.feed("java.lang.IllegalStateException: boom\n\tat com.example.App.run(App.java:1)\n")
+
+        assert parser.flush(timeout=60) == []
+        assert 0 < parser.time_until_flush(60) <= 60
+        flushed = parser.flush(timeout=0)
+        assert [e.error_type for e in flushed] == ["java.lang.IllegalStateException"]
+        assert parser.time_until_flush(60) is None
+        assert parser.flush() == []
+
+
+class TestLinePrefilter:
+    """Tests for the literal pre-filter stage."""
+
+    def test_is_candidate(self) -> None:
+        """Test the literal scan."""
+        prefilter = LinePrefilter(("Exception", "Traceback"))
+
+        assert prefilter.is_candidate("java.lang.IllegalStateException: x")
+        assert prefilter.is_candidate("Traceback (most recent call last):")
+        assert not prefilter.is_candidate("INFO request handled")
+        assert LinePrefilter(()).is_candidate("INFO request handled")
+
+    def test_skips_segments_without_candidates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that only segments with a candidate line reach the regex cascade."""
+        parser = JavaLogParser()
+        parsed: list[list[str]] = []
+        original = parser._parse_lines
+
+        def record(lines: list[str]) -> list[ParsedError]:
+            parsed.append(lines)
+            return original(lines)
+
+        monkeypatch.setattr(parser, "_parse_lines", record)
+        errors = list(parser.iter_parse(TestIterParse.MIXED_JAVA_LOG.splitlines()))
+
+        assert len(errors) == 2
+        assert [len(segment) for segment in parsed] == [4, 3]
+
+    @pytest.mark.parametrize("parser_class, log", [
+        (JavaLogParser, TestIterParse.MIXED_JAVA_LOG),
+        (PythonLogParser, TestIterParse.MIXED_PYTHON_LOG),
+    ])
+    def test_same_results_without_prefilter(self, parser_class: type, log: str) -> None:
+        """Test that disabling the pre-filter does not change the results."""
+        filtered = parser_class().parse(log)
+        unfiltered = parser_class(prefilter=LinePrefilter(())).parse(log)
+
+        assert [e.to_dict() for e in filtered] == [e.to_dict() for e in unfiltered]
+
+
+class TestLazyParse:
+    """Tests for lazy errors with on-demand frame decoding."""
+
+    @pytest.mark.parametrize("parser_class, log", [
+        (JavaLogParser, TestIterParse.MIXED_JAVA_LOG),
+        (PythonLogParser, TestIterParse.MIXED_PYTHON_LOG),
+        (MixedLogParser, TestMixedLogParser.LOG),
+    ])
+    def test_matches_eager_parse(self, parser_class: type, log: str) -> None:
+        """Test that lazy errors decode to the same content as eager ones."""
+        eager = parser_class().parse(log)
+        lazy = parser_class(lazy=True).parse(log)
+
+        # Single-line errors have nothing to defer
+        assert isinstance(lazy[0], LazyParsedError)
+        assert [e.to_dict() for e in lazy] == [e.to_dict() for e in eager]
+
+    def test_decodes_on_first_access(self) -> None:
+        """Test that header fields do not decode the block, but frames do."""
+        error = JavaLogParser(lazy=True).parse(TestIterParse.MIXED_JAVA_LOG)[0]
+
+        assert error.error_type == "java.lang.IllegalStateException"
+        assert error.source[error.span[0]] == "java.lang.IllegalStateException: Bad state"
+        assert error.span[1] - error.span[0] == 3
+        assert error.file_path == "Service.java"
+        assert error.source is not None
+
+        assert len(error.stack_frames) == 2
+        assert error.raw_text.startswith("java.lang.IllegalStateException")
+        assert error.source is None
+
+    def test_pickle(self) -> None:
+        """Test that lazy errors survive pickling, e.g. from worker processes."""
+        error = PythonLogParser(lazy=True).parse(TestIterParse.MIXED_PYTHON_LOG)[0]
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert restored.stack_frames[0].file_path == "app.py"
+        assert restored.raw_text == error.raw_text
+
+    @pytest.mark.parametrize("parser_class, log", [
+        (JavaLogParser, TestIterParse.MIXED_JAVA_LOG),
+        (PythonLogParser, TestIterParse.MIXED_PYTHON_LOG),
+    ])
+    def test_pickle_stays_lazy(self, parser_class: type, log: str) -> None:
+        """Test that pickling sends only the block's lines and decodes neither copy."""
+        errors = parser_class(lazy=True).parse(log)
+        expected = [e.to_dict() for e in parser_class().parse(log)]
+
+        restored = pickle.loads(pickle.dumps(errors))
+
+        lazy = [(e, r) for e, r in zip(errors, restored) if isinstance(e, LazyParsedError)]
+        assert lazy and all(e.source is not None for e, _ in lazy)
+        assert all(r.source == e.source[e.span[0]:e.span[1]] for e, r in lazy)
+        assert [e.to_dict() for e in restored] == expected
+
+
+class TestMappedParse:
+    """Tests for memory-mapped parsing."""
+
+    @pytest.mark.parametrize("parser_class, log", [
+        (JavaLogParser, TestIterParse.MIXED_JAVA_LOG),
+        (PythonLogParser, TestIterParse.MIXED_PYTHON_LOG),
+    ])
+    def test_matches_iter_parse(self, tmp_path: Path, parser_class: type, log: str) -> None:
+        """Test that mapped parsing yields the same errors as iter_parse()."""
+        path = tmp_path / "app.log"
+        path.write_bytes(log.replace("\n", "\r\n").encode("utf-8"))
+        parser = parser_class()
+
+        with path.open(encoding="utf-8") as fp:
+            expected = [e.to_dict() for e in parser.iter_parse(fp)]
+        mapped = [e.to_dict() for e in iter_parse_mapped(path, parser)]
+
+        assert len(expected) == 2
+        assert mapped == expected
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Test that an empty file yields no errors."""
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+
+        assert list(iter_parse_mapped(path, JavaLogParser())) == []
+
+
+class TestParallelParse:
+    """Tests for chunked multi-core parsing."""
+
+    def test_split_points_are_block_boundaries(self, tmp_path: Path) -> None:
+        """Test that ranges never start inside a stack trace."""
+        path = tmp_path / "app.log"
+        path.write_text(TestIterParse.MIXED_JAVA_LOG * 20, encoding="utf-8")
+        parser = JavaLogParser()
+
+        ranges = split_file(path, parser, 16)
+        data = path.read_bytes()
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+        for start, _ in ranges[1:]:
+            line = data[start:data.index(b"\n", start)].decode("utf-8")
+            assert parser._is_block_boundary(line)
+
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    def test_matches_serial_parse(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_mmap: bool
+    ) -> None:
+        """Test that parallel parsing yields the serial result in file order."""
+        monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 64)
+        path = tmp_path / "app.log"
+        path.write_text(TestIterParse.MIXED_PYTHON_LOG * 20, encoding="utf-8")
+        parser = PythonLogParser()
+
+        with path.open(encoding="utf-8") as fp:
+            expected = [e.to_dict() for e in parser.iter_parse(fp)]
+        result = [e.to_dict() for e in iter_parse_parallel(path, parser, 2, use_mmap)]
+
+        assert len(expected) == 40
+        assert result == expected
+
+
+class TestArchiveParse:
+    """Tests for parsing compressed rotation sets."""
+
+    def test_rotation_order(self) -> None:
+        """Test that rotated files are sorted oldest first."""
+        names = ["app.log", "app.log.1", "app.log.10.gz", "app.log.2.bz2", "app.log-20240102.xz"]
+        assert [p.name for p in rotation_order(Path(name) for name in names)] == [
+            "app.log.10.gz", "app.log.2.bz2", "app.log.1", "app.log-20240102.xz", "app.log",
+        ]
+
+    def test_trace_spans_compressed_files(self, tmp_path: Path) -> None:
+        """Test that a trace split by rotation is parsed whole, serially and in parallel."""
+        log = TestIterParse.MIXED_PYTHON_LOG * 3
+        cut = log.index("  File", len(log) // 2)
+        (tmp_path / "app.log.2.gz").write_bytes(gzip.compress(log[:cut].encode()))
+        (tmp_path / "app.log.1.bz2").write_bytes(bz2.compress(log[cut:].encode()))
+        (tmp_path / "app.log").write_bytes(lzma.compress(log.encode()))
+        paths = rotation_order(tmp_path.iterdir())
+
+        with io.StringIO(log + log) as fp:
+            expected = [e.to_dict() for e in PythonLogParser().iter_parse(fp)]
+        assert "".join(iter_rotation_lines(paths)) == log + log
+        assert [e.to_dict() for e in iter_parse_rotation(paths, PythonLogParser(), 1)] == expected
+        assert [e.to_dict() for e in iter_parse_rotation(paths, PythonLogParser(), 2)] == expected
+
+
+class TestLogLineScanner:
+    """Tests for the linear-time log line engine."""
+
+    LINES = [
+        "2024-01-15 10:30:45,123 [main] ERROR com.example.App - Request failed",
+        "2024-01-15T10:30:45.123 [pool-1 thread] WARN app: done",
+        "2024-01-15 10:30:45 [] ERROR app - empty thread",
+        "2024-01-15 10:30:45 [main ERROR app - unclosed thread",
+        "2024-01-15 10:30:45 WARNING app - Java needs a space after WARN",
+        "2024-01-15  10:30:45,12 - CRITICAL -- app.db --- lost connection",
+        "2024-01-15 10:30:45 ERROR - - -",
+        "2024-01-15 10:30:45ERRORx",
+        "\u0662\u0660\u0662\u0664-01-15 10:30:45 INFO x",
+        "2024-01-15 10:30:45 DEBUG",
+        "java.lang.IllegalStateException: not a log line",
+    ]
+
+    def test_scanner_matches_regex(self) -> None:
+        """Test that the scanners return exactly the regex groups."""
+        for line in self.LINES:
+            for pattern, scan in [
+                (JavaLogParser.LOG_LINE_PATTERN, scan_java_log_line),
+                (PythonLogParser.LOG_LINE_PATTERN, scan_python_log_line),
+            ]:
+                match = pattern.match(line)
+                assert scan(line) == (match.groups() if match else None), line
+
+    def test_engines_parse_the_same(self) -> None:
+        """Test that both engines give the same errors."""
+        log = TestIterParse.MIXED_JAVA_LOG + TestIterParse.MIXED_PYTHON_LOG + TestMixedLogParser.LOG
+        for parser_class in (JavaLogParser, PythonLogParser, MixedLogParser):
+            expected = [e.to_dict() for e in parser_class().parse(log)]
+            assert [e.to_dict() for e in parser_class(engine="scanner").parse(log)] == expected
+
+    def test_padded_line(self) -> None:
+        """Test that a line that makes the regex backtrack is handled by the scanner."""
+        padded = "2024-01-15 10:30:45" + " " * 65536 + "IOException"
+        log = f"{padded}\n{TestIterParse.MIXED_JAVA_LOG}"
+        expected = [e.to_dict() for e in JavaLogParser().parse(TestIterParse.MIXED_JAVA_LOG)]
+        assert [e.to_dict() for e in JavaLogParser(engine="scanner").parse(log)] == expected
+
+    def test_unknown_engine(self) -> None:
+        """Test that an unknown engine is rejected."""
+        with pytest.raises(ValueError):
+            PythonLogParser(engine="dfa")
+
+
+class TestParseStats:
+    """Tests for hot-path instrumentation."""
+
+    def test_instrumented_parse_is_unchanged(self) -> None:
+        """Test that instrumentation records patterns and blocks without changing results."""
+        log = TestIterParse.MIXED_PYTHON_LOG * 2
+        expected = [e.to_dict() for e in MixedLogParser().parse(log)]
+
+        stats = ParseStats()
+        parser = instrument(MixedLogParser(), stats)
+        errors = list(stats.count_errors(parser.iter_parse(stats.count_lines(io.StringIO(log)))))
+
+        assert [e.to_dict() for e in errors] == expected
+        assert stats.counters["lines"] == log.count("\n")
+        assert stats.counters["errors"] == len(expected)
+        assert stats.counters["blocks"] > 0
+        assert stats.calls["python.TRACEBACK_HEADER_PATTERN"] > 0
+        # Only the instance is instrumented
+        assert not hasattr(PythonLogParser().TRACEBACK_HEADER_PATTERN, "name")
+
+
+class TestFingerprint:
+    """Tests for error fingerprints and grouping."""
+
+    LOG = """2024-01-15 10:00:00,001 [main] ERROR com.example.App - Request failed
+java.lang.IllegalStateException: User 1 not loaded
+\tat com.example.Svc$$EnhancerBySpringCGLIB$$ab12.load(Svc.java:10)
+\tat com.example.Api.lambda$get$0(Api.java:20)
+2024-01-15 10:00:05,001 [main] ERROR com.example.App - Request failed
+java.lang.NullPointerException: name
+\tat com.example.Repo.find(Repo.java:3)
+2024-01-15 10:00:09,001 [main] ERROR com.example.App - Request failed
+java.lang.IllegalStateException: User 2 not loaded
+\tat com.example.Svc$$EnhancerBySpringCGLIB$$ff99.load(Svc.java:12)
+\tat com.example.Api.lambda$get$3(Api.java:20)
+"""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("com.example.Foo$$Lambda$123/0x0000000800c4b440", "com.example.Foo$$Lambda"),
+        ("UserService$$EnhancerBySpringCGLIB$$a1b2c3d4", "UserService"),
+        ("com.sun.proxy.$Proxy123", "com.sun.proxy.$Proxy"),
+        ("lambda$handle$3", "lambda$handle"),
+        ("Outer$Inner", "Outer$Inner"),
+    ])
+    def test_normalize_name(self, name: str, expected: str) -> None:
+        """Test stripping generated class and method name parts."""
+        assert normalize_name(name) == expected
+
+    def test_stable_across_occurrences(self) -> None:
+        """Test that messages, line numbers and generated names are ignored."""
+        first, other, second = JavaLogParser().parse(self.LOG)
+
+        assert first.fingerprint() == second.fingerprint()
+        assert first.fingerprint() != other.fingerprint()
+        assert (
+            first.fingerprint(include_line_numbers=True)
+            != second.fingerprint(include_line_numbers=True)
+        )
+        assert first.fingerprint(top_frames=0) == ParsedError(
+            error_type=first.error_type, message="", language="java"
+        ).fingerprint()
+
+    def test_grouper(self) -> None:
+        """Test streaming aggregation into one exemplar per fingerprint."""
+        groups = ErrorGrouper().add_all(JavaLogParser().iter_parse(self.LOG.splitlines()))
+        first, other = groups
+
+        assert groups.total == 3
+        assert len(groups) == 2
+        assert first.count == 2
+        assert first.exemplar.message == "User 1 not loaded"
+        assert first.first_seen == "2024-01-15 10:00:00,001"
+        assert first.last_seen == "2024-01-15 10:00:09,001"
+        assert other.count == 1
+        assert first.to_dict()["error"]["error_type"] == "java.lang.IllegalStateException"
+
+
+class TestErrorSummary:
+    """Tests for error counts with a bounded page."""
+
+    def test_counts_everything_keeps_page(self) -> None:
+        """Test that every error is counted but only the window is kept."""
+        errors = JavaLogParser().parse(TestFingerprint.LOG * 3)
+        summary = ErrorSummary(offset=4, limit=3).add_all(iter(errors))
+
+        assert summary.total == 9
+        assert summary.items == errors[4:7]
+        assert summary.start == 5
+        assert summary.remaining == 2
+        assert summary.by_type.most_common(1) == [("java.lang.IllegalStateException", 6)]
+        assert summary.by_severity == {"error": 9}
+
+    def test_page_bounds(self) -> None:
+        """Test pages without a limit and past the end of the stream."""
+        page: Page[int] = Page()
+        for i in range(5):
+            page.add(i)
+        assert list(page) == [0, 1, 2, 3, 4]
+        assert page.remaining == 0
+
+        page = Page(offset=10, limit=2)
+        for i in range(5):
+            page.add(i)
+        assert len(page) == 0
+        assert page.remaining == 0
+
+
 class TestLanguageDetector:
     """Tests for language detection."""
 
@@ -237,6 +821,38 @@ ValueError: test"""
         assert detect_language("") == LanguageType.UNKNOWN
         assert detect_language("   ") == LanguageType.UNKNOWN
 
+    def test_confidence(self) -> None:
+        """Test that detection reports a confidence value."""
+        log = """Traceback (most recent call last):
+  File "test.py", line 10, in test
+ValueError: test"""
+
+        language, confidence = detect_language_with_confidence(log)
+
+        assert language == LanguageType.PYTHON
+        assert 0.5 < confidence <= 1.0
+        assert detect_language_with_confidence("plain text") == (LanguageType.UNKNOWN, 0.0)
+
+    def test_samples_middle_of_large_input(self) -> None:
+        """Test that large inputs are sampled from the head, middle and tail."""
+        noise = "INFO request handled\n" * 500
+        log = noise + "java.lang.NullPointerException: test\n" \
+            "\tat com.example.Test.test(Test.java:10)\n" + noise
+
+        assert detect_language(log, sample_size=1024) == LanguageType.JAVA
+        assert detect_language(noise * 3, sample_size=1024) == LanguageType.UNKNOWN
+
+    def test_detect_file_language(self, tmp_path: Path) -> None:
+        """Test detecting the language of a large file from samples."""
+        path = tmp_path / "app.log"
+        noise = "INFO request handled\n" * 500
+        path.write_text(noise + TestIterParse.MIXED_PYTHON_LOG + noise, encoding="utf-8")
+
+        language, confidence = detect_file_language(path, sample_size=1024)
+
+        assert language == LanguageType.PYTHON
+        assert confidence > 0.5
+
     def test_auto_parse_java(self) -> None:
         """Test auto_parse with Java log."""
         log = """java.lang.NullPointerException: test
@@ -304,6 +920,21 @@ class TestParsedError:
         assert error.file_path == "first.py"
         assert error.line_number == 1
 
+    def test_compact_representation(self) -> None:
+        """Test that errors and frames are slotted and share frame strings."""
+        log = """java.lang.IllegalStateException: first
+\tat com.example.Service.run(Service.java:12)
+java.lang.IllegalStateException: second
+\tat com.example.Service.run(Service.java:12)"""
+
+        first, second = JavaLogParser().parse(log)
+
+        assert not hasattr(first, "__dict__")
+        assert not hasattr(first.stack_frames[0], "__dict__")
+        assert first.error_type is second.error_type
+        assert first.stack_frames[0].class_name is second.stack_frames[0].class_name
+        assert first.stack_frames[0].file_path is second.stack_frames[0].file_path
+
     def test_empty_stack_frames(self) -> None:
         """Test error with no stack frames."""
         error = ParsedError(
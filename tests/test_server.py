@@ -0,0 +1,249 @@
+"""Tests for the daemon and its client."""
+
+import tempfile
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import main
+from src.commands.parse import DAEMON_ENV
+from src.parsers.base import ParsedError
+from src.parsers.java import JavaLogParser
+from src.parsers.mixed import MixedLogParser
+from src.server import client as client_module
+from src.server.client import SOCKET_ENV, DaemonClient, DaemonError, connect
+from src.server.daemon import INVALID_PARAMS, METHOD_NOT_FOUND, DaemonServer, InvalidParamsError
+
+LOG = """2024-01-15 10:30:45,123 [main] ERROR com.example.App - Request failed
+org.springframework.dao.DataAccessException: query failed
+\tat com.example.Repo.find(Repo.java:10)
+\tat com.example.App.main(App.java:5)
+Caused by: java.sql.SQLException: syntax error
+\tat org.postgresql.Driver.execute(Driver.java:7)
+\t... 2 more
+2024-01-15 10:30:46,123 - ERROR - worker - Job failed
+Traceback (most recent call last):
+  File "worker.py", line 3, in run
+    data["id"]
+KeyError: 'id'
+"""
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Socket path short enough for AF_UNIX, which pytest's tmp_path may not be."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory) / "daemon.sock"
+
+
+@pytest.fixture
+def server(socket_path: Path) -> Iterator[DaemonServer]:
+    """Daemon serving on a background thread."""
+    server = DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestDaemon:
+    """Tests for the daemon's JSON-RPC API."""
+
+    def test_parse_matches_local(self, server: DaemonServer, tmp_path: Path) -> None:
+        """Test that text and files parse as they do in this process."""
+        expected = [error.to_dict() for error in MixedLogParser().parse(LOG)]
+        log_file = tmp_path / "app.log"
+        log_file.write_text(LOG)
+
+        with DaemonClient(server.path) as client:
+            from_text = client.call("parse", text=LOG, language="mixed")
+            from_file = client.call(
+                "parse", paths=[str(log_file)], language="mixed", engine="scanner"
+            )
+
+        assert from_text == {"language": "mixed", "errors": expected}
+        assert from_file == from_text
+
+    def test_stream(self, server: DaemonServer) -> None:
+        """Test that a streamed parse sends the errors of the page after the response."""
+        with DaemonClient(server.path) as client:
+            expected = client.call("parse", text=LOG, language="mixed")
+            result, items = client.stream("parse", text=LOG, language="mixed")
+            assert result == {"language": "mixed"}
+            assert list(items) == expected["errors"]
+
+            _, items = client.stream("parse", text=LOG, language="mixed", offset=1, limit=5)
+            assert list(items) == expected["errors"][1:]
+            assert client.call("status")["requests"] == 4
+
+    def test_batch(self, server: DaemonServer) -> None:
+        """Test that a batch answers every call in order, failures included."""
+        with DaemonClient(server.path) as client:
+            results = client.batch([
+                ("parse", {"text": LOG, "language": "java"}),
+                ("parse", {"text": LOG, "language": "go"}),
+                ("parse", {"txt": LOG}),
+                ("parse", {"text": LOG, "limit": -1}),
+                ("parse", {"text": LOG, "stream": True}),
+                ("analyze", {}),
+                ("status", {}),
+            ])
+
+        assert results[0]["language"] == "java"
+        assert [error.code for error in results[1:6]] == [
+            INVALID_PARAMS, INVALID_PARAMS, INVALID_PARAMS, INVALID_PARAMS, METHOD_NOT_FOUND,
+        ]
+        assert results[6]["requests"] == 4
+
+    def test_call_raises_error(self, server: DaemonServer, tmp_path: Path) -> None:
+        """Test that a failed call raises the daemon's error."""
+        with DaemonClient(server.path) as client:
+            with pytest.raises(DaemonError, match="No such file"):
+                client.call("parse", paths=[str(tmp_path / "missing.log")])
+
+    def test_socket_lifecycle(self, socket_path: Path) -> None:
+        """Test that one daemon owns the socket and removes it when closed."""
+        assert connect(socket_path) is None
+        server = DaemonServer(socket_path)
+        try:
+            assert (socket_path.stat().st_mode & 0o777) == 0o600
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            with pytest.raises(OSError, match="already listening"):
+                DaemonServer(socket_path)
+            server.shutdown()
+        finally:
+            server.server_close()
+        assert not socket_path.exists()
+
+    def test_refuses_other_user(
+        self, server: DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that clients refuse a socket or a daemon that is not their user's."""
+        uid = client_module.os.getuid()
+        monkeypatch.setattr(client_module.os, "getuid", lambda: uid + 1)
+        with pytest.raises(PermissionError, match="belongs to another user"):
+            connect(server.path)
+
+        if hasattr(client_module.socket, "SO_PEERCRED"):
+            monkeypatch.setattr(client_module, "_check_owner", lambda path: None)
+            with pytest.raises(PermissionError, match="runs as another user"):
+                connect(server.path)
+        assert server.service.requests == 0
+
+    def test_parsed_error_round_trip(self) -> None:
+        """Test that errors rebuilt from their dicts, causes included, are unchanged."""
+        errors = JavaLogParser().parse(LOG)
+        rebuilt = [ParsedError.from_dict(error.to_dict()) for error in errors]
+
+        assert rebuilt[0].cause.cause is None
+        assert [error.to_dict() for error in rebuilt] == [error.to_dict() for error in errors]
+
+
+class TestParseClient:
+    """Tests for parse sending its input to the daemon."""
+
+    @pytest.mark.parametrize("output", ["json", "ndjson", "table"])
+    def test_same_output(
+        self, server: DaemonServer, monkeypatch: pytest.MonkeyPatch, output: str
+    ) -> None:
+        """Test that parse prints the same with and without the daemon."""
+        monkeypatch.setenv(SOCKET_ENV, str(server.path))
+        runner = CliRunner()
+        local = runner.invoke(main, ["parse", "--text", LOG, "-o", output, "--no-daemon"])
+        remote = runner.invoke(main, ["parse", "--text", LOG, "-o", output, "--daemon"])
+
+        assert local.exit_code == remote.exit_code == 0
+        assert remote.output == local.output
+        assert server.service.requests == 1
+
+    def test_page_on_daemon(self, server: DaemonServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that streamed formats are paged once, by the daemon."""
+        monkeypatch.setenv(SOCKET_ENV, str(server.path))
+        args = ["parse", "--text", LOG, "-o", "ndjson", "--offset", "1", "--limit", "1"]
+        local = CliRunner().invoke(main, [*args, "--no-daemon"])
+        remote = CliRunner().invoke(main, [*args, "--daemon"])
+
+        assert remote.output == local.output
+        assert remote.output.count("\n") == 1
+
+    def test_daemon_opt_in(self, server: DaemonServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that parse only sends input to a running daemon when asked to."""
+        monkeypatch.setenv(SOCKET_ENV, str(server.path))
+        monkeypatch.delenv(DAEMON_ENV, raising=False)
+        runner = CliRunner()
+
+        assert runner.invoke(main, ["parse", "--text", LOG, "-o", "json"]).exit_code == 0
+        assert server.service.requests == 0
+
+        monkeypatch.setenv(DAEMON_ENV, "auto")
+        assert runner.invoke(main, ["parse", "--text", LOG, "-o", "json"]).exit_code == 0
+        assert server.service.requests == 1
+
+    def test_other_user_socket(
+        self, server: DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that another user's socket fails --daemon and is skipped in auto mode."""
+        uid = client_module.os.getuid()
+        monkeypatch.setattr(client_module.os, "getuid", lambda: uid + 1)
+        monkeypatch.setenv(SOCKET_ENV, str(server.path))
+        monkeypatch.setenv(DAEMON_ENV, "auto")
+        runner = CliRunner()
+
+        required = runner.invoke(main, ["parse", "--text", LOG, "-o", "json", "--daemon"])
+        assert required.exit_code == 1
+        assert "belongs to another user" in required.output
+
+        fallback = runner.invoke(main, ["parse", "--text", LOG, "-o", "json"])
+        assert fallback.exit_code == 0
+        assert '"error_count": 2' in fallback.output
+        assert server.service.requests == 0
+
+    def test_daemon_required(self, socket_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that --daemon fails without a daemon, and parsing falls back without it."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+        monkeypatch.setenv(DAEMON_ENV, "auto")
+        runner = CliRunner()
+
+        required = runner.invoke(main, ["parse", "--text", LOG, "-o", "json", "--daemon"])
+        assert required.exit_code == 1
+        assert "No daemon is listening" in required.output
+
+        fallback = runner.invoke(main, ["parse", "--text", LOG, "-o", "json"])
+        assert fallback.exit_code == 0
+        assert '"error_count": 2' in fallback.output
+
+    def test_daemon_error_falls_back(
+        self, server: DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an error from the daemon only fails parse if --daemon is given."""
+        def refuse(**params: object) -> None:
+            raise InvalidParamsError("refused")
+
+        monkeypatch.setitem(server.service.methods, "parse", refuse)
+        monkeypatch.setenv(SOCKET_ENV, str(server.path))
+        monkeypatch.setenv(DAEMON_ENV, "auto")
+        runner = CliRunner()
+
+        fallback = runner.invoke(main, ["parse", "--text", LOG, "-o", "json"])
+        assert fallback.exit_code == 0
+        assert '"error_count": 2' in fallback.output
+
+        required = runner.invoke(main, ["parse", "--text", LOG, "-o", "json", "--daemon"])
+        assert required.exit_code == 1
+        assert "refused" in required.output
+
+    def test_stdin_parses_locally(
+        self, server: DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that piped input is parsed in the process, not buffered for the daemon."""
+        monkeypatch.setenv(SOCKET_ENV, str(server.path))
+        result = CliRunner().invoke(main, ["parse", "-o", "json", "--daemon"], input=LOG)
+
+        assert result.exit_code == 0
+        assert '"error_count": 2' in result.output
+        assert server.service.requests == 0